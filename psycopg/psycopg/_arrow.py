@@ -0,0 +1,92 @@
+"""
+Build Apache Arrow record batches from query results.
+"""
+
+# Copyright (C) 2026 The Psycopg Team
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+from collections.abc import Sequence
+
+from . import _oids
+from . import errors as e
+from . import pq
+from .abc import Buffer
+from ._columnar import load_column, load_columns
+
+if TYPE_CHECKING:
+    from .abc import Transformer
+    from .pq.abc import PGresult
+
+try:
+    import pyarrow as pa
+
+except ImportError:
+    raise ImportError(
+        "loading data as Arrow batches requires the package 'pyarrow'"
+        " to be installed"
+    )
+
+import numpy as np
+
+
+def result_batch(
+    tx: Transformer, res: PGresult, row0: int, row1: int, names: Sequence[str]
+) -> pa.RecordBatch:
+    """
+    Return the rows between `!row0` and `!row1` of a result as a record batch.
+    """
+    columns = load_columns(tx, res, row0, row1)
+    types = [res.ftype(i) for i in range(res.nfields)]
+    return pa.RecordBatch.from_arrays(
+        [_to_arrow(col, oid) for col, oid in zip(columns, types)], names=list(names)
+    )
+
+
+class BatchBuilder:
+    """
+    Accumulate rows of fields in columns and convert them into record batches.
+    """
+
+    def __init__(self, tx: Transformer, types: Sequence[int], format: pq.Format):
+        self._tx = tx
+        self._types = list(types)
+        self._format = format
+        self._names = [f"column_{i + 1}" for i in range(len(types))]
+        self._columns: list[list[Buffer | None]] = [[] for _ in types]
+        self.nrows = 0
+
+    def append(self, fields: Sequence[Buffer | None]) -> None:
+        if len(fields) != len(self._columns):
+            raise e.DataError(
+                f"expected {len(self._columns)} values in row, got {len(fields)}"
+            )
+        for col, field in zip(self._columns, fields):
+            col.append(field)
+        self.nrows += 1
+
+    def batch(self) -> pa.RecordBatch:
+        """Return the rows accumulated as a record batch and reset the builder."""
+        arrays = []
+        for i, (values, oid) in enumerate(zip(self._columns, self._types)):
+            col = load_column(self._tx, values, oid, self._format)
+            arrays.append(_to_arrow(col, oid))
+            self._columns[i] = []
+
+        self.nrows = 0
+        return pa.RecordBatch.from_arrays(arrays, names=self._names)
+
+
+def _to_arrow(column: np.ma.MaskedArray, oid: int) -> pa.Array:
+    data = column.data
+    mask = np.ma.getmaskarray(column)
+    type: Any = None
+    if data.dtype.kind == "M":
+        # Infinity dates and timestamps are returned as NaT: Arrow has no
+        # representation for them either, so turn them into nulls.
+        mask = mask | np.isnat(data)
+        if oid == _oids.TIMESTAMPTZ_OID:
+            type = pa.timestamp("us", tz="UTC")
+
+    return pa.array(data, mask=mask, type=type)
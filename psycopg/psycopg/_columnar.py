@@ -0,0 +1,234 @@
+"""
+Convert data between PostgreSQL and NumPy arrays column by column.
+"""
+
+# Copyright (C) 2026 The Psycopg Team
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+from collections.abc import Iterator, Sequence
+
+from . import _oids
+from . import errors as e
+from . import pq
+from .abc import Buffer
+
+if TYPE_CHECKING:
+    from .abc import Transformer
+    from .pq.abc import PGresult
+
+try:
+    import numpy as np
+
+except ImportError:
+    raise ImportError(
+        "converting columns to arrays requires the package 'numpy' to be installed"
+    )
+
+BINARY = pq.Format.BINARY
+
+# Microseconds and days between the Unix epoch and the PostgreSQL epoch.
+_PG_EPOCH_US = 946_684_800_000_000
+_PG_EPOCH_DAYS = 10_957
+
+_NAT = np.iinfo(np.int64).min
+
+# Mapping from the oid of a type to the big-endian dtype of its binary
+# representation and the dtype of the array returned.
+_BINARY_DTYPES: dict[int, tuple[str, str]] = {
+    _oids.BOOL_OID: ("?", "?"),
+    _oids.INT2_OID: (">i2", "=i2"),
+    _oids.INT4_OID: (">i4", "=i4"),
+    _oids.INT8_OID: (">i8", "=i8"),
+    _oids.OID_OID: (">u4", "=u4"),
+    _oids.FLOAT4_OID: (">f4", "=f4"),
+    _oids.FLOAT8_OID: (">f8", "=f8"),
+    _oids.DATE_OID: (">i4", "datetime64[D]"),
+    _oids.TIMESTAMP_OID: (">i8", "datetime64[us]"),
+    _oids.TIMESTAMPTZ_OID: (">i8", "datetime64[us]"),
+}
+
+_DATETIME_OIDS = (_oids.DATE_OID, _oids.TIMESTAMP_OID, _oids.TIMESTAMPTZ_OID)
+
+
+def load_columns(
+    tx: Transformer, res: PGresult, row0: int, row1: int
+) -> list[np.ma.MaskedArray]:
+    """
+    Load the rows between `!row0` and `!row1` of a result as masked arrays.
+
+    Return one array per column, with the NULL values masked.
+    """
+    if not (0 <= row0 <= row1 <= res.ntuples):
+        raise e.InterfaceError(f"rows must be included between 0 and {res.ntuples}")
+
+    rv = []
+    rows = range(row0, row1)
+    for col in range(res.nfields):
+        # The PGresult only gives access to a value at time: the raw values
+        # are read one by one, then the conversion happens in bulk.
+        values = [res.get_value(row, col) for row in rows]
+        fmt = pq.Format(res.fformat(col))
+        rv.append(load_column(tx, values, res.ftype(col), fmt))
+    return rv
+
+
+def load_column(
+    tx: Transformer, values: Sequence[Buffer | None], oid: int, format: pq.Format
+) -> np.ma.MaskedArray:
+    """
+    Convert a sequence of values of the same column into a masked array.
+
+    Columns of types with a fixed-size binary representation are decoded in
+    bulk; other columns are loaded using the loaders configured in `!tx` into
+    an array of objects.
+    """
+    mask = np.fromiter((v is None for v in values), dtype=bool, count=len(values))
+
+    if format != BINARY or not (dtypes := _BINARY_DTYPES.get(oid)):
+        load = tx.get_loader(oid, format).load
+        data = np.empty(len(values), dtype=object)
+        data[:] = [load(v) if v is not None else None for v in values]
+        return np.ma.MaskedArray(data, mask=mask)
+
+    wiretype, outtype = dtypes
+    itemsize = np.dtype(wiretype).itemsize
+    filler = bytes(itemsize)
+    buf = b"".join([v if v is not None else filler for v in values])
+    if len(buf) != itemsize * len(values):
+        raise e.DataError(f"unexpected binary data size for values of oid {oid}")
+
+    # astype() returns a new array, in native byte order, owning its memory.
+    raw = np.frombuffer(buf, dtype=wiretype)
+    if oid == _oids.DATE_OID:
+        data = _to_datetime64(raw, _PG_EPOCH_DAYS, outtype)
+    elif oid == _oids.TIMESTAMP_OID or oid == _oids.TIMESTAMPTZ_OID:
+        data = _to_datetime64(raw, _PG_EPOCH_US, outtype)
+    else:
+        data = raw.astype(outtype)
+
+    return np.ma.MaskedArray(data, mask=mask)
+
+
+def _to_datetime64(raw: Any, offset: int, dtype: str) -> Any:
+    # PostgreSQL infinity and -infinity are the extremes of the wire type;
+    # they have no numpy representation so they are converted to NaT.
+    info = np.iinfo(raw.dtype)
+    inf = (raw == info.max) | (raw == info.min)
+    values = raw.astype(np.int64)
+    values += offset
+    if inf.any():
+        values[inf] = _NAT
+    return values.view(dtype)
+
+
+def format_columns_binary(
+    columns: Sequence[Any], types: Sequence[int], chunk_size: int
+) -> Iterator[bytes]:
+    """
+    Convert columns of values into binary copy data, in chunks of rows.
+
+    Every column is an array, or a masked array to represent NULL values. Each
+    chunk returned is approximately `!chunk_size` bytes long.
+    """
+    if len(columns) != len(types):
+        raise e.DataError(f"expected {len(types)} columns, got {len(columns)}")
+
+    datas = []
+    masks = []
+    for col, oid in zip(columns, types):
+        data, mask = _dump_column(col, oid)
+        datas.append(data)
+        masks.append(mask)
+
+    if len({len(data) for data in datas}) > 1:
+        raise e.DataError("all the columns must have the same length")
+
+    # Every row is formatted as the number of fields, followed by length and
+    # data for each field. Null fields have length -1 and no data.
+    fields: list[tuple[str, str]] = [("n", ">i2")]
+    offsets = []
+    for i, data in enumerate(datas):
+        fields.append((f"l{i}", ">i4"))
+        fields.append((f"v{i}", data.dtype.str))
+        offsets.append(np.dtype(fields).itemsize - data.itemsize)
+    rowtype = np.dtype(fields)
+
+    nrows = len(datas[0]) if datas else 0
+    step = max(1, chunk_size // rowtype.itemsize)
+    for row0 in range(0, nrows, step):
+        row1 = min(row0 + step, nrows)
+        rows = np.empty(row1 - row0, dtype=rowtype)
+        rows["n"] = len(datas)
+        keep = None
+        for i, (data, mask) in enumerate(zip(datas, masks)):
+            rows[f"v{i}"] = data[row0:row1]
+            if mask is None or not (chunk_mask := mask[row0:row1]).any():
+                rows[f"l{i}"] = data.itemsize
+                continue
+
+            rows[f"l{i}"] = np.where(chunk_mask, -1, data.itemsize)
+            if keep is None:
+                keep = np.ones((row1 - row0, rowtype.itemsize), dtype=bool)
+            keep[chunk_mask, offsets[i] : offsets[i] + data.itemsize] = False
+
+        raw = rows.view(np.uint8).reshape(row1 - row0, rowtype.itemsize)
+        yield (raw[keep] if keep is not None else raw).tobytes()
+
+
+def _dump_column(column: Any, oid: int) -> tuple[Any, Any]:
+    """
+    Return the big-endian binary representation of a column and its nulls mask.
+    """
+    if not (dtypes := _BINARY_DTYPES.get(oid)):
+        raise e.NotSupportedError(f"writing columns of oid {oid} is not supported")
+
+    wiretype = dtypes[0]
+    mask = np.ma.getmask(column)
+    data = np.asarray(np.ma.getdata(column))
+    if data.ndim != 1:
+        raise e.DataError(f"columns must be one-dimensional, got {data.ndim} dims")
+
+    kind = data.dtype.kind
+    if oid in _DATETIME_OIDS:
+        data, mask = _from_datetime64(data, mask, oid)
+    elif oid == _oids.BOOL_OID:
+        if kind != "b":
+            raise e.DataError(f"cannot dump {data.dtype} array as bool")
+    elif oid == _oids.FLOAT4_OID or oid == _oids.FLOAT8_OID:
+        if kind not in "biuf":
+            raise e.DataError(f"cannot dump {data.dtype} array as float")
+    else:
+        if kind not in "biu":
+            raise e.DataError(f"cannot dump {data.dtype} array as integer")
+        _check_range(data, mask, np.iinfo(wiretype))
+
+    if mask is np.ma.nomask:
+        mask = None
+    return data.astype(wiretype), mask
+
+
+def _from_datetime64(data: Any, mask: Any, oid: int) -> tuple[Any, Any]:
+    if data.dtype.kind != "M":
+        raise e.DataError(f"cannot dump {data.dtype} array as date or timestamp")
+
+    if oid == _oids.DATE_OID:
+        values = data.astype("datetime64[D]").view(np.int64) - _PG_EPOCH_DAYS
+    else:
+        values = data.astype("datetime64[us]").view(np.int64) - _PG_EPOCH_US
+
+    # NaT values are considered nulls.
+    if (nat := np.isnat(data)).any():
+        mask = nat | mask
+
+    if oid == _oids.DATE_OID:
+        _check_range(values, mask, np.iinfo(np.int32))
+    return values, mask
+
+
+def _check_range(data: Any, mask: Any, info: Any) -> None:
+    if mask is not np.ma.nomask:
+        data = data[~mask]
+    if data.size and (data.min() < info.min or data.max() > info.max):
+        raise e.DataError(f"values out of range for type {info.dtype}")
@@ -13,7 +13,7 @@ from weakref import ReferenceType, ref
 from warnings import warn
 from functools import partial
 from collections import deque
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
 
 from . import errors as e
 from . import generators, postgres, pq
@@ -25,7 +25,7 @@ from .adapt import AdaptersMap
 from ._enums import IsolationLevel
 from ._compat import LiteralString, Self, TypeVar
 from .pq.misc import connection_summary
-from ._preparing import PrepareManager
+from ._preparing import EvictionPolicy, PreparedStatement, PrepareManager
 from ._capabilities import capabilities
 from ._pipeline_base import BasePipeline
 from ._connection_info import ConnectionInfo
@@ -111,6 +111,7 @@ class BaseConnection(Generic[Row]):
 
         self._closed = False  # closed by an explicit close()
         self._prepared: PrepareManager = PrepareManager()
+        self._load_threads = 1
         self._tpc: tuple[Xid, bool] | None = None  # xid, prepared
 
         # Gather notifies when the notifies() generator is not running.
@@ -131,6 +132,8 @@ class BaseConnection(Generic[Row]):
         self._created_at: float
         # Time after which the connection should be closed
         self._expire_at: float
+        # Affinity key of the last pool request served by the connection
+        self._affinity: Hashable | None
 
         self._isolation_level: IsolationLevel | None = None
         self._read_only: bool | None = None
@@ -423,6 +426,57 @@ class BaseConnection(Generic[Row]):
             value = sys.maxsize
         self._prepared.prepared_max = value
 
+    @property
+    def prepare_policy(self) -> EvictionPolicy:
+        """
+        The policy choosing what statement to deallocate when `prepared_max`
+        statements are prepared and a new one needs preparing.
+
+        Default value: `~psycopg.prepare.LRUPolicy`, evicting the least recently
+        used statement.
+        """
+        return self._prepared.policy
+
+    @prepare_policy.setter
+    def prepare_policy(self, value: EvictionPolicy) -> None:
+        self._prepared.policy = value
+
+    def get_prepared_stats(self) -> dict[str, int]:
+        """
+        Return the counters of the prepared statements activity on the connection.
+
+        See :ref:`prepared-stats` for the metrics returned.
+        """
+        return self._prepared.get_stats()
+
+    def get_prepared_statements(self) -> list[PreparedStatement]:
+        """
+        Return the statements currently prepared on the connection.
+
+        The statements are returned from the least to the most recently used.
+        """
+        return self._prepared.get_statements()
+
+    @property
+    def load_threads(self) -> int:
+        """
+        Maximum number of threads used to convert large query results.
+
+        If greater than 1, `~Cursor.fetchall()` and `~Cursor.fetchmany()` may
+        convert the rows of large results concurrently on up to `!load_threads`
+        threads. This only happens on the free-threaded Python build, when the
+        GIL is disabled.
+
+        Default value: 1
+        """
+        return self._load_threads
+
+    @load_threads.setter
+    def load_threads(self, value: int) -> None:
+        if value < 1:
+            raise ValueError(f"load_threads must be at least 1, got {value}")
+        self._load_threads = value
+
     # Generators to perform high-level operations on the connection
     #
     # These operations are expressed in terms of non-blocking generators
@@ -9,19 +9,27 @@ Objects to support the COPY protocol (sync version).
 
 from __future__ import annotations
 
+import os
+import mmap
 from abc import ABC, abstractmethod
+from time import monotonic
 from types import TracebackType
 from typing import TYPE_CHECKING, Any
-from collections.abc import Iterator, Sequence
+from itertools import islice
+from collections.abc import Iterable, Iterator, Sequence
 
 from . import errors as e
 from . import pq
 from ._compat import Self
 from ._acompat import Queue, Worker, gather, spawn
-from ._copy_base import MAX_BUFFER_SIZE, PREFER_FLUSH, QUEUE_SIZE, BaseCopy
+from ._copy_base import ARROW_BATCH_SIZE, BUFFER_SIZE, FILE_BUFFER_SIZE
+from ._copy_base import MAX_BUFFER_SIZE, MMAP_WINDOW_SIZE, PREFER_FLUSH, QUEUE_SIZE
+from ._copy_base import WRITE_ROWS_BATCH_SIZE, BaseCopy
 from .generators import copy_end, copy_to
 
 if TYPE_CHECKING:
+    import pyarrow as pa
+
     from .abc import Buffer
     from .cursor import Cursor
     from .connection import Connection  # noqa: F401
@@ -63,7 +71,6 @@ class Copy(BaseCopy["Connection[Any]"]):
             writer = LibpqWriter(cursor)
 
         self.writer = writer
-        self._write = writer.write
 
     def __enter__(self) -> Self:
         self._enter()
@@ -113,6 +120,38 @@ class Copy(BaseCopy["Connection[Any]"]):
         """
         return self.connection.wait(self._read_row_gen())
 
+    def read_arrow_batches(
+        self, size: int = ARROW_BATCH_SIZE
+    ) -> Iterator[pa.RecordBatch]:
+        """
+        Iterate on the result of a :sql:`COPY TO` operation by Arrow batches.
+
+        Yield `pyarrow.RecordBatch` objects of at most `!size` records. The
+        types of the columns must be specified using `set_types()`.
+        """
+        builder = self._batch_builder()
+        while (fields := self.connection.wait(self._read_fields_gen())) is not None:
+            builder.append(fields)
+            if builder.nrows >= size:
+                yield builder.batch()
+
+        if builder.nrows:
+            yield builder.batch()
+
+    def read_to_file(self, path: str | os.PathLike[str]) -> int:
+        """
+        Write the data of a :sql:`COPY TO` operation to a file.
+
+        The file is created, or truncated if it exists. Return the number of
+        bytes written.
+        """
+        size = 0
+        with open(path, "wb", buffering=FILE_BUFFER_SIZE) as f:
+            while data := self.read():
+                size += f.write(data)
+
+        return size
+
     def write(self, buffer: Buffer | str) -> None:
         """
         Write a block of data to a table after a :sql:`COPY FROM` operation.
@@ -125,9 +164,63 @@ class Copy(BaseCopy["Connection[Any]"]):
 
     def write_row(self, row: Sequence[Any]) -> None:
         """Write a record to a table after a :sql:`COPY FROM` operation."""
+        self._rows_written += 1
         if data := self.formatter.write_row(row):
             self._write(data)
 
+    def write_rows(
+        self, rows: Iterable[Sequence[Any]], batch_size: int = WRITE_ROWS_BATCH_SIZE
+    ) -> None:
+        """
+        Write records to a table after a :sql:`COPY FROM` operation.
+
+        The records are formatted in batches of *batch_size*.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        it = iter(rows)
+        while batch := list(islice(it, batch_size)):
+            buffers = self._format_rows(batch)
+            for data in buffers:
+                self._write(data)
+
+    def write_columns(
+        self, columns: Sequence[Any], types: Sequence[int | str] | None = None
+    ) -> None:
+        """
+        Write columns of data to a table after a binary :sql:`COPY FROM` operation.
+        """
+        for data in self.formatter.write_columns(columns, self._column_types(types)):
+            self._write(data)
+        if columns:
+            self._rows_written += len(columns[0])
+
+    def write_from_file(self, path: str | os.PathLike[str]) -> int:
+        """
+        Write the content of a file to a table after a :sql:`COPY FROM` operation.
+
+        The file must contain data in the format of the operation, for
+        instance written by `read_to_file()`. The file is mapped in memory,
+        and sent to the database without being copied into Python objects.
+        Return the number of bytes written.
+        """
+        # The data of a queued writer is sent later: it must be copied
+        # before its memory is unmapped.
+        copy_data = isinstance(self.writer, QueuedLibpqWriter)
+
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            for offset in range(0, size, MMAP_WINDOW_SIZE):
+                length = min(MMAP_WINDOW_SIZE, size - offset)
+                with mmap.mmap(
+                    f.fileno(), length, offset=offset, access=mmap.ACCESS_READ
+                ) as mm:
+                    for i in range(0, length, MAX_BUFFER_SIZE):
+                        with memoryview(mm)[i : i + MAX_BUFFER_SIZE] as data:
+                            self.write(data.tobytes() if copy_data else data)
+
+        return size
+
     def finish(self, exc: BaseException | None) -> None:
         """Terminate the copy operation and free the resources allocated.
 
@@ -141,6 +234,7 @@ class Copy(BaseCopy["Connection[Any]"]):
                     self._write(data)
             self.writer.finish(exc)
             self._finished = True
+            self._finished_at = monotonic()
         else:
             if not exc:
                 return
@@ -155,6 +249,10 @@ class Copy(BaseCopy["Connection[Any]"]):
             self.connection._try_cancel()
             self.connection.wait(self._end_copy_out_gen())
 
+    def _write(self, data: Buffer) -> None:
+        self._bytes_written += len(data)
+        self.writer.write(data)
+
 
 class Writer(ABC):
     """
@@ -186,8 +284,26 @@ class LibpqWriter(Writer):
         self.cursor = cursor
         self.connection = cursor.connection
         self._pgconn = self.connection.pgconn
+        self._buffer = bytearray()
 
     def write(self, data: Buffer) -> None:
+        if len(data) < BUFFER_SIZE:
+            # Accumulate small buffers, e.g. written by Copy.write() for
+            # every record, to send them to the libpq in a single call.
+            self._buffer += data
+            if len(self._buffer) >= BUFFER_SIZE:
+                self._send_buffer()
+        else:
+            if self._buffer:
+                self._send_buffer()
+            self._send(data)
+
+    def _send_buffer(self) -> None:
+        self._send(self._buffer)
+        # The data was copied by the libpq: the buffer can be reused.
+        self._buffer.clear()
+
+    def _send(self, data: Buffer) -> None:
         if len(data) <= MAX_BUFFER_SIZE:
             # Most used path: we don't need to split the buffer in smaller
             # bits, so don't make a copy.
@@ -203,6 +319,9 @@ class LibpqWriter(Writer):
                 )
 
     def finish(self, exc: BaseException | None = None) -> None:
+        if self._buffer and (not exc):
+            self._send_buffer()
+
         bmsg: bytes | None
         if exc:
             msg = f"error from Python: {type(exc).__qualname__} - {exc}"
@@ -264,6 +383,14 @@ class QueuedLibpqWriter(LibpqWriter):
         if self._worker_error:
             raise self._worker_error
 
+        super().write(data)
+
+    def _send_buffer(self) -> None:
+        # The buffer is sent later by the worker: use a new one.
+        buffer, self._buffer = (self._buffer, bytearray())
+        self._send(buffer)
+
+    def _send(self, data: Buffer) -> None:
         if len(data) <= MAX_BUFFER_SIZE:
             # Most used path: we don't need to split the buffer in smaller
             # bits, so don't make a copy.
@@ -275,6 +402,8 @@ class QueuedLibpqWriter(LibpqWriter):
                 self._queue.put(data[i : i + MAX_BUFFER_SIZE])
 
     def finish(self, exc: BaseException | None = None) -> None:
+        if self._buffer and (not exc):
+            self._send_buffer()
         self._queue.put(b"")
 
         if self._worker:
@@ -6,19 +6,30 @@ Objects to support the COPY protocol (async version).
 
 from __future__ import annotations
 
+import os
+import mmap
 from abc import ABC, abstractmethod
+from time import monotonic
 from types import TracebackType
 from typing import TYPE_CHECKING, Any
-from collections.abc import AsyncIterator, Sequence
+from itertools import islice
+from collections.abc import AsyncIterator, Iterable, Sequence
 
 from . import errors as e
 from . import pq
 from ._compat import Self
 from ._acompat import AQueue, AWorker, agather, aspawn
-from ._copy_base import MAX_BUFFER_SIZE, PREFER_FLUSH, QUEUE_SIZE, BaseCopy
+from ._copy_base import ARROW_BATCH_SIZE, BUFFER_SIZE, FILE_BUFFER_SIZE
+from ._copy_base import MAX_BUFFER_SIZE, MMAP_WINDOW_SIZE, PREFER_FLUSH, QUEUE_SIZE
+from ._copy_base import WRITE_ROWS_BATCH_SIZE, BaseCopy
 from .generators import copy_end, copy_to
 
+if True:  # ASYNC
+    import asyncio
+
 if TYPE_CHECKING:
+    import pyarrow as pa
+
     from .abc import Buffer
     from .cursor_async import AsyncCursor
     from .connection_async import AsyncConnection  # noqa: F401
@@ -60,7 +71,6 @@ class AsyncCopy(BaseCopy["AsyncConnection[Any]"]):
             writer = AsyncLibpqWriter(cursor)
 
         self.writer = writer
-        self._write = writer.write
 
     async def __aenter__(self) -> Self:
         self._enter()
@@ -110,6 +120,40 @@ class AsyncCopy(BaseCopy["AsyncConnection[Any]"]):
         """
         return await self.connection.wait(self._read_row_gen())
 
+    async def read_arrow_batches(
+        self, size: int = ARROW_BATCH_SIZE
+    ) -> AsyncIterator[pa.RecordBatch]:
+        """
+        Iterate on the result of a :sql:`COPY TO` operation by Arrow batches.
+
+        Yield `pyarrow.RecordBatch` objects of at most `!size` records. The
+        types of the columns must be specified using `set_types()`.
+        """
+        builder = self._batch_builder()
+        while (
+            fields := (await self.connection.wait(self._read_fields_gen()))
+        ) is not None:
+            builder.append(fields)
+            if builder.nrows >= size:
+                yield builder.batch()
+
+        if builder.nrows:
+            yield builder.batch()
+
+    async def read_to_file(self, path: str | os.PathLike[str]) -> int:
+        """
+        Write the data of a :sql:`COPY TO` operation to a file.
+
+        The file is created, or truncated if it exists. Return the number of
+        bytes written.
+        """
+        size = 0
+        with open(path, "wb", buffering=FILE_BUFFER_SIZE) as f:
+            while data := await self.read():
+                size += f.write(data)
+
+        return size
+
     async def write(self, buffer: Buffer | str) -> None:
         """
         Write a block of data to a table after a :sql:`COPY FROM` operation.
@@ -122,9 +166,68 @@ class AsyncCopy(BaseCopy["AsyncConnection[Any]"]):
 
     async def write_row(self, row: Sequence[Any]) -> None:
         """Write a record to a table after a :sql:`COPY FROM` operation."""
+        self._rows_written += 1
         if data := self.formatter.write_row(row):
             await self._write(data)
 
+    async def write_rows(
+        self, rows: Iterable[Sequence[Any]], batch_size: int = WRITE_ROWS_BATCH_SIZE
+    ) -> None:
+        """
+        Write records to a table after a :sql:`COPY FROM` operation.
+
+        The records are formatted in batches of *batch_size*.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        it = iter(rows)
+        while batch := list(islice(it, batch_size)):
+            if True:  # ASYNC
+                # Format the records in a thread, so that the event loop is
+                # free to run other tasks, such as the queued writer one.
+                buffers = await asyncio.to_thread(self._format_rows, batch)
+            else:
+                buffers = self._format_rows(batch)
+            for data in buffers:
+                await self._write(data)
+
+    async def write_columns(
+        self, columns: Sequence[Any], types: Sequence[int | str] | None = None
+    ) -> None:
+        """
+        Write columns of data to a table after a binary :sql:`COPY FROM` operation.
+        """
+        for data in self.formatter.write_columns(columns, self._column_types(types)):
+            await self._write(data)
+        if columns:
+            self._rows_written += len(columns[0])
+
+    async def write_from_file(self, path: str | os.PathLike[str]) -> int:
+        """
+        Write the content of a file to a table after a :sql:`COPY FROM` operation.
+
+        The file must contain data in the format of the operation, for
+        instance written by `read_to_file()`. The file is mapped in memory,
+        and sent to the database without being copied into Python objects.
+        Return the number of bytes written.
+        """
+        # The data of a queued writer is sent later: it must be copied
+        # before its memory is unmapped.
+        copy_data = isinstance(self.writer, AsyncQueuedLibpqWriter)
+
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            for offset in range(0, size, MMAP_WINDOW_SIZE):
+                length = min(MMAP_WINDOW_SIZE, size - offset)
+                with mmap.mmap(
+                    f.fileno(), length, offset=offset, access=mmap.ACCESS_READ
+                ) as mm:
+                    for i in range(0, length, MAX_BUFFER_SIZE):
+                        with memoryview(mm)[i : i + MAX_BUFFER_SIZE] as data:
+                            await self.write(data.tobytes() if copy_data else data)
+
+        return size
+
     async def finish(self, exc: BaseException | None) -> None:
         """Terminate the copy operation and free the resources allocated.
 
@@ -138,6 +241,7 @@ class AsyncCopy(BaseCopy["AsyncConnection[Any]"]):
                     await self._write(data)
             await self.writer.finish(exc)
             self._finished = True
+            self._finished_at = monotonic()
         else:
             if not exc:
                 return
@@ -154,6 +258,10 @@ class AsyncCopy(BaseCopy["AsyncConnection[Any]"]):
             await self.connection._try_cancel()
             await self.connection.wait(self._end_copy_out_gen())
 
+    async def _write(self, data: Buffer) -> None:
+        self._bytes_written += len(data)
+        await self.writer.write(data)
+
 
 class AsyncWriter(ABC):
     """
@@ -185,8 +293,26 @@ class AsyncLibpqWriter(AsyncWriter):
         self.cursor = cursor
         self.connection = cursor.connection
         self._pgconn = self.connection.pgconn
+        self._buffer = bytearray()
 
     async def write(self, data: Buffer) -> None:
+        if len(data) < BUFFER_SIZE:
+            # Accumulate small buffers, e.g. written by Copy.write() for
+            # every record, to send them to the libpq in a single call.
+            self._buffer += data
+            if len(self._buffer) >= BUFFER_SIZE:
+                await self._send_buffer()
+        else:
+            if self._buffer:
+                await self._send_buffer()
+            await self._send(data)
+
+    async def _send_buffer(self) -> None:
+        await self._send(self._buffer)
+        # The data was copied by the libpq: the buffer can be reused.
+        self._buffer.clear()
+
+    async def _send(self, data: Buffer) -> None:
         if len(data) <= MAX_BUFFER_SIZE:
             # Most used path: we don't need to split the buffer in smaller
             # bits, so don't make a copy.
@@ -202,6 +328,9 @@ class AsyncLibpqWriter(AsyncWriter):
                 )
 
     async def finish(self, exc: BaseException | None = None) -> None:
+        if self._buffer and not exc:
+            await self._send_buffer()
+
         bmsg: bytes | None
         if exc:
             msg = f"error from Python: {type(exc).__qualname__} - {exc}"
@@ -265,6 +394,14 @@ class AsyncQueuedLibpqWriter(AsyncLibpqWriter):
         if self._worker_error:
             raise self._worker_error
 
+        await super().write(data)
+
+    async def _send_buffer(self) -> None:
+        # The buffer is sent later by the worker: use a new one.
+        buffer, self._buffer = self._buffer, bytearray()
+        await self._send(buffer)
+
+    async def _send(self, data: Buffer) -> None:
         if len(data) <= MAX_BUFFER_SIZE:
             # Most used path: we don't need to split the buffer in smaller
             # bits, so don't make a copy.
@@ -276,6 +413,8 @@ class AsyncQueuedLibpqWriter(AsyncLibpqWriter):
                 await self._queue.put(data[i : i + MAX_BUFFER_SIZE])
 
     async def finish(self, exc: BaseException | None = None) -> None:
+        if self._buffer and not exc:
+            await self._send_buffer()
         await self._queue.put(b"")
 
         if self._worker:
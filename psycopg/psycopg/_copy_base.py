@@ -10,8 +10,9 @@ import re
 import sys
 import struct
 from abc import ABC, abstractmethod
+from time import monotonic
 from typing import TYPE_CHECKING, Any, Generic
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 
 from . import adapt
 from . import errors as e
@@ -22,6 +23,7 @@ from ._cmodule import _psycopg
 from .generators import copy_from
 
 if TYPE_CHECKING:
+    from ._arrow import BatchBuilder
     from ._cursor_base import BaseCursor
 
 PY_TEXT = adapt.PyFormat.TEXT
@@ -47,10 +49,21 @@ MAX_BUFFER_SIZE = 4 * BUFFER_SIZE
 # makes operations *way* slower! Probably triggering some quadraticity
 # in the libpq memory management and data sending.
 
+# Size of the portions of a file mapped in memory at time to copy it to the
+# database, and of the buffer used to write copy data to a file.
+MMAP_WINDOW_SIZE = 64 * MAX_BUFFER_SIZE
+FILE_BUFFER_SIZE = 8 * MAX_BUFFER_SIZE
+
 # Max size of the write queue of buffers. More than that copy will block
 # Each buffer should be around BUFFER_SIZE size.
 QUEUE_SIZE = 1024
 
+# Number of records formatted at time by write_rows().
+WRITE_ROWS_BATCH_SIZE = 1000
+
+# Default number of records in the batches returned by read_arrow_batches().
+ARROW_BATCH_SIZE = 64 * 1024
+
 # On certain systems, memmove seems particularly slow and flushing often is
 # more performing than accumulating a larger buffer. See #746 for details.
 PREFER_FLUSH = sys.platform == "darwin"
@@ -99,13 +112,33 @@ class BaseCopy(Generic[ConnectionType]):
         else:
             self.formatter = TextFormatter(tx, encoding=self._pgconn._encoding)
 
+        self._types: list[int] | None = None
         self._finished = False
 
+        # Amount of data written, and when, reported by get_stats()
+        self._rows_written = 0
+        self._bytes_written = 0
+        self._started_at = monotonic()
+        self._finished_at = 0.0
+
     def __repr__(self) -> str:
         cls = f"{self.__class__.__module__}.{self.__class__.__qualname__}"
         info = connection_summary(self._pgconn)
         return f"<{cls} {info} at 0x{id(self):x}>"
 
+    def get_stats(self) -> dict[str, float]:
+        """
+        Return stats about the data written in a :sql:`COPY FROM` operation.
+        """
+        elapsed = (self._finished_at or monotonic()) - self._started_at
+        return {
+            "rows": self._rows_written,
+            "bytes": self._bytes_written,
+            "seconds": elapsed,
+            "rows_per_second": self._rows_written / elapsed if elapsed else 0.0,
+            "bytes_per_second": self._bytes_written / elapsed if elapsed else 0.0,
+        }
+
     def _enter(self) -> None:
         if self._finished:
             raise TypeError("copy blocks can be used only once")
@@ -129,14 +162,48 @@ class BaseCopy(Generic[ConnectionType]):
           PostgreSQL will apply no cast rule.
 
         """
-        registry = self.cursor.adapters.types
-        oids = [t if isinstance(t, int) else registry.get_oid(t) for t in types]
+        oids = self._types = self._get_oids(types)
 
         if self._direction == COPY_IN:
             self.formatter.transformer.set_dumper_types(oids, self.formatter.format)
         else:
             self.formatter.transformer.set_loader_types(oids, self.formatter.format)
 
+    def _format_rows(self, rows: Sequence[Sequence[Any]]) -> list[Buffer]:
+        """Format a batch of records, return the data to write."""
+        rv = []
+        for row in rows:
+            if data := self.formatter.write_row(row):
+                rv.append(data)
+
+        self._rows_written += len(rows)
+        return rv
+
+    def _get_oids(self, types: Sequence[int | str]) -> list[int]:
+        registry = self.cursor.adapters.types
+        return [t if isinstance(t, int) else registry.get_oid(t) for t in types]
+
+    def _column_types(self, types: Sequence[int | str] | None) -> list[int]:
+        if types is not None:
+            return self._get_oids(types)
+        elif self._types is not None:
+            return self._types
+        else:
+            raise e.ProgrammingError(
+                "writing columns requires the types to be specified, either"
+                " passing them to write_columns() or using set_types()"
+            )
+
+    def _batch_builder(self) -> BatchBuilder:
+        from ._arrow import BatchBuilder
+
+        if self._types is None:
+            raise e.ProgrammingError(
+                "reading Arrow batches requires the types to be set using set_types()"
+            )
+        tx = self.formatter.transformer
+        return BatchBuilder(tx, self._types, self.formatter.format)
+
     # High level copy protocol generators (state change of the Copy object)
 
     def _read_gen(self) -> PQGen[Buffer]:
@@ -170,6 +237,18 @@ class BaseCopy(Generic[ConnectionType]):
 
         return row
 
+    def _read_fields_gen(self) -> PQGen[list[Buffer | None] | None]:
+        if not (data := (yield from self._read_gen())):
+            return None
+
+        if (fields := self.formatter.split_row(data)) is None:
+            # Get the final result to finish the copy operation
+            yield from self._read_gen()
+            self._finished = True
+            return None
+
+        return fields
+
     def _end_copy_out_gen(self) -> PQGen[None]:
         try:
             while (yield from self._read_gen()):
@@ -193,6 +272,9 @@ class Formatter(ABC):
     @abstractmethod
     def parse_row(self, data: Buffer) -> tuple[Any, ...] | None: ...
 
+    @abstractmethod
+    def split_row(self, data: Buffer) -> list[Buffer | None] | None: ...
+
     @abstractmethod
     def write(self, buffer: Buffer | str) -> Buffer: ...
 
@@ -202,6 +284,21 @@ class Formatter(ABC):
     @abstractmethod
     def end(self) -> Buffer: ...
 
+    def flush_rows(self) -> Buffer:
+        """
+        Return the data buffered by `write_row()`.
+
+        After the call, records formatted elsewhere can be written.
+        """
+        self._row_mode = True
+        buffer, self._write_buffer = self._write_buffer, bytearray()
+        return buffer
+
+    def write_columns(
+        self, columns: Sequence[Any], types: Sequence[int]
+    ) -> Iterator[Buffer]:
+        raise e.NotSupportedError("writing columns is only supported in binary copy")
+
 
 class TextFormatter(Formatter):
     format = TEXT
@@ -217,6 +314,9 @@ class TextFormatter(Formatter):
 
         return rv
 
+    def split_row(self, data: Buffer) -> list[Buffer | None] | None:
+        return _split_row_text(data) if data else None
+
     def write(self, buffer: Buffer | str) -> Buffer:
         data = self._ensure_bytes(buffer)
         self._signature_sent = True
@@ -258,6 +358,18 @@ class BinaryFormatter(Formatter):
     def parse_row(self, data: Buffer) -> tuple[Any, ...] | None:
         rv: tuple[Any, ...] | None = None
 
+        data = self._check_signature(data)
+        if data != _binary_trailer:
+            rv = parse_row_binary(data, self.transformer)
+
+        return rv
+
+    def split_row(self, data: Buffer) -> list[Buffer | None] | None:
+        data = self._check_signature(data)
+        return _split_row_binary(data) if data != _binary_trailer else None
+
+    def _check_signature(self, data: Buffer) -> Buffer:
+        """Strip the signature from the first data received."""
         if not self._signature_sent:
             if data[: len(_binary_signature)] != _binary_signature:
                 raise e.DataError(
@@ -266,10 +378,7 @@ class BinaryFormatter(Formatter):
             self._signature_sent = True
             data = data[len(_binary_signature) :]
 
-        if data != _binary_trailer:
-            rv = parse_row_binary(data, self.transformer)
-
-        return rv
+        return data
 
     def write(self, buffer: Buffer | str) -> Buffer:
         data = self._ensure_bytes(buffer)
@@ -292,6 +401,32 @@ class BinaryFormatter(Formatter):
         else:
             return b""
 
+    def flush_rows(self) -> Buffer:
+        if not self._signature_sent:
+            self._write_buffer += _binary_signature
+            self._signature_sent = True
+
+        return super().flush_rows()
+
+    def write_columns(
+        self, columns: Sequence[Any], types: Sequence[int]
+    ) -> Iterator[Buffer]:
+        from ._columnar import format_columns_binary
+
+        # Columns are written as rows, so the trailer must be sent at the end.
+        self._row_mode = True
+
+        if not self._signature_sent:
+            self._write_buffer += _binary_signature
+            self._signature_sent = True
+
+        # Send the data formatted by write_row() first, if any.
+        if self._write_buffer:
+            buffer, self._write_buffer = self._write_buffer, bytearray()
+            yield buffer
+
+        yield from format_columns_binary(columns, types, MAX_BUFFER_SIZE)
+
     def end(self) -> Buffer:
         # If we have sent no data we need to send the signature
         # and the trailer
@@ -348,15 +483,24 @@ def _format_row_binary(row: Sequence[Any], tx: Transformer, out: bytearray) -> N
 
 
 def _parse_row_text(data: Buffer, tx: Transformer) -> tuple[Any, ...]:
+    return tx.load_sequence(_split_row_text(data))
+
+
+def _parse_row_binary(data: Buffer, tx: Transformer) -> tuple[Any, ...]:
+    return tx.load_sequence(_split_row_binary(data))
+
+
+def _split_row_text(data: Buffer) -> list[Buffer | None]:
+    """Split a row of text copy data into unescaped fields."""
     if not isinstance(data, bytes):
         data = bytes(data)
     fields = data.split(b"\t")
     fields[-1] = fields[-1][:-1]  # drop \n
-    row = [None if f == b"\\N" else _load_re.sub(_load_sub, f) for f in fields]
-    return tx.load_sequence(row)
+    return [None if f == b"\\N" else _load_re.sub(_load_sub, f) for f in fields]
 
 
-def _parse_row_binary(data: Buffer, tx: Transformer) -> tuple[Any, ...]:
+def _split_row_binary(data: Buffer) -> list[Buffer | None]:
+    """Split a row of binary copy data into fields."""
     row: list[Buffer | None] = []
     nfields = _unpack_int2(data, 0)[0]
     pos = 2
@@ -369,7 +513,7 @@ def _parse_row_binary(data: Buffer, tx: Transformer) -> tuple[Any, ...]:
         else:
             row.append(None)
 
-    return tx.load_sequence(row)
+    return row
 
 
 _pack_int2 = struct.Struct("!h").pack
@@ -0,0 +1,236 @@
+"""
+Formatting of COPY FROM records on several processes.
+"""
+
+# Copyright (C) 2026 The Psycopg Team
+
+from __future__ import annotations
+
+import os
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+from itertools import islice
+from collections import deque
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing.context import BaseContext
+from multiprocessing.shared_memory import SharedMemory
+
+from . import adapt
+from . import errors as e
+from . import pq
+from .abc import Transformer
+from ._copy import QueuedLibpqWriter
+from ._compat import Self
+from ._copy_base import format_row_binary, format_row_text
+from ._encodings import conn_encoding
+
+if TYPE_CHECKING:
+    from ._copy import Copy
+
+# Default number of records formatted by a process at time.
+BATCH_SIZE = 1000
+
+# Default size of the shared memory buffers receiving the formatted records.
+SLOT_SIZE = 1024 * 1024
+
+
+class ProcessPoolFormatter:
+    """
+    Format the records of a :sql:`COPY FROM` operation on a pool of processes.
+
+    The records written are split in batches, formatted concurrently by the
+    worker processes into a ring of shared memory buffers, and written to the
+    `!copy` in the same order they were received.
+
+    :param copy: the copy operation to write the records to.
+    :param processes: the number of worker processes. If `!None`, use the
+        number of CPUs.
+    :param batch_size: the number of records formatted by a process at time.
+    :param slot_size: the size of the shared memory buffers. The data of a
+        batch not fitting in a buffer is returned by the process in a slower
+        way.
+    :param mp_context: the `multiprocessing` context to create the processes.
+    :param initializer: a function called, with arguments *initargs*, by each
+        worker process when it starts, for instance to register adapters.
+    """
+
+    __module__ = "psycopg.copy"
+
+    def __init__(
+        self,
+        copy: Copy,
+        *,
+        processes: int | None = None,
+        batch_size: int = BATCH_SIZE,
+        slot_size: int = SLOT_SIZE,
+        mp_context: BaseContext | None = None,
+        initializer: Callable[..., object] | None = None,
+        initargs: tuple[Any, ...] = (),
+    ):
+        if conn_encoding(copy.connection) != "utf-8":
+            raise e.NotSupportedError(
+                "formatting copy records in other processes is only supported"
+                " with utf8 client encoding"
+            )
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        self.copy = copy
+        self.processes = processes or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.slot_size = slot_size
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(
+                copy.formatter.format,
+                copy._types,
+                initializer,
+                initargs,
+            ),
+        )
+
+        # Twice the buffers as the processes, so that they can format a
+        # batch while the previous one is written.
+        nslots = 2 * self.processes
+        self._slots = [SharedMemory(create=True, size=slot_size) for i in range(nslots)]
+        self._free = deque(self._slots)
+        self._pending: deque[tuple[Future[int | bytes], SharedMemory]] = deque()
+
+        # The data of a queued writer is written later: it can't point to
+        # a buffer which would be reused.
+        self._copy_data = isinstance(copy.writer, QueuedLibpqWriter)
+        self._closed = False
+
+    def __repr__(self) -> str:
+        cls = f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+        return f"<{cls} {self.processes} processes at 0x{id(self):x}>"
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if not exc_type:
+            self.flush()
+        self.close()
+
+    def write_rows(self, rows: Iterable[Sequence[Any]]) -> None:
+        """
+        Write records to the copy, formatting them in the worker processes.
+
+        The function returns when all the records are sent to the processes:
+        the last ones might still be formatted and written on `flush()`.
+        """
+        if self._closed:
+            raise e.ProgrammingError("the formatter is closed")
+
+        # Write the data possibly formatted by copy.write_row() first.
+        if data := self.copy.formatter.flush_rows():
+            self.copy.write(data)
+
+        it = iter(rows)
+        while batch := list(islice(it, self.batch_size)):
+            if not self._free:
+                self._write_next()
+            slot = self._free.popleft()
+            fut = self._executor.submit(_format_batch, batch, slot.name)
+            self._pending.append((fut, slot))
+            self.copy._rows_written += len(batch)
+
+    def flush(self) -> None:
+        """
+        Wait for all the records to be formatted and write them to the copy.
+        """
+        while self._pending:
+            self._write_next()
+
+    def close(self) -> None:
+        """
+        Terminate the worker processes and free the shared memory.
+
+        The records not written yet are discarded.
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._pending.clear()
+        for slot in self._slots:
+            slot.close()
+            slot.unlink()
+
+    def _write_next(self) -> None:
+        fut, slot = self._pending.popleft()
+        try:
+            if isinstance(rv := fut.result(), bytes):
+                self.copy.write(rv)
+                return
+
+            assert slot.buf is not None
+            if self._copy_data:
+                self.copy.write(slot.buf[:rv].tobytes())
+            else:
+                with slot.buf[:rv] as data:
+                    self.copy.write(data)
+        finally:
+            self._free.append(slot)
+
+
+# The state of the worker processes.
+
+_tx: Transformer | None = None
+_format_row = format_row_text
+_attached: dict[str, SharedMemory] = {}
+
+
+def _init_worker(
+    format: pq.Format,
+    types: list[int] | None,
+    initializer: Callable[..., object] | None,
+    initargs: tuple[Any, ...],
+) -> None:
+    global _tx, _format_row
+
+    if initializer:
+        initializer(*initargs)
+
+    _tx = adapt.Transformer()
+    if types:
+        _tx.set_dumper_types(types, format)
+
+    if format == pq.Format.BINARY:
+        _format_row = format_row_binary
+    else:
+        _format_row = format_row_text
+
+
+def _format_batch(rows: list[Sequence[Any]], slot_name: str) -> int | bytes:
+    """
+    Format a batch of records in the shared memory buffer *slot_name*.
+
+    Return the size of the data formatted or, if it doesn't fit the buffer,
+    the data itself.
+    """
+    assert _tx
+    out = bytearray()
+    for row in rows:
+        _format_row(row, _tx, out)
+
+    if not (slot := _attached.get(slot_name)):
+        slot = _attached[slot_name] = SharedMemory(name=slot_name)
+
+    if (size := len(out)) > slot.size:
+        return bytes(out)
+
+    assert slot.buf is not None
+    slot.buf[:size] = out
+    return size
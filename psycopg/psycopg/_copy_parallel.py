@@ -0,0 +1,226 @@
+"""
+COPY FROM operations split across several connections.
+"""
+
+# Copyright (C) 2026 The Psycopg Team
+
+from __future__ import annotations
+
+import re
+import threading
+from typing import IO, TYPE_CHECKING, Any, Protocol, cast
+from itertools import islice
+from contextlib import AbstractContextManager
+from collections.abc import Iterable, Iterator, Sequence
+
+from . import errors as e
+from .abc import Buffer, Query
+from ._copy import QueuedLibpqWriter
+from ._compat import Template
+from ._acompat import Queue, gather, spawn
+
+if TYPE_CHECKING:
+    from .connection import Connection
+
+# Default number of records sent to a worker at time.
+CHUNK_SIZE = 10_000
+
+# Approximate size of data read from a file and sent to a worker at time.
+FILE_CHUNK_SIZE = 1024 * 1024
+
+# Match a HEADER option enabled in a COPY FROM STDIN statement.
+_header_re = re.compile(
+    rb"\bstdin\b.*\bheader\b(?!\s*(?:false|off|0)\b)", re.IGNORECASE | re.DOTALL
+)
+
+
+class ConnectionSource(Protocol):
+    """
+    An object providing connections, such as a `~psycopg_pool.ConnectionPool`.
+    """
+
+    def connection(self) -> AbstractContextManager[Connection[Any]]: ...
+
+
+def parallel_copy(
+    source: str | ConnectionSource,
+    statement: Query,
+    data: Iterable[Sequence[Any]] | IO[bytes] | IO[str],
+    *,
+    workers: int = 4,
+    chunk_size: int = CHUNK_SIZE,
+    atomic: bool = False,
+    **kwargs: Any,
+) -> int:
+    """
+    Perform a :sql:`COPY FROM` operation on several connections concurrently.
+
+    :param source: a connection string, or an object whose `!connection()`
+        method returns a connection context manager, such as a connection
+        pool.
+    :param statement: the :sql:`COPY ... FROM STDIN` statement to execute on
+        every connection.
+    :param data: an iterable of records to write, or a file, open in text or
+        binary mode, containing data in :sql:`COPY` text format.
+    :param workers: the number of connections to use.
+    :param chunk_size: the number of records to pass to a connection at time.
+    :param atomic: if `!True`, commit the transaction of every connection
+        only after all of them have completed the copy; if any connection
+        fails, all of them roll back.
+    :param kwargs: further parameters to pass to `Connection.connect()` if
+        *source* is a connection string.
+    :return: the number of records copied.
+
+    The :sql:`HEADER` option is not supported: every connection would skip the
+    first record it receives. Skip the header of the input before calling
+    the function instead.
+    """
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    if _has_header(statement):
+        raise e.NotSupportedError(
+            "parallel_copy() doesn't support the COPY HEADER option;"
+            " please skip the header of the input before copying it"
+        )
+
+    chunks: Iterator[Any]
+    if hasattr(data, "readlines"):
+        chunks = _file_chunks(cast(IO[Any], data))
+    else:
+        chunks = _row_chunks(data, chunk_size)
+
+    copier = _ParallelCopy(source, statement, workers, atomic, kwargs)
+    return copier.run(chunks)
+
+
+class _ParallelCopy:
+    """
+    The state of a `parallel_copy()` operation.
+
+    The calling thread reads the input and puts it, in chunks, in a queue
+    consumed by the worker threads, each performing the copy on its own
+    connection.
+    """
+
+    def __init__(
+        self,
+        source: str | ConnectionSource,
+        statement: Query,
+        workers: int,
+        atomic: bool,
+        kwargs: dict[str, Any],
+    ):
+        self.source = source
+        self.statement = statement
+        self.nworkers = workers
+        self.kwargs = kwargs
+
+        self._queue: Queue[list[Sequence[Any]] | Buffer | str | None]
+        self._queue = Queue(maxsize=2 * workers)
+        self._barrier = threading.Barrier(workers) if atomic else None
+        self._errors: list[BaseException] = []
+        self._rowcount = 0
+        self._lock = threading.Lock()
+
+    def run(self, chunks: Iterator[Any]) -> int:
+        threads = [
+            spawn(self._worker, name=f"parallel-copy-{i}") for i in range(self.nworkers)
+        ]
+
+        try:
+            for chunk in chunks:
+                # Stop reading the input if any worker failed.
+                if self._errors:
+                    break
+                self._queue.put(chunk)
+        except BaseException:
+            # Don't let the workers commit an incomplete atomic copy.
+            if self._barrier:
+                self._barrier.abort()
+            raise
+        finally:
+            for _ in threads:
+                self._queue.put(None)
+            gather(*threads)
+
+        if self._errors:
+            # Prefer reporting the error causing the others to abort.
+            errors = [
+                ex
+                for ex in self._errors
+                if not isinstance(ex, threading.BrokenBarrierError)
+            ]
+            raise (errors or self._errors)[0]
+
+        return self._rowcount
+
+    def _connection(self) -> AbstractContextManager[Connection[Any]]:
+        if isinstance(self.source, str):
+            from .connection import Connection
+
+            return Connection.connect(self.source, **self.kwargs)
+        else:
+            return self.source.connection()
+
+    def _worker(self) -> None:
+        finished = False
+        try:
+            with self._connection() as conn:
+                with conn.transaction():
+                    with conn.cursor() as cur:
+                        writer = QueuedLibpqWriter(cur)
+                        with cur.copy(self.statement, writer=writer) as copy:
+                            while (chunk := self._queue.get()) is not None:
+                                if isinstance(chunk, list):
+                                    for row in chunk:
+                                        copy.write_row(row)
+                                else:
+                                    copy.write(chunk)
+                            finished = True
+                        rowcount = cur.rowcount
+
+                    # Wait for the other workers to succeed before committing.
+                    if self._barrier:
+                        self._barrier.wait()
+
+                with self._lock:
+                    self._rowcount += rowcount
+
+        except BaseException as ex:
+            self._errors.append(ex)
+            if self._barrier:
+                self._barrier.abort()
+
+            # Consume the input until the end, to unblock the calling thread.
+            if not finished:
+                while self._queue.get() is not None:
+                    pass
+
+
+def _has_header(statement: Query) -> bool:
+    if isinstance(statement, str):
+        query = statement.encode()
+    elif isinstance(statement, bytes):
+        query = statement
+    elif isinstance(statement, Template):
+        query = "".join(statement.strings).encode()
+    else:
+        query = statement.as_bytes(None)
+    return bool(_header_re.search(query))
+
+
+def _row_chunks(
+    rows: Iterable[Sequence[Any]], size: int
+) -> Iterator[list[Sequence[Any]]]:
+    it = iter(rows)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+def _file_chunks(f: IO[Any]) -> Iterator[Buffer | str]:
+    # Only pass whole lines to the workers, each one is a record in text
+    # format. Note that CSV records with quoted newlines would be split.
+    while lines := f.readlines(FILE_CHUNK_SIZE):
+        yield lines[0][:0].join(lines)
@@ -6,20 +6,26 @@ Psycopg BaseCursor object
 
 from __future__ import annotations
 
+from time import monotonic
 from typing import TYPE_CHECKING, Any, Generic, NoReturn
 from weakref import ReferenceType, ref
 from functools import partial
-from collections.abc import Iterable, Sequence
+from itertools import islice
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
 
 from . import adapt
 from . import errors as e
 from . import pq
 from .abc import ConnectionType, Loader, Params, PQGen, Query
+from .sql import Composable
 from .rows import Row, RowMaker
 from ._column import Column
 from ._compat import Template
 from .pq.misc import connection_summary
-from ._queries import PostgresClientQuery, PostgresQuery
+from ._queries import MAX_CACHED_STATEMENT_LENGTH, MAX_QUERY_PARAMS, BatchQuery
+from ._queries import PostgresClientQuery, PostgresQuery, PostgresRawQuery
+from ._queries import _split_batch_query, _split_batch_query_nocache
 from ._preparing import Prepare
 from .generators import execute, fetch, send
 from ._capabilities import capabilities
@@ -184,6 +190,17 @@ class BaseCursor(Generic[ConnectionType, Row]):
     def _make_row_maker(self) -> RowMaker[Row]:
         raise NotImplementedError
 
+    def _load_rows(self, row0: int, row1: int) -> list[Row]:
+        """
+        Load a range of rows of the current result, on several threads if allowed.
+        """
+        if (nthreads := self._conn._load_threads) > 1:
+            from ._parallel import load_rows
+
+            return load_rows(self._tx, row0, row1, self._make_row, nthreads)
+
+        return self._tx.load_rows(row0, row1, self._make_row)
+
     #
     # Generators for the high level operations on the cursor
     #
@@ -211,7 +228,11 @@ class BaseCursor(Generic[ConnectionType, Row]):
         yield from self._conn._prepared.maintain_gen(self._conn)
 
     def _executemany_gen_pipeline(
-        self, query: Query, params_seq: Iterable[Params], returning: bool
+        self,
+        query: Query,
+        params_seq: Iterable[Params],
+        returning: bool,
+        batch_size: int | None = None,
     ) -> PQGen[None]:
         """
         Generator implementing `Cursor.executemany()` with pipelines available.
@@ -226,18 +247,29 @@ class BaseCursor(Generic[ConnectionType, Row]):
         assert self._execmany_returning is None
         self._execmany_returning = returning
 
-        first = True
-        for params in params_seq:
-            if first:
-                pgq = self._convert_query(query, params)
-                self._query = pgq
-                first = False
-            else:
-                pgq.dump(params)
+        # Size of the queries sent whose results are not received yet.
+        pending = deque[int]()
+        pending_bytes = 0
 
-            yield from self._maybe_prepare_gen(pgq, prepare=True)
+        for pgq, prepare in self._executemany_queries(query, params_seq, batch_size):
+            yield from self._maybe_prepare_gen(pgq, prepare=prepare)
             yield from pipeline._communicate_gen()
 
+            # If too many results are pending, wait for the server to catch up
+            # in order to keep the queues and the network buffers bounded.
+            pending.append(size := _query_size(pgq))
+            pending_bytes += size
+            while len(pending) > len(pipeline.result_queue):
+                pending_bytes -= pending.popleft()
+            if (
+                len(pending) >= pipeline.max_pending
+                or pending_bytes >= pipeline.max_pending_bytes
+            ):
+                keep = len(pipeline.result_queue) - (len(pending) + 1) // 2
+                yield from pipeline._fetch_gen(flush=True, keep=keep)
+                while len(pending) > len(pipeline.result_queue):
+                    pending_bytes -= pending.popleft()
+
         self._last_query = query
 
         if returning:
@@ -246,7 +278,11 @@ class BaseCursor(Generic[ConnectionType, Row]):
         yield from self._conn._prepared.maintain_gen(self._conn)
 
     def _executemany_gen_no_pipeline(
-        self, query: Query, params_seq: Iterable[Params], returning: bool
+        self,
+        query: Query,
+        params_seq: Iterable[Params],
+        returning: bool,
+        batch_size: int | None = None,
     ) -> PQGen[None]:
         """
         Generator implementing `Cursor.executemany()` with pipelines not available.
@@ -258,6 +294,34 @@ class BaseCursor(Generic[ConnectionType, Row]):
         assert self._execmany_returning is None
         self._execmany_returning = returning
 
+        for pgq, prepare in self._executemany_queries(query, params_seq, batch_size):
+            yield from self._maybe_prepare_gen(pgq, prepare=prepare)
+
+        self._last_query = query
+        yield from self._conn._prepared.maintain_gen(self._conn)
+
+    def _executemany_queries(
+        self, query: Query, params_seq: Iterable[Params], batch_size: int | None
+    ) -> Iterator[tuple[PostgresQuery, bool]]:
+        """
+        Return the queries to execute to implement `Cursor.executemany()`.
+
+        Return one query per set of parameters or, if `!batch_size` is
+        specified and the query is a rewritable ``INSERT ... VALUES``, one
+        query per batch of parameters. The queries are converted only once and
+        they are only dumped with new parameters, unless their shape changes.
+
+        Every query is returned together with a flag telling whether to
+        prepare it: the last, shorter, batch is executed only once and is not
+        worth preparing.
+        """
+        if batch_size is not None:
+            if batch_size < 1:
+                raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+            if batch := self._split_batch_query(query):
+                yield from self._executemany_batches(batch, params_seq, batch_size)
+                return
+
         first = True
         for params in params_seq:
             if first:
@@ -266,11 +330,47 @@ class BaseCursor(Generic[ConnectionType, Row]):
                 first = False
             else:
                 pgq.dump(params)
+            yield pgq, True
+
+    def _executemany_batches(
+        self, batch: BatchQuery, params_seq: Iterable[Params], batch_size: int
+    ) -> Iterator[tuple[PostgresQuery, bool]]:
+        nparams = len(batch.parts) - 1
+        batch_size = min(batch_size, MAX_QUERY_PARAMS // nparams)
+        nrows = 0
+        it = iter(params_seq)
+        while rows := list(islice(it, batch_size)):
+            params = batch.params(rows)
+            if len(rows) != nrows:
+                nrows = len(rows)
+                pgq = self._convert_query(batch.query(nrows), params)
+                if self._query is None:
+                    self._query = pgq
+            else:
+                pgq.dump(params)
+            yield pgq, nrows == batch_size
 
-            yield from self._maybe_prepare_gen(pgq, prepare=True)
+    def _split_batch_query(self, query: Query) -> BatchQuery | None:
+        """
+        Split a query for `!executemany()` to insert many rows at once.
 
-        self._last_query = query
-        yield from self._conn._prepared.maintain_gen(self._conn)
+        Return None if the query cannot be rewritten.
+        """
+        if isinstance(query, Template) or issubclass(self._query_cls, PostgresRawQuery):
+            return None
+        elif isinstance(query, str):
+            bquery = query.encode(self._encoding)
+        elif isinstance(query, Composable):
+            bquery = query.as_bytes(self._tx)
+        else:
+            bquery = query
+
+        f: Callable[[bytes, str], BatchQuery | None]
+        if len(bquery) <= MAX_CACHED_STATEMENT_LENGTH:
+            f = _split_batch_query
+        else:
+            f = _split_batch_query_nocache
+        return f(bquery, self._encoding)
 
     def _maybe_prepare_gen(
         self,
@@ -281,24 +381,27 @@ class BaseCursor(Generic[ConnectionType, Row]):
     ) -> PQGen[None]:
         # Check if the query is prepared or needs preparing
         prep, name = self._get_prepared(pgq, prepare)
+        parse_time = None
         if prep is Prepare.NO:
             # The query must be executed without preparing
             self._execute_send(pgq, binary=binary)
         else:
             # If the query is not already prepared, prepare it.
             if prep is Prepare.SHOULD:
+                t0 = monotonic()
                 self._send_prepare(name, pgq)
                 if not self._conn._pipeline:
                     (result,) = yield from execute(self._pgconn)
                     if result.status == FATAL_ERROR:
                         raise e.error_from_result(result, encoding=self._encoding)
+                    parse_time = monotonic() - t0
             # Then execute it.
             self._send_query_prepared(name, pgq, binary=binary)
 
         # Update the prepare state of the query.
         # If an operation requires to flush our prepared statements cache,
         # it will be added to the maintenance commands to execute later.
-        key = self._conn._prepared.maybe_add_to_cache(pgq, prep, name)
+        key = self._conn._prepared.maybe_add_to_cache(pgq, prep, name, parse_time)
 
         if self._conn._pipeline:
             queued = None
@@ -344,16 +447,23 @@ class BaseCursor(Generic[ConnectionType, Row]):
         yield from send(self._pgconn)
 
     def _stream_fetchone_gen(self, first: bool) -> PQGen[PGresult | None]:
+        if res := (yield from self._stream_fetch_gen()):
+            self._stream_set_result(res, first)
+        return res
+
+    def _stream_fetch_gen(self) -> PQGen[PGresult | None]:
+        """
+        Generator to fetch the next result for `Cursor.stream()`.
+
+        Return None after the last result. Don't change the cursor state, so
+        that it can run while the rows of a previous result are being loaded.
+        """
         res: PGresult | None = yield from fetch(self._pgconn)
         if res is None:
             return None
 
         status = res.status
         if status == SINGLE_TUPLE or status == TUPLES_CHUNK:
-            self.pgresult = res
-            self._tx.set_pgresult(res, set_loaders=first)
-            if first:
-                self._make_row = self._make_row_maker()
             return res
 
         elif status == TUPLES_OK or status == COMMAND_OK:
@@ -370,6 +480,21 @@ class BaseCursor(Generic[ConnectionType, Row]):
             # Errors, unexpected values
             return self._raise_for_result(res)
 
+    def _stream_has_result(self) -> bool:
+        """
+        Return True if a result for `Cursor.stream()` can be fetched without waiting.
+        """
+        if self._pgconn.is_busy():
+            self._pgconn.consume_input()
+        return not self._pgconn.is_busy()
+
+    def _stream_set_result(self, res: PGresult, first: bool) -> None:
+        """Make *res*, received by `Cursor.stream()`, the current result."""
+        self.pgresult = res
+        self._tx.set_pgresult(res, set_loaders=first)
+        if first:
+            self._make_row = self._make_row_maker()
+
     def _start_query(self, query: Query | None = None) -> PQGen[None]:
         """Generator to start the processing of a query.
 
@@ -661,3 +786,11 @@ class BaseCursor(Generic[ConnectionType, Row]):
     @property
     def _encoding(self) -> str:
         return self._pgconn._encoding
+
+
+def _query_size(pgq: PostgresQuery) -> int:
+    """Return the approximate size of a query sent to the server."""
+    size = len(pgq.query)
+    if pgq.params:
+        size += sum(len(p) for p in pgq.params if p is not None)
+    return size
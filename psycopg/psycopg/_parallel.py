@@ -0,0 +1,85 @@
+"""
+Loading of large query results on several threads.
+"""
+
+# Copyright (C) 2026 The Psycopg Team
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .abc import Transformer
+from .rows import Row, RowMaker
+
+# Minimum number of rows to load in every thread: splitting the work further
+# costs more in synchronization than what can be gained.
+MIN_ROWS_PER_THREAD = 10_000
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def gil_enabled() -> bool:
+    """
+    Return True if the GIL is enabled, which makes loading in parallel useless.
+    """
+    if f := getattr(sys, "_is_gil_enabled", None):
+        return bool(f())
+    return True
+
+
+def load_rows(
+    tx: Transformer, row0: int, row1: int, make_row: RowMaker[Row], nthreads: int
+) -> list[Row]:
+    """
+    Load the rows from *row0* to *row1* of the result of *tx* on *nthreads* threads.
+
+    The rows are split in contiguous ranges, one of which is loaded by the
+    calling thread. Load all the rows in the calling thread if the GIL is
+    enabled or if the rows are not enough to be worth splitting.
+    """
+    nchunks = min(nthreads, (row1 - row0) // MIN_ROWS_PER_THREAD)
+    if nchunks < 2 or gil_enabled():
+        return tx.load_rows(row0, row1, make_row)
+
+    bounds = [row0 + (row1 - row0) * i // nchunks for i in range(nchunks + 1)]
+    executor = _get_executor()
+    futures = [
+        executor.submit(tx.load_rows, bounds[i], bounds[i + 1], make_row)
+        for i in range(1, nchunks)
+    ]
+
+    try:
+        rv = tx.load_rows(bounds[0], bounds[1], make_row)
+    finally:
+        # Make sure no thread is still using the result when we return.
+        for f in futures:
+            f.exception()
+
+    for f in futures:
+        rv.extend(f.result())
+    return rv
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if not _executor:
+        with _executor_lock:
+            if not _executor:
+                _executor = ThreadPoolExecutor(
+                    max_workers=os.cpu_count(), thread_name_prefix="psycopg-load"
+                )
+    return _executor
+
+
+def _reset_executor() -> None:
+    # The threads of the executor don't survive a fork.
+    global _executor
+    _executor = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_executor)
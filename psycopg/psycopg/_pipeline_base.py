@@ -41,6 +41,11 @@ class BasePipeline:
     command_queue: deque[PipelineCommand]
     result_queue: deque[PendingResult]
 
+    # Max number of queries and of bytes of query data sent by executemany()
+    # before waiting for the server to return results.
+    max_pending: int = 1000
+    max_pending_bytes: int = 4 * 1024 * 1024
+
     def __init__(self, conn: BaseConnection[Any]) -> None:
         self._conn = conn
         self.pgconn = conn.pgconn
@@ -121,7 +126,7 @@ class BasePipeline:
         if exception is not None:
             raise exception
 
-    def _fetch_gen(self, *, flush: bool) -> PQGen[None]:
+    def _fetch_gen(self, *, flush: bool, keep: int = 0) -> PQGen[None]:
         """Fetch available results from the connection and process them with
         pipeline queued items.
 
@@ -129,8 +134,10 @@ class BasePipeline:
         sure results can be fetched. Otherwise, the caller may emit a
         PQpipelineSync() call to ensure the output buffer gets flushed before
         fetching.
+
+        Stop fetching when no more than 'keep' results are pending.
         """
-        if not self.result_queue:
+        if len(self.result_queue) <= keep:
             return
 
         if flush:
@@ -138,7 +145,7 @@ class BasePipeline:
             yield from send(self.pgconn)
 
         exception = None
-        while self.result_queue:
+        while len(self.result_queue) > keep:
             if not (results := (yield from fetch_many(self.pgconn))):
                 # No more results to fetch, but there may still be pending
                 # commands.
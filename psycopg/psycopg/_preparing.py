@@ -6,12 +6,14 @@ Support for prepared statements
 
 from __future__ import annotations
 
+from abc import ABC, abstractmethod
 from enum import IntEnum, auto
-from typing import TYPE_CHECKING, Any, TypeAlias
-from collections import OrderedDict, deque
+from time import monotonic
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeAlias
+from collections import Counter, OrderedDict, deque
 from collections.abc import Sequence
 
-from . import pq
+from . import generators, pq
 from .abc import PQGen
 from ._queries import PostgresQuery
 
@@ -31,6 +33,81 @@ class Prepare(IntEnum):
     SHOULD = auto()
 
 
+class PreparedStatement(NamedTuple):
+    """A statement prepared on a connection."""
+
+    query: bytes
+    """The query, as sent to the server."""
+
+    types: tuple[int, ...]
+    """The oids of the query parameters."""
+
+    name: bytes
+    """The name of the prepared statement in the server session."""
+
+    executions: int
+    """The number of times the statement was executed since prepared."""
+
+    parse_time: float | None
+    """The time (in seconds) taken to prepare the statement, if known."""
+
+
+class EvictionPolicy(ABC):
+    """
+    Choose what prepared statement to deallocate when the cache is full.
+    """
+
+    @abstractmethod
+    def choose(self, statements: Sequence[PreparedStatement]) -> PreparedStatement:
+        """
+        Return the statement to evict among *statements*.
+
+        *statements* are sorted from the least to the most recently used. The
+        statement just prepared, which caused the eviction, is not included.
+        """
+        ...
+
+
+class LRUPolicy(EvictionPolicy):
+    """Evict the least recently used statement. This is the default policy."""
+
+    def choose(self, statements: Sequence[PreparedStatement]) -> PreparedStatement:
+        return statements[0]
+
+
+class LFUPolicy(EvictionPolicy):
+    """
+    Evict the least frequently executed statement.
+
+    Among statements executed the same number of times, evict the least
+    recently used.
+    """
+
+    def choose(self, statements: Sequence[PreparedStatement]) -> PreparedStatement:
+        return min(statements, key=lambda stmt: stmt.executions)
+
+
+class CostPolicy(EvictionPolicy):
+    """
+    Evict the statement whose preparation saved the least time.
+
+    The time saved is estimated as the number of executions multiplied by the
+    time taken to prepare the statement. Statements whose preparation time is
+    unknown (for instance because prepared in a pipeline) are assigned the
+    average time of the others.
+    """
+
+    def choose(self, statements: Sequence[PreparedStatement]) -> PreparedStatement:
+        times = [t for stmt in statements if (t := stmt.parse_time) is not None]
+        default = sum(times) / len(times) if times else 1.0
+
+        def cost(stmt: PreparedStatement) -> float:
+            t = stmt.parse_time
+            return stmt.executions * (t if t is not None else default)
+
+        return min(statements, key=cost)
+
+
 class PrepareManager:
     # Number of times a query is executed before it is prepared.
     prepare_threshold: int | None = 5
@@ -38,6 +115,9 @@ class PrepareManager:
     # Maximum number of prepared statements on the connection.
     prepared_max: int = 100
 
+    # Policy choosing the prepared statement to evict when the cache is full.
+    policy: EvictionPolicy = LRUPolicy()
+
     def __init__(self) -> None:
         # Map (query, types) to the number of times the query was seen.
         self._counts: OrderedDict[Key, int] = OrderedDict()
@@ -45,6 +125,14 @@ class PrepareManager:
         # Map (query, types) to the name of the statement if  prepared.
         self._names: OrderedDict[Key, bytes] = OrderedDict()
 
+        # Map (query, types) of the prepared statements to the number of times
+        # they were executed and to the time taken to prepare them.
+        self._executions: dict[Key, int] = {}
+        self._parse_times: dict[Key, float] = {}
+
+        # Counters of the cache activity.
+        self._stats = Counter[str]()
+
         # Counter to generate prepared statements names
         self._prepared_idx = 0
 
@@ -66,8 +154,11 @@ class PrepareManager:
 
         if name := self._names.get(key := self.key(query)):
             # The query was already prepared in this session
+            self._stats["hits"] += 1
+            self._executions[key] += 1
             return Prepare.YES, name
 
+        self._stats["misses"] += 1
         count = self._counts.get(key, 0)
         if count >= self.prepare_threshold or prepare:
             # The query has been executed enough times and needs to be prepared
@@ -78,6 +169,25 @@ class PrepareManager:
             # The query is not to be prepared yet
             return Prepare.NO, b""
 
+    def get_stats(self) -> dict[str, int]:
+        """Return the counters of the cache activity and its current size."""
+        rv = dict(self._stats)
+        rv["size"] = len(self._names)
+        return rv
+
+    def get_statements(self) -> list[PreparedStatement]:
+        """Return the statements prepared, least recently used first."""
+        return [
+            PreparedStatement(
+                key[0],
+                key[1],
+                name,
+                self._executions[key],
+                self._parse_times.get(key),
+            )
+            for key, name in self._names.items()
+        ]
+
     def _should_discard(self, prep: Prepare, results: Sequence[PGresult]) -> bool:
         """Check if we need to discard our entire state: it should happen on
         rollback or on dropping objects, because the same object may get
@@ -105,21 +215,45 @@ class PrepareManager:
 
         return True
 
-    def _rotate(self) -> None:
-        """Evict an old value from the cache.
+    def _rotate(self, key: Key) -> None:
+        """Evict a value from the cache.
 
-        If it was prepared, deallocate it. Do it only once: if the cache was
-        resized, deallocate gradually.
+        If it was prepared, deallocate it, choosing the statement according
+        to the eviction policy, but never the statement `!key` just executed.
+        Do it only once: if the cache was resized, deallocate gradually.
         """
         if len(self._counts) > self.prepared_max:
             self._counts.popitem(last=False)
 
         if len(self._names) > self.prepared_max:
-            name = self._names.popitem(last=False)[1]
-            self._to_flush.append(name)
+            if len(self._names) == 1 or type(self.policy) is LRUPolicy:
+                # Fast path for the default policy: evict the oldest entry.
+                evict = next(iter(self._names))
+            else:
+                # Don't offer to evict the statement just prepared. It is not
+                # necessarily the last one: in pipeline mode other statements
+                # might have been executed before its result is received.
+                stmts = self.get_statements()
+                stmt = self.policy.choose(
+                    [s for s in stmts if (s.query, s.types) != key]
+                )
+                evict = (stmt.query, stmt.types)
+
+            self._to_flush.append(self._forget(evict))
+            self._stats["evictions"] += 1
+
+    def _forget(self, key: Key) -> bytes:
+        """Remove a prepared statement from the cache and return its name."""
+        self._executions.pop(key, None)
+        self._parse_times.pop(key, None)
+        return self._names.pop(key)
 
     def maybe_add_to_cache(
-        self, query: PostgresQuery, prep: Prepare, name: bytes
+        self,
+        query: PostgresQuery,
+        prep: Prepare,
+        name: bytes,
+        parse_time: float | None = None,
     ) -> Key | None:
         """Handle 'query' for possible addition to the cache.
 
@@ -133,7 +267,7 @@ class PrepareManager:
         if (key := self.key(query)) in self._counts:
             if prep is Prepare.SHOULD:
                 del self._counts[key]
-                self._names[key] = name
+                self._add_prepared(key, name, parse_time)
             else:
                 self._counts[key] += 1
                 self._counts.move_to_end(key)
@@ -145,11 +279,18 @@ class PrepareManager:
 
         else:
             if prep is Prepare.SHOULD:
-                self._names[key] = name
+                self._add_prepared(key, name, parse_time)
             else:
                 self._counts[key] = 1
             return key
 
+    def _add_prepared(self, key: Key, name: bytes, parse_time: float | None) -> None:
+        self._names[key] = name
+        self._executions[key] = 1
+        if parse_time is not None:
+            self._parse_times[key] = parse_time
+        self._stats["prepares"] += 1
+
     def validate(
         self, key: Key, prep: Prepare, name: bytes, results: Sequence[PGresult]
     ) -> None:
@@ -161,10 +302,11 @@ class PrepareManager:
             return
 
         if not self._check_results(results):
-            self._names.pop(key, None)
+            if key in self._names:
+                self._forget(key)
             self._counts.pop(key, None)
         else:
-            self._rotate()
+            self._rotate(key)
 
     def clear(self) -> bool:
         """Clear the cache of the maintenance commands.
@@ -175,12 +317,52 @@ class PrepareManager:
         self._counts.clear()
         if self._names:
             self._names.clear()
+            self._executions.clear()
+            self._parse_times.clear()
             self._to_flush.clear()
             self._to_flush.append(None)
             return True
         else:
             return False
 
+    def prepared_keys(self) -> list[Key]:
+        """Return the keys of the statements prepared, least recently used first."""
+        return list(self._names)
+
+    def preload_gen(
+        self, conn: BaseConnection[Any], keys: Sequence[Key]
+    ) -> PQGen[list[Key]]:
+        """
+        Generator to prepare statements in the session ahead of their use.
+
+        Skip the statements already prepared and stop when `prepared_max` is
+        reached. Return the keys of the statements that failed to prepare.
+        """
+        failed: list[Key] = []
+        if self.prepare_threshold is None:
+            return failed
+
+        for key in keys:
+            if len(self._names) >= self.prepared_max:
+                break
+            if key in self._names:
+                continue
+
+            name = f"_pg3_{self._prepared_idx}".encode()
+            self._prepared_idx += 1
+            t0 = monotonic()
+            conn.pgconn.send_prepare(name, key[0], param_types=key[1])
+            results = yield from generators.execute(conn.pgconn)
+            if results[-1].status != COMMAND_OK:
+                failed.append(key)
+                continue
+
+            self._counts.pop(key, None)
+            self._add_prepared(key, name, monotonic() - t0)
+            self._executions[key] = 0
+
+        return failed
+
     def maintain_gen(self, conn: BaseConnection[Any]) -> PQGen[None]:
         """
         Generator to send the commands to perform periodic maintenance
@@ -191,3 +373,7 @@ class PrepareManager:
         while self._to_flush:
             name = self._to_flush.popleft()
             yield from conn._deallocate(name)
+            if name is not None:
+                self._stats["deallocations"] += 1
+            else:
+                self._stats["deallocations_all"] += 1
@@ -19,7 +19,7 @@ from . import abc
 from . import errors as e
 from . import pq
 from .abc import AdaptContext, Buffer, LoadFunc, NoneType, PyFormat
-from .rows import Row, RowMaker
+from .rows import Row, RowMaker, _LazyRowMaker
 from ._oids import INVALID_OID, TEXT_OID
 from ._encodings import conn_encoding
 
@@ -306,6 +306,10 @@ class Transformer(AdaptContext):
                 f"rows must be included between 0 and {self._ntuples}"
             )
 
+        if isinstance(make_row, _LazyRowMaker):
+            loader = FieldLoader(res, self._row_loaders)
+            return [make_row.make(loader, row) for row in range(row0, row1)]
+
         records = []
         for row in range(row0, row1):
             record: list[Any] = [None] * self._nfields
@@ -325,6 +329,9 @@ class Transformer(AdaptContext):
                 f"row must be included between 0 and {self._ntuples}"
             )
 
+        if isinstance(make_row, _LazyRowMaker):
+            return make_row.make(FieldLoader(res, self._row_loaders), row)
+
         record: list[Any] = [None] * self._nfields
         for col in range(self._nfields):
             if (val := res.get_value(row, col)) is not None:
@@ -355,3 +362,21 @@ class Transformer(AdaptContext):
                 raise e.InterfaceError("unknown oid loader not found")
         loader = self._loaders[format][oid] = loader_cls(oid, self)
         return loader
+
+
+class FieldLoader:
+    """
+    Load on demand the values of a query result.
+    """
+
+    __slots__ = ("_pgresult", "_row_loaders")
+
+    def __init__(self, pgresult: PGresult, row_loaders: list[LoadFunc]):
+        self._pgresult = pgresult
+        self._row_loaders = row_loaders
+
+    def load(self, row: int, col: int) -> Any:
+        if (val := self._pgresult.get_value(row, col)) is not None:
+            return self._row_loaders[col](val)
+        else:
+            return None
@@ -454,6 +454,110 @@ _ph_to_fmt = {
     b"b": PyFormat.BINARY,
 }
 
+_fmt_to_ph = {fmt: b"%" + ph for ph, fmt in _ph_to_fmt.items()}
+
+# Maximum number of parameters in a query allowed by the server protocol.
+MAX_QUERY_PARAMS = 65535
+
+
+class BatchQuery(NamedTuple):
+    """
+    An ``INSERT ... VALUES (...)`` query split to insert many rows at once.
+    """
+
+    head: bytes
+    row: bytes
+    tail: bytes
+    parts: list[QueryPart]
+
+    def query(self, nrows: int) -> bytes:
+        """Return the query inserting `!nrows` rows, with positional placeholders."""
+        return self.head + b", ".join([self.row] * nrows) + self.tail
+
+    def params(self, rows: Sequence[Params]) -> list[Any]:
+        """Return the parameters of the query to insert `!rows`, flattened."""
+        order: list[str] | None = None
+        if isinstance(self.parts[0].item, str):
+            order = [p.item for p in self.parts[:-1] if isinstance(p.item, str)]
+
+        rv: list[Any] = []
+        for row in rows:
+            rv.extend(PostgresQuery.validate_and_reorder_params(self.parts, row, order))
+        return rv
+
+
+_re_insert_values = re.compile(rb"(?is)^\s*insert\s+into\b.*?\bvalues\s*\(")
+_re_more_rows = re.compile(rb"^\s*,")
+_re_do_update = re.compile(rb"(?is)\bon\s+conflict\b.*\bdo\s+update\b")
+
+
+def _split_batch_query_nocache(query: bytes, encoding: str) -> BatchQuery | None:
+    """
+    Split an ``INSERT ... VALUES (...)`` query to insert many rows at once.
+
+    Return None if the query cannot be rewritten: if it is not an insert, if
+    there are placeholders outside the VALUES row, if it inserts more than
+    one row, or if it has an ``ON CONFLICT ... DO UPDATE`` clause, which
+    would fail if the same key appeared twice in a batch.
+    """
+    if not (m := _re_insert_values.match(query)):
+        return None
+
+    parts = _split_query(query, encoding, collapse_double_percent=False)
+    if len(parts) < 2:
+        return None
+
+    # Find the closing parenthesis of the VALUES row, skipping nested
+    # parentheses, quotes and placeholders.
+    placeholders = [m for m in _re_placeholder.finditer(query) if m[0] != b"%%"]
+    spans = {m.start(): m.end() for m in placeholders}
+    start = i = m.end() - 1
+    depth = 0
+    quote = 0
+    end = 0
+    while i < len(query):
+        c = query[i]
+        if quote:
+            if c == quote:
+                quote = 0
+        elif i in spans:
+            i = spans[i]
+            continue
+        elif c == 0x27 or c == 0x22:  # ' or "
+            quote = c
+        elif c == 0x28:  # (
+            depth += 1
+        elif c == 0x29:  # )
+            depth -= 1
+            if not depth:
+                end = i + 1
+                break
+        elif c == 0x24 or query.startswith((b"--", b"/*"), i):
+            # Don't venture into dollar quotes and comments.
+            return None
+        i += 1
+
+    if not end or placeholders[0].start() < start or placeholders[-1].end() > end:
+        return None
+
+    tail = query[end:]
+    if _re_more_rows.match(tail) or _re_do_update.search(tail):
+        return None
+
+    # Convert the row placeholders into positional ones.
+    chunks = []
+    cur = start
+    for ph, part in zip(placeholders, parts):
+        chunks.append(query[cur : ph.start()])
+        chunks.append(_fmt_to_ph[part.format])
+        cur = ph.end()
+    chunks.append(query[cur:end])
+
+    return BatchQuery(query[:start], b"".join(chunks), tail, parts)
+
+
+_split_batch_query = lru_cache(_split_batch_query_nocache)
+
 
 class PostgresRawQuery(PostgresQuery):
     def convert(self, query: Query, vars: Params | None) -> None:
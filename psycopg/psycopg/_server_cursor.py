@@ -100,7 +100,12 @@ class ServerCursor(ServerCursorMixin["Connection[Any]", Row], Cursor[Row]):
         return self
 
     def executemany(
-        self, query: Query, params_seq: Iterable[Params], *, returning: bool = True
+        self,
+        query: Query,
+        params_seq: Iterable[Params],
+        *,
+        returning: bool = True,
+        batch_size: int | None = None,
     ) -> None:
         """Method not implemented for server-side cursors."""
         raise e.NotSupportedError("executemany not supported on server-side cursors")
@@ -128,6 +133,14 @@ class ServerCursor(ServerCursorMixin["Connection[Any]", Row], Cursor[Row]):
         self._pos += len(recs)
         return recs
 
+    def fetch_columns(self, size: int | None = None) -> list[Any]:
+        """Method not implemented for server-side cursors."""
+        raise e.NotSupportedError("fetch_columns not supported on server-side cursors")
+
+    def fetch_arrow(self, size: int | None = None) -> Any:
+        """Method not implemented for server-side cursors."""
+        raise e.NotSupportedError("fetch_arrow not supported on server-side cursors")
+
     def __iter__(self) -> Self:
         return self
 
@@ -99,7 +99,12 @@ class AsyncServerCursor(
         return self
 
     async def executemany(
-        self, query: Query, params_seq: Iterable[Params], *, returning: bool = True
+        self,
+        query: Query,
+        params_seq: Iterable[Params],
+        *,
+        returning: bool = True,
+        batch_size: int | None = None,
     ) -> None:
         """Method not implemented for server-side cursors."""
         raise e.NotSupportedError("executemany not supported on server-side cursors")
@@ -127,6 +132,14 @@ class AsyncServerCursor(
         self._pos += len(recs)
         return recs
 
+    async def fetch_columns(self, size: int | None = None) -> list[Any]:
+        """Method not implemented for server-side cursors."""
+        raise e.NotSupportedError("fetch_columns not supported on server-side cursors")
+
+    async def fetch_arrow(self, size: int | None = None) -> Any:
+        """Method not implemented for server-side cursors."""
+        raise e.NotSupportedError("fetch_arrow not supported on server-side cursors")
+
     def __aiter__(self) -> Self:
         return self
 
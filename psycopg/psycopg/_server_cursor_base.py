@@ -180,7 +180,7 @@ class ServerCursorMixin(BaseCursor[ConnectionType, Row]):
 
         self.pgresult = res
         self._tx.set_pgresult(res, set_loaders=False)
-        return self._tx.load_rows(0, res.ntuples, self._make_row)
+        return self._load_rows(0, res.ntuples)
 
     def _scroll_gen(self, value: int, mode: str) -> PQGen[None]:
         if mode not in ("relative", "absolute"):
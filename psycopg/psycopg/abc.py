@@ -199,6 +199,17 @@ class Loader(Protocol):
         ...
 
 
+class FieldLoader(Protocol):
+    """
+    Load on demand the values of a query result.
+
+    Passed by a `Transformer` to the `RowMaker` returned by
+    `~psycopg.rows.lazy_row()`, instead of the values of every row.
+    """
+
+    def load(self, row: int, col: int) -> Any: ...
+
+
 class Transformer(Protocol):
     types: tuple[int, ...] | None
     formats: list[pq.Format] | None
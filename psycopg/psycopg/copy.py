@@ -4,7 +4,7 @@ Module gathering the various parts of the copy subsystem.
 
 from typing import IO
 
-from . import _copy, _copy_async
+from . import _copy, _copy_async, _copy_mp, _copy_parallel
 from .abc import Buffer
 
 # re-exports
@@ -19,6 +19,9 @@ Writer = _copy.Writer
 LibpqWriter = _copy.LibpqWriter
 QueuedLibpqWriter = _copy.QueuedLibpqWriter
 
+ProcessPoolFormatter = _copy_mp.ProcessPoolFormatter
+parallel_copy = _copy_parallel.parallel_copy
+
 
 class FileWriter(Writer):
     """
@@ -17,10 +17,15 @@ from .abc import Params, Query, QueryNoTemplate
 from .copy import AsyncCopy, AsyncWriter
 from .rows import AsyncRowFactory, Row, RowMaker
 from ._compat import Self, Template
+from ._acompat import AQueue, AWorker, agather, aspawn
 from ._cursor_base import BaseCursor
 from ._pipeline_async import AsyncPipeline
 
 if TYPE_CHECKING:
+    import numpy as np
+    import pyarrow as pa
+
+    from .pq.abc import PGresult
     from .connection_async import AsyncConnection
 
 ACTIVE = pq.TransactionStatus.ACTIVE
@@ -118,7 +123,12 @@ class AsyncCursor(BaseCursor["AsyncConnection[Any]", Row]):
         return self
 
     async def executemany(
-        self, query: Query, params_seq: Iterable[Params], *, returning: bool = False
+        self,
+        query: Query,
+        params_seq: Iterable[Params],
+        *,
+        returning: bool = False,
+        batch_size: int | None = None,
     ) -> None:
         """
         Execute the same command with a sequence of input data.
@@ -130,19 +140,23 @@ class AsyncCursor(BaseCursor["AsyncConnection[Any]", Row]):
                     # sending unnecessary Sync.
                     if self._conn._pipeline:
                         await self._conn.wait(
-                            self._executemany_gen_pipeline(query, params_seq, returning)
+                            self._executemany_gen_pipeline(
+                                query, params_seq, returning, batch_size
+                            )
                         )
                     # Otherwise, make a new one
                     else:
                         async with self._conn._pipeline_nolock():
                             await self._conn.wait(
                                 self._executemany_gen_pipeline(
-                                    query, params_seq, returning
+                                    query, params_seq, returning, batch_size
                                 )
                             )
                 else:
                     await self._conn.wait(
-                        self._executemany_gen_no_pipeline(query, params_seq, returning)
+                        self._executemany_gen_no_pipeline(
+                            query, params_seq, returning, batch_size
+                        )
                     )
         except e._NO_TRACEBACK as ex:
             raise ex.with_traceback(None)
@@ -154,6 +168,7 @@ class AsyncCursor(BaseCursor["AsyncConnection[Any]", Row]):
         *,
         binary: bool | None = None,
         size: int = 1,
+        prefetch: int = 0,
     ) -> AsyncIterator[Row]:
         """
         Iterate row-by-row on a result from the database.
@@ -161,23 +176,37 @@ class AsyncCursor(BaseCursor["AsyncConnection[Any]", Row]):
         :param size: if greater than 1, results will be retrieved by chunks of
             this size from the server (but still yielded row-by-row); this is only
             available from version 17 of the libpq.
+        :param prefetch: if greater than 0, keep receiving results (rows or
+            chunks) from the server in the background while the rows already
+            received are processed, handing them over in batches of up to this
+            number of results.
         """
         if self._pgconn.pipeline_status:
             raise e.ProgrammingError("stream() cannot be used in pipeline mode")
+        if prefetch < 0:
+            raise ValueError("prefetch must be >= 0")
 
         async with self._conn.lock:
+            queue: AQueue[list[PGresult] | BaseException | None] = AQueue(maxsize=1)
+            worker: AWorker | None = None
             try:
                 await self._conn.wait(
                     self._stream_send_gen(query, params, binary=binary, size=size)
                 )
+                if prefetch:
+                    worker = aspawn(self._stream_prefetch, (queue, prefetch))
                 first = True
-                while res := await self._conn.wait(self._stream_fetchone_gen(first)):
-                    for pos in range(res.ntuples):
-                        yield self._tx.load_row(pos, self._make_row)
-                    first = False
+                while results := await self._stream_next(queue if worker else None):
+                    for res in results:
+                        self._stream_set_result(res, first)
+                        first = False
+                        for pos in range(res.ntuples):
+                            yield self._tx.load_row(pos, self._make_row)
             except e._NO_TRACEBACK as ex:
                 raise ex.with_traceback(None)
             finally:
+                if worker:
+                    await self._stream_stop_prefetch(worker, queue)
                 if self._pgconn.transaction_status == ACTIVE:
                     # Try to cancel the query, then consume the results
                     # already received.
@@ -197,6 +226,72 @@ class AsyncCursor(BaseCursor["AsyncConnection[Any]", Row]):
                     except Exception:
                         pass
 
+    async def _stream_next(
+        self, queue: AQueue[list[PGresult] | BaseException | None] | None
+    ) -> list[PGresult]:
+        """
+        Return the next results for `stream()`, or an empty list at the end.
+
+        Fetch the results from the connection, or from *queue* if the results
+        are prefetched.
+        """
+        if not queue:
+            res = await self._conn.wait(self._stream_fetch_gen())
+            return [res] if res else []
+
+        if (results := await queue.get()) is None or isinstance(results, BaseException):
+            # Leave the end of the results in the queue for _stream_stop_prefetch
+            await queue.put(None)
+            if results:
+                raise results
+            return []
+
+        return results
+
+    async def _stream_prefetch(
+        self, queue: AQueue[list[PGresult] | BaseException | None], prefetch: int
+    ) -> None:
+        """
+        Receive the results of `stream()` and put them in *queue*.
+
+        Put the results in batches of the ones already received, up to
+        *prefetch* results. Terminate after putting None, or the exception
+        raised in case of error.
+
+        The function is designed to be run in a separate task.
+        """
+        results: list[PGresult] = []
+        try:
+            while res := await self._conn.wait(self._stream_fetch_gen()):
+                results.append(res)
+                if len(results) >= prefetch or not self._stream_has_result():
+                    await queue.put(results)
+                    results = []
+        except BaseException as ex:
+            if results:
+                await queue.put(results)
+            await queue.put(ex)
+        else:
+            if results:
+                await queue.put(results)
+            await queue.put(None)
+
+    async def _stream_stop_prefetch(
+        self, worker: AWorker, queue: AQueue[list[PGresult] | BaseException | None]
+    ) -> None:
+        """
+        Wait for the termination of the worker fetching the `stream()` results.
+
+        If the iteration was interrupted, cancel the query and discard the
+        results still to receive.
+        """
+        if self._pgconn.transaction_status == ACTIVE:
+            await self._conn._try_cancel()
+        while (results := await queue.get()) is not None:
+            if isinstance(results, BaseException):
+                break
+        await agather(worker)
+
     async def results(self) -> AsyncIterator[Self]:
         """
         Iterate across multiple record sets received by the cursor.
@@ -267,9 +362,7 @@ class AsyncCursor(BaseCursor["AsyncConnection[Any]", Row]):
 
         if not size:
             size = self.arraysize
-        records = self._tx.load_rows(
-            self._pos, min(self._pos + size, res.ntuples), self._make_row
-        )
+        records = self._load_rows(self._pos, min(self._pos + size, res.ntuples))
         self._pos += len(records)
         return records
 
@@ -281,10 +374,51 @@ class AsyncCursor(BaseCursor["AsyncConnection[Any]", Row]):
         """
         await self._fetch_pipeline()
         res = self._check_result_for_fetch()
-        records = self._tx.load_rows(self._pos, res.ntuples, self._make_row)
+        records = self._load_rows(self._pos, res.ntuples)
         self._pos = res.ntuples
         return records
 
+    async def fetch_columns(self, size: int | None = None) -> list[np.ma.MaskedArray]:
+        """
+        Return the next `!size` records from the current result set as arrays.
+
+        Return one `numpy.ma.MaskedArray` per column, with NULL values masked.
+        If `!size` is not specified, return all the remaining records.
+
+        The `row_factory` is not used.
+        """
+        from ._columnar import load_columns
+
+        await self._fetch_pipeline()
+        res = self._check_result_for_fetch()
+        if size is None:
+            row1 = res.ntuples
+        else:
+            row1 = min(self._pos + size, res.ntuples)
+        columns = load_columns(self._tx, res, self._pos, row1)
+        self._pos = row1
+        return columns
+
+    async def fetch_arrow(self, size: int | None = None) -> pa.RecordBatch:
+        """
+        Return the next `!size` records from the current result set as Arrow data.
+
+        Return a `pyarrow.RecordBatch` with the column names of the result.
+        If `!size` is not specified, return all the remaining records.
+        """
+        from ._arrow import result_batch
+
+        await self._fetch_pipeline()
+        res = self._check_result_for_fetch()
+        if size is None:
+            row1 = res.ntuples
+        else:
+            row1 = min(self._pos + size, res.ntuples)
+        names = [col.name for col in self.description or ()]
+        batch = result_batch(self._tx, res, self._pos, row1, names)
+        self._pos = row1
+        return batch
+
     def __aiter__(self) -> Self:
         return self
 
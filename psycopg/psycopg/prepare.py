@@ -0,0 +1,16 @@
+"""
+Module gathering the objects to inspect and configure prepared statements.
+"""
+
+# Copyright (C) 2026 The Psycopg Team
+
+from ._preparing import CostPolicy, EvictionPolicy, LFUPolicy, LRUPolicy
+from ._preparing import PreparedStatement
+
+__all__ = [
+    "CostPolicy",
+    "EvictionPolicy",
+    "LFUPolicy",
+    "LRUPolicy",
+    "PreparedStatement",
+]
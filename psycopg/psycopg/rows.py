@@ -9,7 +9,7 @@ from __future__ import annotations
 import functools
 from typing import TYPE_CHECKING, Any, NamedTuple, NoReturn, Protocol, TypeAlias
 from collections import namedtuple
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterator, Sequence
 
 from . import errors as e
 from . import pq
@@ -17,6 +17,7 @@ from ._compat import TypeVar
 from ._encodings import _as_python_identifier
 
 if TYPE_CHECKING:
+    from .abc import FieldLoader
     from .cursor import Cursor
     from .pq.abc import PGresult
     from ._cursor_base import BaseCursor
@@ -224,6 +225,104 @@ def scalar_row(cursor: BaseCursor[Any, Any]) -> RowMaker[Any]:
         return no_result
 
 
+class LazyRow(Sequence[Any]):
+    """
+    A row of a query result decoding its values only when they are accessed.
+
+    The values can be accessed by position or by column name, and they are
+    cached once loaded. The row keeps a reference to the query result, which
+    is only released when all its rows are released.
+    """
+
+    __slots__ = ("_maker", "_loader", "_row", "_cache")
+
+    def __init__(
+        self,
+        maker: _LazyRowMaker,
+        loader: FieldLoader | None,
+        row: int,
+        cache: dict[int, Any],
+    ):
+        self._maker = maker
+        self._loader = loader
+        self._row = row
+        self._cache = cache
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({tuple(self)!r})"
+
+    def __len__(self) -> int:
+        return len(self._maker.names)
+
+    def __getitem__(self, key: Any) -> Any:
+        if isinstance(key, int):
+            if key < 0:
+                key += len(self)
+            if not 0 <= key < len(self):
+                raise IndexError("row index out of range")
+        elif isinstance(key, str):
+            key = self._maker.index[key]
+        elif isinstance(key, slice):
+            return tuple(self[i] for i in range(*key.indices(len(self))))
+        else:
+            raise TypeError(f"row indices must be int, str, or slice, got {key!r}")
+
+        try:
+            return self._cache[key]
+        except KeyError:
+            assert self._loader
+            rv = self._cache[key] = self._loader.load(self._row, key)
+            return rv
+
+    def __iter__(self) -> Iterator[Any]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (LazyRow, tuple)):
+            return tuple(self) == tuple(other)
+        return NotImplemented
+
+    def keys(self) -> list[str]:
+        """Return the names of the columns of the row."""
+        return list(self._maker.names)
+
+    def _asdict(self) -> dict[str, Any]:
+        return dict(zip(self._maker.names, self))
+
+
+class _LazyRowMaker:
+    """
+    The `RowMaker` returned by `lazy_row()`.
+
+    The `~psycopg.abc.Transformer` doesn't load the values of the rows to pass
+    to this object, but calls `make()` instead.
+    """
+
+    __slots__ = ("names", "index")
+
+    def __init__(self, names: list[str]):
+        self.names = names
+        self.index = {n: i for i, n in enumerate(names)}
+
+    def __call__(self, values: Sequence[Any]) -> LazyRow:
+        return LazyRow(self, None, 0, dict(enumerate(values)))
+
+    def make(self, loader: FieldLoader, row: int) -> LazyRow:
+        return LazyRow(self, loader, row, {})
+
+
+def lazy_row(cursor: BaseCursor[Any, Any]) -> RowMaker[LazyRow]:
+    """Row factory to represent rows as `LazyRow`, decoding values on access.
+
+    Useful for queries returning many columns of which only a few are used.
+    """
+    if (names := _get_names(cursor)) is not None:
+        return _LazyRowMaker(names)
+    else:
+        return no_result
+
+
 def no_result(values: Sequence[Any]) -> NoReturn:
     """A `RowMaker` that always fail.
 
@@ -17,6 +17,9 @@ from psycopg.rows import Row, RowMaker
 from psycopg.adapt import AdaptersMap, PyFormat
 from psycopg.pq.abc import PGcancelConn, PGconn, PGresult
 
+class FieldLoader:
+    def load(self, row: int, col: int) -> Any: ...
+
 class Transformer(abc.AdaptContext):
     types: tuple[int, ...] | None
     formats: list[pq.Format] | None
@@ -22,7 +22,7 @@ from typing import Sequence
 
 from psycopg import errors as e
 from psycopg.pq import Format as PqFormat
-from psycopg.rows import Row
+from psycopg.rows import Row, _LazyRowMaker
 from psycopg._encodings import conn_encoding
 
 NoneType = type(None)
@@ -59,6 +59,41 @@ cdef class RowDumper:
     cdef object format
 
 
+cdef class FieldLoader:
+    """
+    Load on demand the values of a query result.
+    """
+
+    cdef pq.PGresult _pgresult
+    cdef list _row_loaders
+
+    @staticmethod
+    cdef FieldLoader _from_transformer(Transformer tx):
+        cdef FieldLoader rv = FieldLoader.__new__(FieldLoader)
+        rv._pgresult = tx._pgresult
+        rv._row_loaders = tx._row_loaders
+        return rv
+
+    def load(self, int row, int col):
+        # cheeky access to the internal PGresult structure
+        cdef pg_result_int *ires = <pg_result_int*>self._pgresult._pgresult_ptr
+        if not (0 <= row < ires.ntups and 0 <= col < ires.numAttributes):
+            raise IndexError(f"field ({row}, {col}) out of range")
+
+        cdef PGresAttValue *attval = &(ires.tuples[row][col])
+        if attval.len == -1:  # NULL_LEN
+            return None
+
+        cdef RowLoader loader = self._row_loaders[col]
+        if loader.cloader is not None:
+            return loader.cloader.cload(attval.value, attval.len)
+
+        b = PyMemoryView_FromObject(
+            ViewBuffer._from_buffer(
+                self._pgresult, <unsigned char *>attval.value, attval.len))
+        return PyObject_CallFunctionObjArgs(loader.loadfunc, <PyObject *>b, NULL)
+
+
 cdef class Transformer:
     """
     An object that can adapt efficiently between Python and PostgreSQL.
@@ -450,6 +485,15 @@ cdef class Transformer:
 
         cdef PyObject *loader  # borrowed RowLoader
 
+        cdef FieldLoader field_loader
+        if isinstance(make_row, _LazyRowMaker):
+            field_loader = FieldLoader._from_transformer(self)
+            for row in range(row0, row1):
+                record = make_row.make(field_loader, row)
+                Py_INCREF(record)
+                PyList_SET_ITEM(records, row - row0, record)
+            return records
+
         row_loaders = self._row_loaders  # avoid an incref/decref per item
 
         for row in range(row0, row1):
@@ -493,6 +537,9 @@ cdef class Transformer:
                 f"row must be included between 0 and {self._ntuples}"
             )
 
+        if isinstance(make_row, _LazyRowMaker):
+            return make_row.make(FieldLoader._from_transformer(self), row)
+
         cdef libpq.PGresult *res = self._pgresult._pgresult_ptr
         # cheeky access to the internal PGresult structure
         cdef pg_result_int *ires = <pg_result_int*>res
@@ -6,17 +6,32 @@ psycopg connection pool package
 
 from .pool import ConnectionPool
 from .errors import PoolClosed, PoolTimeout, TooManyRequests
+from .warmup import TypeRegistration, WarmUp
+from .metrics import Histogram
+from .routing import RoutingConnectionPool
+from .scaling import Demand, DemandPolicy, ScalingPolicy
 from .version import __version__ as __version__  # noqa: F401
 from .null_pool import NullConnectionPool
 from .pool_async import AsyncConnectionPool
+from .statements import StatementRegistry
+from .routing_async import AsyncRoutingConnectionPool
 from .null_pool_async import AsyncNullConnectionPool
 
 __all__ = [
     "AsyncConnectionPool",
     "AsyncNullConnectionPool",
+    "AsyncRoutingConnectionPool",
     "ConnectionPool",
+    "Demand",
+    "DemandPolicy",
+    "Histogram",
     "NullConnectionPool",
     "PoolClosed",
     "PoolTimeout",
+    "RoutingConnectionPool",
+    "ScalingPolicy",
+    "StatementRegistry",
     "TooManyRequests",
+    "TypeRegistration",
+    "WarmUp",
 ]
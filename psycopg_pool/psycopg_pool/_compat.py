@@ -20,9 +20,20 @@ else:
 
 import psycopg
 import psycopg.errors as e
+import psycopg.conninfo
 
 PSYCOPG_VERSION = tuple(map(int, psycopg.__version__.split(".", 2)[:2]))
 
+# Preparing statements ahead of their use is possible from psycopg 3.4.
+HAS_PRELOAD_STATEMENTS = PSYCOPG_VERSION >= (3, 4)
+
+# Finding the hosts of a connection string is possible from late psycopg 3.1.
+HAS_CONNINFO_ATTEMPTS = hasattr(psycopg.conninfo, "conninfo_attempts")
+
+# Pipeline mode allows to reset returned connections in a single round trip,
+# using the public Pipeline API available from psycopg 3.1.
+HAS_PIPELINE = hasattr(psycopg, "Pipeline") and psycopg.Pipeline.is_supported()
+
 if PSYCOPG_VERSION >= (3, 3):
     AsyncPoolConnection = psycopg.AsyncConnection
     PoolConnection = psycopg.Connection
@@ -9,15 +9,20 @@ from __future__ import annotations
 from time import monotonic
 from random import random
 from typing import TYPE_CHECKING, Any
-from collections import Counter, deque
+from collections import Counter, defaultdict, deque
 
 from psycopg import errors as e
+from psycopg.pq import ConnStatus
 
 from .errors import PoolClosed
+from .metrics import Histogram
 
 if TYPE_CHECKING:
     from psycopg._connection_base import BaseConnection
 
+# Policies to choose which connection to take out of the pool
+CHECKOUT_POLICIES = ("fifo", "lifo", "prepared")
+
 
 class BasePool:
     # Used to generate pool names
@@ -33,12 +38,21 @@ class BasePool:
     _REQUESTS_QUEUED = "requests_queued"
     _REQUESTS_WAIT_MS = "requests_wait_ms"
     _REQUESTS_ERRORS = "requests_errors"
+    _REQUESTS_SHED = "requests_shed"
     _USAGE_MS = "usage_ms"
     _RETURNS_BAD = "returns_bad"
     _CONNECTIONS_NUM = "connections_num"
     _CONNECTIONS_MS = "connections_ms"
     _CONNECTIONS_ERRORS = "connections_errors"
     _CONNECTIONS_LOST = "connections_lost"
+    _CHECKS_MS = "checks_ms"
+    _STATEMENTS_PREPARED = "statements_prepared"
+
+    # Stats whose distribution is recorded in a histogram too
+    _HISTOGRAMS = (_REQUESTS_WAIT_MS, _USAGE_MS, _CONNECTIONS_MS, _CHECKS_MS)
+
+    # Percentiles of the histograms reported by get_stats()
+    _PERCENTILES = (50, 95, 99)
 
     _pool: deque[Any]
 
@@ -79,8 +93,16 @@ class BasePool:
         self._nconns = min_size  # currently in the pool, out, being prepared
         self._pool = deque()
         self._stats = Counter[str]()
+        self._histograms = self._new_histograms()
         self._drained_at = 0.0
 
+        # Totals of the requests and durations measured, not reset by
+        # pop_stats(), used to measure the demand of connections.
+        self._totals = defaultdict[str, float](float)
+
+        # Number of connections currently given to clients
+        self._nconns_out = 0
+
         # Min number of connections in the pool in a max_idle unit of time.
         # It is reset periodically by the ShrinkPool scheduled task.
         # It is used to shrink back the pool if maxcon > min_size and extra
@@ -88,11 +110,12 @@ class BasePool:
         # max_idle interval they weren't all used.
         self._nconns_min = min_size
 
-        # Flag to allow the pool to grow only one connection at time. In case
-        # of spike, if threads are allowed to grow in parallel and connection
+        # Number of connections being added to grow the pool. It is limited to
+        # allow the pool to grow only a few connections at time: in case of
+        # spike, if all the threads are busy growing the pool and connection
         # time is slow, there won't be any thread available to return the
         # connections to the pool.
-        self._growing = False
+        self._growing = 0
 
         self._opened = False
         self._closed = True
@@ -161,19 +184,31 @@ class BasePool:
         """
         rv = dict(self._stats)
         rv.update(self._get_measures())
+        rv.update(self._get_percentiles(self._histograms))
         return rv
 
     def pop_stats(self) -> dict[str, int]:
         """
         Return current stats about the pool usage.
 
-        After the call, all the counters are reset to zero.
+        After the call, all the counters and histograms are reset to zero.
         """
         stats, self._stats = self._stats, Counter()
+        hists, self._histograms = self._histograms, self._new_histograms()
         rv = dict(stats)
         rv.update(self._get_measures())
+        rv.update(self._get_percentiles(hists))
         return rv
 
+    def get_histograms(self) -> dict[str, Histogram]:
+        """
+        Return the distribution of the durations measured by the pool.
+
+        The histograms returned are a copy: they are not updated by further
+        pool activity.
+        """
+        return {key: hist.copy() for key, hist in self._histograms.items()}
+
     def _get_measures(self) -> dict[str, int]:
         """
         Return immediate measures of the pool (not counters).
@@ -185,6 +220,54 @@ class BasePool:
             self._POOL_AVAILABLE: len(self._pool),
         }
 
+    def _record_ms(self, key: str, t0: float, t1: float) -> None:
+        """
+        Record a duration from *t0* to *t1* in the *key* counter and histogram.
+        """
+        ms = 1000.0 * (t1 - t0)
+        self._stats[key] += int(ms)
+        self._histograms[key].record(ms)
+        self._totals[key] += ms
+        self._totals[f"{key}_count"] += 1
+
+    def _new_histograms(self) -> dict[str, Histogram]:
+        return {key: Histogram() for key in self._HISTOGRAMS}
+
+    def _get_percentiles(self, hists: dict[str, Histogram]) -> dict[str, int]:
+        """
+        Return the percentiles of the durations recorded, in milliseconds.
+        """
+        rv = {}
+        for key, hist in hists.items():
+            if not hist.count:
+                continue
+            for pc in self._PERCENTILES:
+                rv[f"{key}_p{pc}"] = round(hist.percentile(pc))
+        return rv
+
+    @staticmethod
+    def _probe_connection(conn: BaseConnection[Any]) -> bool:
+        """
+        Return False if a connection is found broken, without a round trip.
+
+        Read, without blocking, what the server might have sent on the idle
+        connection: if it closed the connection (because of a restart, of an
+        `!idle_session_timeout`, of `!pg_terminate_backend()`...), reading
+        fails. A connection whose network is lost silently can't be detected
+        this way.
+        """
+        if conn.closed:
+            return False
+        try:
+            # The server usually sends an error message before closing the
+            # connection: the first read might only consume the message, the
+            # second one find the end of the stream.
+            conn.pgconn.consume_input()
+            conn.pgconn.consume_input()
+        except e.OperationalError:
+            return False
+        return conn.pgconn.status == ConnStatus.OK
+
     @classmethod
     def _jitter(cls, value: float, min_pc: float, max_pc: float) -> float:
         """
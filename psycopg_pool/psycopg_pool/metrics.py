@@ -0,0 +1,198 @@
+"""
+Latency histograms and metrics export for the connection pools.
+"""
+
+# Copyright (C) 2026 The Psycopg Team
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+from collections.abc import Iterable
+
+if TYPE_CHECKING:
+    from .base import BasePool
+
+# Number of bits of the values recorded exactly: every power of 2 above
+# 2 ** _SUB_BITS is split in 2 ** (_SUB_BITS - 1) buckets, so that the
+# relative error on the values reported is less than 2 ** (1 - _SUB_BITS).
+_SUB_BITS = 6
+_SUB_COUNT = 1 << _SUB_BITS
+_HALF_COUNT = _SUB_COUNT >> 1
+
+# Values are recorded in microseconds, up to about 19 hours: longer values
+# are counted in the last bucket.
+_MAX_VALUE = (1 << 36) - 1
+_NBUCKETS = ((_MAX_VALUE.bit_length() - _SUB_BITS) + 2) * _HALF_COUNT
+
+
+class Histogram:
+    """
+    Distribution of a duration measured by a pool, in milliseconds.
+
+    The values are counted in a fixed number of buckets with logarithmic
+    width (similarly to HdrHistogram), so that the memory used doesn't depend
+    on the number of values recorded, while the percentiles are reported with
+    an error within 3%.
+    """
+
+    __slots__ = ("count", "sum", "max", "_counts")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self._counts = [0] * _NBUCKETS
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} count={self.count}"
+            f" p50={self.p50:.3f} p99={self.p99:.3f} at 0x{id(self):x}>"
+        )
+
+    def record(self, value: float) -> None:
+        """Record a duration of *value* milliseconds."""
+        if value < 0.0:
+            value = 0.0
+        self._counts[_bucket(int(value * 1000.0))] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, pc: float) -> float:
+        """
+        Return the value, in milliseconds, below which *pc* percent of the
+        recorded values fall.
+
+        Return 0 if no value was recorded.
+        """
+        if not 0.0 <= pc <= 100.0:
+            raise ValueError(f"percentile must be between 0 and 100, got {pc}")
+        if not self.count:
+            return 0.0
+
+        rank = max(1, math.ceil(self.count * pc / 100.0))
+        if rank >= self.count:
+            return self.max
+
+        seen = 0
+        for i, n in enumerate(self._counts):
+            if not n:
+                continue
+            seen += n
+            if seen >= rank:
+                low, high = _bucket_range(i)
+                return min((low + high) / 2000.0, self.max)
+
+        return self.max  # pragma: no cover
+
+    @property
+    def p50(self) -> float:
+        """The median of the values recorded, in milliseconds."""
+        return self.percentile(50.0)
+
+    @property
+    def p95(self) -> float:
+        """The 95th percentile of the values recorded, in milliseconds."""
+        return self.percentile(95.0)
+
+    @property
+    def p99(self) -> float:
+        """The 99th percentile of the values recorded, in milliseconds."""
+        return self.percentile(99.0)
+
+    def copy(self) -> Histogram:
+        """Return a copy of the histogram."""
+        rv = Histogram()
+        rv.count = self.count
+        rv.sum = self.sum
+        rv.max = self.max
+        rv._counts = self._counts.copy()
+        return rv
+
+
+def _bucket(value: int) -> int:
+    if value < _SUB_COUNT:
+        return value
+    if value > _MAX_VALUE:
+        value = _MAX_VALUE
+    shift = value.bit_length() - _SUB_BITS
+    return shift * _HALF_COUNT + (value >> shift)
+
+
+def _bucket_range(idx: int) -> tuple[int, int]:
+    if idx < _SUB_COUNT:
+        return idx, idx + 1
+    shift = idx // _HALF_COUNT - 1
+    base = idx - shift * _HALF_COUNT
+    return base << shift, (base + 1) << shift
+
+
+# Stats reported as gauges in the OpenMetrics exposition. The other stats are
+# counters, with the exception of the durations, exported as summaries.
+_GAUGES = {
+    "pool_min",
+    "pool_max",
+    "pool_size",
+    "pool_available",
+    "requests_waiting",
+}
+
+_QUANTILES = (0.5, 0.95, 0.99)
+
+
+def format_openmetrics(pools: Iterable[BasePool], prefix: str = "psycopg_pool") -> str:
+    """
+    Return the stats of *pools* in the OpenMetrics text format.
+
+    The result can be returned by an HTTP endpoint scraped by Prometheus or
+    by any other monitoring system supporting the format. The samples of every
+    pool are labelled with the pool name. The durations are exported as
+    summaries, in seconds, with their 50th, 95th and 99th percentiles.
+
+    The stats are read using `~ConnectionPool.get_stats()`, therefore the
+    counters are not reset.
+    """
+    stats: dict[str, list[tuple[str, int]]] = {}
+    hists: dict[str, list[tuple[str, Histogram]]] = {}
+    for pool in pools:
+        label = _escape_label(pool.name)
+        pool_hists = pool.get_histograms()
+        for key, value in pool._stats.items():
+            if key not in pool_hists:
+                stats.setdefault(key, []).append((label, value))
+        for key, value in pool._get_measures().items():
+            stats.setdefault(key, []).append((label, value))
+        for key, hist in pool_hists.items():
+            hists.setdefault(key, []).append((label, hist))
+
+    lines = []
+    for key, samples in sorted(stats.items()):
+        name = f"{prefix}_{key}"
+        if key in _GAUGES:
+            lines.append(f"# TYPE {name} gauge")
+            for label, value in samples:
+                lines.append(f'{name}{{pool="{label}"}} {value}')
+        else:
+            lines.append(f"# TYPE {name} counter")
+            for label, value in samples:
+                lines.append(f'{name}_total{{pool="{label}"}} {value}')
+
+    for key, hsamples in sorted(hists.items()):
+        name = f"{prefix}_{key.removesuffix('_ms')}_seconds"
+        lines.append(f"# TYPE {name} summary")
+        lines.append(f"# UNIT {name} seconds")
+        for label, hist in hsamples:
+            for q in _QUANTILES:
+                qvalue = hist.percentile(q * 100.0) / 1000.0
+                lines.append(f'{name}{{pool="{label}",quantile="{q}"}} {qvalue}')
+            lines.append(f'{name}_sum{{pool="{label}"}} {hist.sum / 1000.0}')
+            lines.append(f'{name}_count{{pool="{label}"}} {hist.count}')
+
+    lines.append("# EOF\n")
+    return "\n".join(lines)
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import logging
 from typing import cast
+from collections.abc import Hashable
 
 from psycopg import Connection
 from psycopg.pq import TransactionStatus
@@ -18,8 +19,10 @@ from psycopg.pq import TransactionStatus
 from .abc import CT, ConnectFailedCB, ConnectionCB, ConninfoParam, KwargsParam
 from .pool import AddConnection, ConnectionPool
 from .errors import PoolTimeout, TooManyRequests
+from .warmup import WarmUp
 from ._compat import ConnectionTimeout
 from ._acompat import Event
+from .statements import StatementRegistry
 from .base_null_pool import _BaseNullConnectionPool
 
 logger = logging.getLogger("psycopg.pool")
@@ -39,6 +42,7 @@ class NullConnectionPool(_BaseNullConnectionPool, ConnectionPool[CT]):
         configure: ConnectionCB[CT] | None = None,
         check: ConnectionCB[CT] | None = None,
         reset: ConnectionCB[CT] | None = None,
+        reset_pipeline: bool = False,
         name: str | None = None,
         close_returns: bool = False,
         timeout: float = 30.0,
@@ -48,6 +52,8 @@ class NullConnectionPool(_BaseNullConnectionPool, ConnectionPool[CT]):
         reconnect_timeout: float = 5 * 60.0,
         reconnect_failed: ConnectFailedCB | None = None,
         num_workers: int = 3,
+        statements: StatementRegistry | None = None,
+        warmup: WarmUp | None = None,
     ):  # Note: min_size default value changed to 0.
 
         # close_returns=True makes no sense
@@ -58,6 +64,7 @@ class NullConnectionPool(_BaseNullConnectionPool, ConnectionPool[CT]):
             check=check,
             configure=configure,
             reset=reset,
+            reset_pipeline=reset_pipeline,
             kwargs=kwargs,
             min_size=min_size,
             max_size=max_size,
@@ -69,6 +76,8 @@ class NullConnectionPool(_BaseNullConnectionPool, ConnectionPool[CT]):
             max_idle=max_idle,
             reconnect_timeout=reconnect_timeout,
             num_workers=num_workers,
+            statements=statements,
+            warmup=warmup,
         )
 
     def wait(self, timeout: float = 30.0) -> None:
@@ -100,7 +109,9 @@ class NullConnectionPool(_BaseNullConnectionPool, ConnectionPool[CT]):
 
         logger.info("pool %r is ready to use", self.name)
 
-    def _get_ready_connection(self, timeout: float | None) -> CT | None:
+    def _get_ready_connection(
+        self, timeout: float | None, affinity: Hashable | None = None
+    ) -> CT | None:
         if timeout is not None and timeout <= 0.0:
             raise PoolTimeout()
 
@@ -162,12 +173,7 @@ class NullConnectionPool(_BaseNullConnectionPool, ConnectionPool[CT]):
         # Critical section: if there is a client waiting give it the connection
         # otherwise put it back into the pool.
         with self._lock:
-            while self._waiting:
-                # If there is a client waiting (which is still waiting and
-                # hasn't timed out), give it the connection and notify it.
-                if self._waiting.popleft().set(conn):
-                    break
-            else:
+            if not self._serve_waiting(conn):
                 # No client waiting for a connection: close the connection
                 self._close_connection(conn)
                 # If we have been asked to wait for pool init, notify the
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import logging
 from typing import cast
+from collections.abc import Hashable
 
 from psycopg import AsyncConnection
 from psycopg.pq import TransactionStatus
@@ -15,9 +16,11 @@ from psycopg.pq import TransactionStatus
 from .abc import ACT, AsyncConnectFailedCB, AsyncConnectionCB, AsyncConninfoParam
 from .abc import AsyncKwargsParam
 from .errors import PoolTimeout, TooManyRequests
+from .warmup import WarmUp
 from ._compat import ConnectionTimeout
 from ._acompat import AEvent
 from .pool_async import AddConnection, AsyncConnectionPool
+from .statements import StatementRegistry
 from .base_null_pool import _BaseNullConnectionPool
 
 logger = logging.getLogger("psycopg.pool")
@@ -37,6 +40,7 @@ class AsyncNullConnectionPool(_BaseNullConnectionPool, AsyncConnectionPool[ACT])
         configure: AsyncConnectionCB[ACT] | None = None,
         check: AsyncConnectionCB[ACT] | None = None,
         reset: AsyncConnectionCB[ACT] | None = None,
+        reset_pipeline: bool = False,
         name: str | None = None,
         close_returns: bool = False,
         timeout: float = 30.0,
@@ -46,6 +50,8 @@ class AsyncNullConnectionPool(_BaseNullConnectionPool, AsyncConnectionPool[ACT])
         reconnect_timeout: float = 5 * 60.0,
         reconnect_failed: AsyncConnectFailedCB | None = None,
         num_workers: int = 3,
+        statements: StatementRegistry | None = None,
+        warmup: WarmUp | None = None,
     ):
         super().__init__(
             conninfo,
@@ -54,6 +60,7 @@ class AsyncNullConnectionPool(_BaseNullConnectionPool, AsyncConnectionPool[ACT])
             check=check,
             configure=configure,
             reset=reset,
+            reset_pipeline=reset_pipeline,
             kwargs=kwargs,
             min_size=min_size,
             max_size=max_size,
@@ -65,6 +72,8 @@ class AsyncNullConnectionPool(_BaseNullConnectionPool, AsyncConnectionPool[ACT])
             max_idle=max_idle,
             reconnect_timeout=reconnect_timeout,
             num_workers=num_workers,
+            statements=statements,
+            warmup=warmup,
         )
 
     async def wait(self, timeout: float = 30.0) -> None:
@@ -96,7 +105,9 @@ class AsyncNullConnectionPool(_BaseNullConnectionPool, AsyncConnectionPool[ACT])
 
         logger.info("pool %r is ready to use", self.name)
 
-    async def _get_ready_connection(self, timeout: float | None) -> ACT | None:
+    async def _get_ready_connection(
+        self, timeout: float | None, affinity: Hashable | None = None
+    ) -> ACT | None:
         if timeout is not None and timeout <= 0.0:
             raise PoolTimeout()
 
@@ -159,12 +170,7 @@ class AsyncNullConnectionPool(_BaseNullConnectionPool, AsyncConnectionPool[ACT])
         # Critical section: if there is a client waiting give it the connection
         # otherwise put it back into the pool.
         async with self._lock:
-            while self._waiting:
-                # If there is a client waiting (which is still waiting and
-                # hasn't timed out), give it the connection and notify it.
-                if await self._waiting.popleft().set(conn):
-                    break
-            else:
+            if not await self._serve_waiting(conn):
                 # No client waiting for a connection: close the connection
                 await self._close_connection(conn)
                 # If we have been asked to wait for pool init, notify the
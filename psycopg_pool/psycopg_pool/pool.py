@@ -18,19 +18,25 @@ from typing import Any, Generic, cast
 from weakref import ref
 from contextlib import contextmanager
 from collections import deque
-from collections.abc import Iterator
+from collections.abc import Hashable, Iterator
 
-from psycopg import Connection
+from psycopg import Connection, Cursor
 from psycopg import errors as e
 from psycopg.pq import TransactionStatus
+from psycopg.rows import dict_row
+from psycopg.types import TypeInfo
 
 from .abc import CT, ConnectFailedCB, ConnectionCB, ConninfoParam, KwargsParam
-from .base import AttemptWithBackoff, BasePool
+from .base import CHECKOUT_POLICIES, AttemptWithBackoff, BasePool
 from .sched import Scheduler
 from .errors import PoolClosed, PoolTimeout, TooManyRequests
-from ._compat import PSYCOPG_VERSION, PoolConnection, Self
+from .warmup import TypeRegistration, WarmUp
+from ._compat import HAS_PIPELINE, HAS_PRELOAD_STATEMENTS, PSYCOPG_VERSION
+from ._compat import PoolConnection, Self
+from .scaling import DemandMeter, ScalingPolicy
 from ._acompat import Condition, Event, Lock, Queue, Worker, current_thread_name
 from ._acompat import gather, sleep, spawn
+from .statements import StatementRegistry
 
 CLIENT_EXCEPTIONS = Exception
 
@@ -52,6 +58,7 @@ class ConnectionPool(Generic[CT], BasePool):
         configure: ConnectionCB[CT] | None = None,
         check: ConnectionCB[CT] | None = None,
         reset: ConnectionCB[CT] | None = None,
+        reset_pipeline: bool = False,
         name: str | None = None,
         close_returns: bool = False,
         timeout: float = 30.0,
@@ -61,6 +68,12 @@ class ConnectionPool(Generic[CT], BasePool):
         reconnect_timeout: float = 5 * 60.0,
         reconnect_failed: ConnectFailedCB | None = None,
         num_workers: int = 3,
+        statements: StatementRegistry | None = None,
+        max_connecting: int = 1,
+        checkout: str = "fifo",
+        scaling: ScalingPolicy | None = None,
+        probe_interval: float | None = None,
+        warmup: WarmUp | None = None,
     ):
         if close_returns and PSYCOPG_VERSION < (3, 3):
             if connection_class is Connection:
@@ -69,12 +82,38 @@ class ConnectionPool(Generic[CT], BasePool):
                 raise TypeError(
                     "Using 'close_returns=True' and a non-standard 'connection_class' requires psycopg 3.3 or newer. Please check the docs at https://www.psycopg.org/psycopg3/docs/advanced/pool.html#pool-sqlalchemy for a workaround."
                 )
+        if statements is not None and (not HAS_PRELOAD_STATEMENTS):
+            raise TypeError("using 'statements' requires psycopg 3.4 or newer")
+        if checkout == "prepared" and (not HAS_PRELOAD_STATEMENTS):
+            raise TypeError("using checkout='prepared' requires psycopg 3.4 or newer")
+        if max_connecting < 1:
+            raise ValueError("max_connecting must be at least 1")
+        if checkout not in CHECKOUT_POLICIES:
+            raise ValueError(
+                f"checkout must be one of {', '.join(CHECKOUT_POLICIES)}; got {checkout!r}"
+            )
+        if probe_interval is not None and probe_interval <= 0.0:
+            raise ValueError("probe_interval must be greater than 0")
         self.conninfo = conninfo
         self.kwargs = kwargs
         self.connection_class = connection_class
         self._check = check
         self._configure = configure
         self._reset = reset
+        self.reset_pipeline = reset_pipeline
+        self.statements = statements
+        self.max_connecting = max_connecting
+        self.checkout = checkout
+        self.scaling = scaling
+        self._demand = DemandMeter(scaling) if scaling else None
+        self.probe_interval = probe_interval
+        self.warmup = warmup
+
+        # Information about the types to register, fetched by the warm-up.
+        self._type_infos: dict[str, TypeInfo] = {}
+
+        # Size chosen by the scaling policy, below which ShrinkPool won't go.
+        self._scale_target = 0
 
         self._reconnect_failed = reconnect_failed
 
@@ -165,74 +204,121 @@ class ConnectionPool(Generic[CT], BasePool):
         logger.info("pool %r is ready to use", self.name)
 
     @contextmanager
-    def connection(self, timeout: float | None = None) -> Iterator[CT]:
+    def connection(
+        self,
+        timeout: float | None = None,
+        affinity: Hashable | None = None,
+        priority: int = 0,
+        deadline: float | None = None,
+    ) -> Iterator[CT]:
         """Context manager to obtain a connection from the pool.
 
         Return the connection immediately if available, otherwise wait up to
         *timeout* or `self.timeout` seconds and throw `PoolTimeout` if a
         connection is not available in time.
 
+        If *affinity* is specified, prefer a connection last used with the
+        same affinity key, if one is available in the pool.
+
+        If the client needs to wait, it is served before the clients waiting
+        with a lower *priority*. If *deadline* is specified, as a value of
+        `time.monotonic()`, don't wait beyond it and throw `PoolTimeout` if it
+        has already passed, rather than returning a connection.
+
         Upon context exit, return the connection to the pool. Apply the normal
         :ref:`connection context behaviour <with-connection>` (commit/rollback
         the transaction in case of success/error). If the connection is no more
         in working state, replace it with a new one.
         """
-        conn = self.getconn(timeout=timeout)
+        conn = self.getconn(
+            timeout=timeout, affinity=affinity, priority=priority, deadline=deadline
+        )
         try:
             t0 = monotonic()
             with conn:
                 yield conn
         finally:
             self.putconn(conn)
-            t1 = monotonic()
-            self._stats[self._USAGE_MS] += int(1000.0 * (t1 - t0))
+            self._record_ms(self._USAGE_MS, t0, monotonic())
 
-    def getconn(self, timeout: float | None = None) -> CT:
+    def getconn(
+        self,
+        timeout: float | None = None,
+        affinity: Hashable | None = None,
+        priority: int = 0,
+        deadline: float | None = None,
+    ) -> CT:
         """Obtain a connection from the pool.
 
         You should preferably use `connection()`. Use this function only if
         it is not possible to use the connection as context manager.
 
+        See `connection()` for the meaning of the parameters.
+
         After using this function you *must* call a corresponding `putconn()`:
         failing to do so will deplete the pool. A depleted pool is a sad pool:
         you don't want a depleted pool.
         """
         if timeout is None:
             timeout = self.timeout
-        deadline = monotonic() + timeout
+        t0 = monotonic()
+        give_up_at = t0 + timeout
 
         logger.info("connection requested from %r", self.name)
         self._stats[self._REQUESTS_NUM] += 1
+        self._totals[self._REQUESTS_NUM] += 1
 
         self._check_open_getconn()
 
+        if deadline is not None:
+            if deadline <= monotonic():
+                self._stats[self._REQUESTS_SHED] += 1
+                self._stats[self._REQUESTS_ERRORS] += 1
+                raise PoolTimeout("the request deadline has already passed")
+            give_up_at = min(give_up_at, deadline)
+
         try:
-            return self._getconn_with_check_loop(deadline)
+            return self._getconn_with_check_loop(
+                give_up_at, affinity, priority, deadline
+            )
         # Re-raise the timeout exception presenting the user the global
-        # timeout, not the per-attempt one.
+        # timeout, not the per-attempt one, or the deadline if it came first.
         except PoolTimeout:
+            if give_up_at == deadline:
+                raise PoolTimeout(
+                    f"the request deadline has passed after {monotonic() - t0:.2f} sec"
+                ) from None
             raise PoolTimeout(
                 f"couldn't get a connection after {timeout:.2f} sec"
             ) from None
 
-    def _getconn_with_check_loop(self, deadline: float) -> CT:
+    def _getconn_with_check_loop(
+        self,
+        give_up_at: float,
+        affinity: Hashable | None = None,
+        priority: int = 0,
+        deadline: float | None = None,
+    ) -> CT:
         attempt: AttemptWithBackoff | None = None
 
         while True:
-            conn = self._getconn_unchecked(deadline - monotonic())
+            conn = self._getconn_unchecked(
+                give_up_at - monotonic(), affinity, priority, deadline
+            )
             try:
                 self._check_connection(conn)
             except CLIENT_EXCEPTIONS:
                 self._putconn(conn, from_getconn=True)
             else:
                 logger.info("connection given by %r", self.name)
+                self._nconns_out += 1
                 return conn
 
             # Delay further checks to avoid a busy loop, using the same
             # backoff policy used in reconnection attempts.
             now = monotonic()
             if not attempt:
-                attempt = AttemptWithBackoff(timeout=deadline - now)
+                attempt = AttemptWithBackoff(timeout=give_up_at - now)
             else:
                 attempt.update_delay(now)
 
@@ -241,15 +327,21 @@ class ConnectionPool(Generic[CT], BasePool):
             else:
                 sleep(attempt.delay)
 
-    def _getconn_unchecked(self, timeout: float) -> CT:
+    def _getconn_unchecked(
+        self,
+        timeout: float,
+        affinity: Hashable | None = None,
+        priority: int = 0,
+        deadline: float | None = None,
+    ) -> CT:
         # Critical section: decide here if there's a connection ready
         # or if the client needs to wait.
         with self._lock:
-            if not (conn := self._get_ready_connection(timeout)):
+            if not (conn := self._get_ready_connection(timeout, affinity)):
                 # No connection available: put the client in the waiting queue
                 t0 = monotonic()
-                pos: WaitingClient[CT] = WaitingClient()
-                self._waiting.append(pos)
+                pos: WaitingClient[CT] = WaitingClient(priority, deadline)
+                self._enqueue(pos)
                 self._stats[self._REQUESTS_QUEUED] += 1
 
                 # If there is space for the pool to grow, let's do it
@@ -262,18 +354,55 @@ class ConnectionPool(Generic[CT], BasePool):
                 conn = pos.wait(timeout=timeout)
             except CLIENT_EXCEPTIONS:
                 self._stats[self._REQUESTS_ERRORS] += 1
+                if deadline is not None and monotonic() >= deadline:
+                    self._stats[self._REQUESTS_SHED] += 1
                 raise
             finally:
-                t1 = monotonic()
-                self._stats[self._REQUESTS_WAIT_MS] += int(1000.0 * (t1 - t0))
+                self._record_ms(self._REQUESTS_WAIT_MS, t0, monotonic())
 
         # Tell the connection it belongs to a pool to avoid closing on __exit__
         # Note that this property shouldn't be set while the connection is in
         # the pool, to avoid to create a reference loop.
         conn._pool = self
+        if affinity is not None:
+            conn._affinity = affinity
         return conn
 
-    def _get_ready_connection(self, timeout: float | None) -> CT | None:
+    def _enqueue(self, pos: WaitingClient[CT]) -> None:
+        """
+        Add a client to the waiting queue.
+
+        The queue is sorted by decreasing priority; the clients with the same
+        priority are served in order of arrival.
+        """
+        i = len(self._waiting)
+        while i and self._waiting[i - 1].priority < pos.priority:
+            i -= 1
+        self._waiting.insert(i, pos)
+
+    def _serve_waiting(self, conn: CT) -> bool:
+        """
+        Give a connection to the first client waiting, if any.
+
+        Return True if a client has accepted the connection. Fail the clients
+        whose deadline has passed instead of serving them.
+        """
+        while self._waiting:
+            pos = self._waiting.popleft()
+            if pos.deadline is not None and pos.deadline <= monotonic():
+                pos.fail(PoolTimeout("the request deadline has passed"))
+                continue
+
+            # If there is a client waiting (which is still waiting and
+            # hasn't timed out), give it the connection and notify it.
+            if pos.set(conn):
+                return True
+
+        return False
+
+    def _get_ready_connection(
+        self, timeout: float | None, affinity: Hashable | None = None
+    ) -> CT | None:
         """Return a connection, if the client deserves one."""
         if timeout is not None and timeout <= 0.0:
             raise PoolTimeout()
@@ -281,7 +410,7 @@ class ConnectionPool(Generic[CT], BasePool):
         conn: CT | None = None
         if self._pool:
             # Take a connection ready out of the pool
-            conn = self._pool.popleft()
+            conn = self._pop_connection(affinity)
             if len(self._pool) < self._nconns_min:
                 self._nconns_min = len(self._pool)
         elif self.max_waiting and len(self._waiting) >= self.max_waiting:
@@ -291,24 +420,78 @@ class ConnectionPool(Generic[CT], BasePool):
             )
         return conn
 
+    def _pop_connection(self, affinity: Hashable | None = None) -> CT:
+        """
+        Remove a connection from the pool according to the checkout policy.
+
+        Connections are returned to the right of the pool, so the left end
+        holds the connections unused for the longest time, which are the ones
+        closed by `ShrinkPool`.
+        """
+        if affinity is not None:
+            # Choose the connection most recently used with the same key, if
+            # any, otherwise fall back to the checkout policy.
+            for i in range(len(self._pool) - 1, -1, -1):
+                if self._pool[i]._affinity == affinity:
+                    conn = self._pool[i]
+                    del self._pool[i]
+                    return conn
+
+        if self.checkout == "lifo":
+            return self._pool.pop()
+        elif self.checkout == "prepared":
+            # Choose the connection with the most prepared statements, the
+            # most recently returned in case of ties.
+            best = len(self._pool) - 1
+            nbest = len(self._pool[best]._prepared.prepared_keys())
+            for i in range(best - 1, -1, -1):
+                if (n := len(self._pool[i]._prepared.prepared_keys())) > nbest:
+                    best, nbest = (i, n)
+            conn = self._pool[best]
+            del self._pool[best]
+            return conn
+        else:
+            return self._pool.popleft()
+
     def _check_connection(self, conn: CT) -> None:
         if not self._check:
             return
+        t0 = monotonic()
         try:
             self._check(conn)
         except CLIENT_EXCEPTIONS as e:
             logger.info("connection failed check: %s", e)
             raise
+        finally:
+            self._record_ms(self._CHECKS_MS, t0, monotonic())
 
     def _maybe_grow_pool(self) -> None:
-        # Allow only one task at time to grow the pool (or returning
-        # connections might be starved).
-        if self._nconns >= self._max_size or self._growing:
+        # Allow only a few tasks at time to grow the pool (or returning
+        # connections might be starved). Start as many connection attempts as
+        # the clients waiting which won't be served by the attempts in progress.
+        if (ngrow := (self._max_growing() - self._growing)) <= 0:
             return
-        self._nconns += 1
+        ngrow = min(
+            ngrow,
+            self._max_size - self._nconns,
+            max(len(self._waiting), 1) - self._growing,
+        )
+        if ngrow <= 0:
+            return
+
+        self._nconns += ngrow
+        self._growing += ngrow
         logger.info("growing pool %r to %s", self.name, self._nconns)
-        self._growing = True
-        self.run_task(AddConnection(self, growing=True))
+        for _ in range(ngrow):
+            self.run_task(AddConnection(self, growing=True))
+
+    def _max_growing(self) -> int:
+        """
+        Return the max number of connection attempts to grow the pool at once.
+
+        Leave at least a worker free to return connections to the pool.
+        """
+        return max(1, min(self.max_connecting, self.num_workers - 1))
 
     def putconn(self, conn: CT) -> None:
         """Return a connection to the loving hands of its pool.
@@ -318,8 +501,12 @@ class ConnectionPool(Generic[CT], BasePool):
         """
         # Quick check to discard the wrong connection
         self._check_pool_putconn(conn)
+        self._nconns_out -= 1
 
         logger.info("returning connection to %r", self.name)
+        if self.statements is not None:
+            self.statements.record(conn._prepared.prepared_keys())
+
         if self._maybe_close_connection(conn):
             return
 
@@ -346,12 +533,19 @@ class ConnectionPool(Generic[CT], BasePool):
             self.run_task(AddConnection(self))
 
     def _putconn(self, conn: CT, from_getconn: bool) -> None:
-        # Use a worker to perform eventual maintenance work in a separate task
-        if self._reset:
+        # Use a worker to perform eventual maintenance work in a separate task,
+        # so that the client returning the connection doesn't wait for it.
+        # Connections which don't need maintenance are returned immediately,
+        # possibly straight to a client waiting.
+        if self._reset or self._needs_rollback(conn):
             self.run_task(ReturnConnection(self, conn, from_getconn=from_getconn))
         else:
             self._return_connection(conn, from_getconn=from_getconn)
 
+    def _needs_rollback(self, conn: CT) -> bool:
+        status = conn.pgconn.transaction_status
+        return status in (TransactionStatus.INTRANS, TransactionStatus.INERROR)
+
     def _maybe_close_connection(self, conn: CT) -> bool:
         """Close a returned connection if necessary.
 
@@ -434,6 +628,14 @@ class ConnectionPool(Generic[CT], BasePool):
         # remained unused.
         self.run_task(Schedule(self, ShrinkPool(self), self.max_idle))
 
+        # Schedule a task to adapt the pool size to the demand, if requested.
+        if self.scaling:
+            self.run_task(Schedule(self, AutoScale(self), self.scaling.interval))
+
+        # Schedule a task to discard the idle connections found broken.
+        if self.probe_interval:
+            self.run_task(Schedule(self, ProbeConnections(self), self.probe_interval))
+
     def close(self, timeout: float = 5.0) -> None:
         """Close the pool and make it unavailable to new clients.
 
@@ -555,6 +757,26 @@ class ConnectionPool(Generic[CT], BasePool):
             else:
                 self._add_to_pool(conn)
 
+    def _probe_pool(self) -> None:
+        """
+        Discard the connections in the pool found broken, and replace them.
+
+        The connections are probed without a round trip to the server, so
+        they can be probed holding the lock.
+        """
+        with self._lock:
+            broken = [conn for conn in self._pool if not self._probe_connection(conn)]
+            for conn in broken:
+                self._pool.remove(conn)
+            if len(self._pool) < self._nconns_min:
+                self._nconns_min = len(self._pool)
+
+        for conn in broken:
+            self._stats[self._CONNECTIONS_LOST] += 1
+            logger.warning("discarding broken connection: %s", conn)
+            self._close_connection(conn)
+            self.run_task(AddConnection(self))
+
     @staticmethod
     def check_connection(conn: CT) -> None:
         """
@@ -629,10 +851,13 @@ class ConnectionPool(Generic[CT], BasePool):
             self._stats[self._CONNECTIONS_ERRORS] += 1
             raise
         else:
-            t1 = monotonic()
-            self._stats[self._CONNECTIONS_MS] += int(1000.0 * (t1 - t0))
+            self._record_ms(self._CONNECTIONS_MS, t0, monotonic())
 
         conn._pool = self
+        conn._affinity = None
+
+        if self.warmup:
+            self._warm_up(conn)
 
         if self._configure:
             self._configure(conn)
@@ -642,10 +867,89 @@ class ConnectionPool(Generic[CT], BasePool):
                     f"connection left in status {sname} by configure function {self._configure}: discarded"
                 )
 
+        if self.statements is not None:
+            self._preload_statements(conn)
+
         # Set an expiry date, with some randomness to avoid mass reconnection
         self._set_connection_expiry_date(conn)
         return conn
 
+    def _warm_up(self, conn: CT) -> None:
+        """Prepare a new connection as described by the pool warm-up."""
+        assert self.warmup
+        fetch = [t for t in self.warmup.types if t.name not in self._type_infos]
+        if HAS_PIPELINE:
+            with conn.pipeline():
+                curs = self._send_warm_up(conn, fetch)
+        else:
+            curs = self._send_warm_up(conn, fetch)
+
+        for t, cur in zip(fetch, curs):
+            if info := t.info_class._from_records(t.name, cur.fetchall()):
+                self._type_infos[t.name] = info
+            else:
+                logger.warning("type %r not found: not registered on %s", t.name, conn)
+
+        for t in self.warmup.types:
+            if not (info := self._type_infos.get(t.name)):
+                continue
+            if t.register:
+                t.register(info, conn)
+            else:
+                info.register(conn)
+
+    def _send_warm_up(
+        self, conn: CT, types: list[TypeRegistration]
+    ) -> list[Cursor[dict[str, Any]]]:
+        """
+        Execute the warm-up commands and the queries to fetch *types*.
+
+        Return the cursors with the information about the types.
+        """
+        assert self.warmup
+        curs = []
+        with conn.transaction():
+            if types and conn.info.encoding == "ascii":
+                conn.execute("set local client_encoding to utf8")
+            if settings := self.warmup.settings:
+                conn.execute(
+                    "select set_config(name, value, false) from unnest(%s::text[], %s::text[]) as s (name, value)",
+                    [list(settings), list(settings.values())],
+                )
+            for command in self.warmup.commands:
+                conn.execute(command)
+            for t in types:
+                cur = conn.cursor(row_factory=dict_row)
+                cur.execute(t.info_class._get_info_query(conn), {"name": t.name})
+                curs.append(cur)
+
+        return curs
+
+    def _preload_statements(self, conn: CT) -> None:
+        """Prepare on a new connection the statements hot in the registry."""
+        assert self.statements is not None
+        if not (keys := self.statements.hot()):
+            return
+
+        nprep = len(conn._prepared.prepared_keys())
+        try:
+            with conn.lock:
+                failed = conn.wait(conn._prepared.preload_gen(conn, keys))
+        except CLIENT_EXCEPTIONS as ex:
+            logger.warning("error preparing statements on %s: %s", conn, ex)
+            return
+
+        if failed:
+            logger.warning(
+                "%s statements failed to prepare: discarded from %r",
+                len(failed),
+                self.statements,
+            )
+            self.statements.discard(failed)
+
+        nprep = len(conn._prepared.prepared_keys()) - nprep
+        self._stats[self._STATEMENTS_PREPARED] += nprep
+
     def _resolve_conninfo(self) -> str:
         """Resolve conninfo (static string, sync callable, or async callable)."""
         if callable(self.conninfo):
@@ -691,7 +995,7 @@ class ConnectionPool(Generic[CT], BasePool):
                     self._nconns -= 1
                     # If we have given up with a growing attempt, allow a new one.
                     if growing and self._growing:
-                        self._growing = False
+                        self._growing -= 1
                 self.reconnect_failed()
             else:
                 attempt.update_delay(now)
@@ -705,15 +1009,17 @@ class ConnectionPool(Generic[CT], BasePool):
         if growing:
             with self._lock:
                 # Keep on growing if the pool is not full yet, or if there are
-                # clients waiting and the pool can extend.
-                if self._nconns < self._min_size or (
-                    self._nconns < self._max_size and self._waiting
+                # clients waiting, not served by the other attempts in progress,
+                # and the pool can extend.
+                if self._nconns < max(self._min_size, self._scale_target) or (
+                    self._nconns < self._max_size
+                    and len(self._waiting) >= self._growing
                 ):
                     self._nconns += 1
                     logger.info("growing pool %r to %s", self.name, self._nconns)
                     self.run_task(AddConnection(self, growing=True))
                 else:
-                    self._growing = False
+                    self._growing -= 1
 
     def _return_connection(self, conn: CT, from_getconn: bool) -> None:
         """
@@ -776,13 +1082,7 @@ class ConnectionPool(Generic[CT], BasePool):
                 self._close_connection(conn)
                 return
 
-            while self._waiting:
-                # If there is a client waiting (which is still waiting and
-                # hasn't timed out), give it the connection and notify it.
-
-                if self._waiting.popleft().set(conn):
-                    break
-            else:
+            if not self._serve_waiting(conn):
                 # No client waiting for a connection: put it back into the pool
                 self._pool.append(conn)
                 # If we have been asked to wait for pool init, notify the
@@ -819,7 +1119,13 @@ class ConnectionPool(Generic[CT], BasePool):
 
         if self._reset:
             try:
-                self._reset(conn)
+                if self.reset_pipeline and HAS_PIPELINE:
+                    # Send the statements of the reset function to the server
+                    # in a single round trip.
+                    with conn.pipeline():
+                        self._reset(conn)
+                else:
+                    self._reset(conn)
                 if (status := conn.pgconn.transaction_status) != TransactionStatus.IDLE:
                     sname = TransactionStatus(status).name
                     raise e.ProgrammingError(
@@ -842,7 +1148,8 @@ class ConnectionPool(Generic[CT], BasePool):
             self._nconns_min = len(self._pool)
 
             # If the pool can shrink and connections were unused, drop one
-            if self._nconns > self._min_size and nconns_min > 0 and self._pool:
+            min_size = max(self._min_size, self._scale_target)
+            if self._nconns > min_size and nconns_min > 0 and self._pool:
                 to_close = self._pool.popleft()
                 self._nconns -= 1
                 self._nconns_min -= 1
@@ -857,6 +1164,49 @@ class ConnectionPool(Generic[CT], BasePool):
             )
             self._close_connection(to_close)
 
+    def _autoscale(self) -> None:
+        """
+        Measure the demand and grow or shrink the pool as the policy requires.
+
+        The pool grows to the target size with as many connection attempts
+        at once as growing on demand, and shrinks by one connection at time,
+        so that it doesn't drop connections which may be needed again soon.
+        """
+        assert self.scaling and self._demand
+        to_close: CT | None = None
+
+        with self._lock:
+            demand = self._demand.update(
+                now=monotonic(),
+                size=self._nconns,
+                in_use=self._nconns_out,
+                waiting=len(self._waiting),
+                totals=self._totals,
+            )
+            target = self.scaling.target_size(demand)
+            target = max(self._min_size, min(self._max_size, target))
+            self._scale_target = target
+
+            if target > self._nconns:
+                # The growing attempts keep on growing up to the target, so
+                # that connecting doesn't take all the workers.
+                ngrow = min(target - self._nconns, self._max_growing() - self._growing)
+                if ngrow > 0:
+                    self._nconns += ngrow
+                    self._growing += ngrow
+                    logger.info("autoscaling pool %r up to %s", self.name, self._nconns)
+                    for _ in range(ngrow):
+                        self.run_task(AddConnection(self, growing=True))
+            elif target < self._nconns and self._pool:
+                to_close = self._pool.popleft()
+                self._nconns -= 1
+                if len(self._pool) < self._nconns_min:
+                    self._nconns_min = len(self._pool)
+
+        if to_close:
+            logger.info("autoscaling pool %r down to %s", self.name, self._nconns)
+            self._close_connection(to_close)
+
     def _get_measures(self) -> dict[str, int]:
         rv = super()._get_measures()
         rv[self._REQUESTS_WAITING] = len(self._waiting)
@@ -866,11 +1216,13 @@ class ConnectionPool(Generic[CT], BasePool):
 class WaitingClient(Generic[CT]):
     """A position in a queue for a client waiting for a connection."""
 
-    __slots__ = ("conn", "error", "_cond")
+    __slots__ = ("conn", "error", "priority", "deadline", "_cond")
 
-    def __init__(self) -> None:
+    def __init__(self, priority: int = 0, deadline: float | None = None) -> None:
         self.conn: CT | None = None
         self.error: BaseException | None = None
+        self.priority = priority
+        self.deadline = deadline
 
         # The WaitingClient behaves in a way similar to an Event, but we need
         # to notify reliably the flagger that the waiter has "accepted" the
@@ -1022,6 +1374,30 @@ class ShrinkPool(MaintenanceTask):
         pool._shrink_pool()
 
 
+class AutoScale(MaintenanceTask):
+    """Adapt the size of the pool to the demand.
+
+    Re-schedule periodically, according to the pool scaling policy.
+    """
+
+    def _run(self, pool: ConnectionPool[Any]) -> None:
+        assert pool.scaling
+        pool.schedule_task(self, pool.scaling.interval)
+        pool._autoscale()
+
+
+class ProbeConnections(MaintenanceTask):
+    """Discard the broken connections in the pool.
+
+    Re-schedule periodically, every `!probe_interval` seconds.
+    """
+
+    def _run(self, pool: ConnectionPool[Any]) -> None:
+        assert pool.probe_interval
+        pool.schedule_task(self, pool.probe_interval)
+        pool._probe_pool()
+
+
 class Schedule(MaintenanceTask):
     """Schedule a task in the pool scheduler.
 
@@ -15,19 +15,25 @@ from typing import Any, Generic, cast
 from weakref import ref
 from contextlib import asynccontextmanager
 from collections import deque
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Hashable
 
-from psycopg import AsyncConnection
+from psycopg import AsyncConnection, AsyncCursor
 from psycopg import errors as e
 from psycopg.pq import TransactionStatus
+from psycopg.rows import dict_row
+from psycopg.types import TypeInfo
 
 from .abc import ACT, AsyncConnectFailedCB, AsyncConnectionCB, AsyncConninfoParam
 from .abc import AsyncKwargsParam
-from .base import AttemptWithBackoff, BasePool
+from .base import CHECKOUT_POLICIES, AttemptWithBackoff, BasePool
 from .errors import PoolClosed, PoolTimeout, TooManyRequests
-from ._compat import PSYCOPG_VERSION, AsyncPoolConnection, Self
+from .warmup import TypeRegistration, WarmUp
+from ._compat import HAS_PIPELINE, HAS_PRELOAD_STATEMENTS, PSYCOPG_VERSION
+from ._compat import AsyncPoolConnection, Self
+from .scaling import DemandMeter, ScalingPolicy
 from ._acompat import ACondition, AEvent, ALock, AQueue, AWorker, agather, asleep
 from ._acompat import aspawn, current_task_name, ensure_async
+from .statements import StatementRegistry
 from .sched_async import AsyncScheduler
 
 if True:  # ASYNC
@@ -58,6 +64,7 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
         configure: AsyncConnectionCB[ACT] | None = None,
         check: AsyncConnectionCB[ACT] | None = None,
         reset: AsyncConnectionCB[ACT] | None = None,
+        reset_pipeline: bool = False,
         name: str | None = None,
         close_returns: bool = False,
         timeout: float = 30.0,
@@ -67,6 +74,12 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
         reconnect_timeout: float = 5 * 60.0,
         reconnect_failed: AsyncConnectFailedCB | None = None,
         num_workers: int = 3,
+        statements: StatementRegistry | None = None,
+        max_connecting: int = 1,
+        checkout: str = "fifo",
+        scaling: ScalingPolicy | None = None,
+        probe_interval: float | None = None,
+        warmup: WarmUp | None = None,
     ):
         if close_returns and PSYCOPG_VERSION < (3, 3):
             if connection_class is AsyncConnection:
@@ -78,12 +91,39 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
                     " https://www.psycopg.org/psycopg3/docs/advanced/pool.html"
                     "#pool-sqlalchemy for a workaround."
                 )
+        if statements is not None and not HAS_PRELOAD_STATEMENTS:
+            raise TypeError("using 'statements' requires psycopg 3.4 or newer")
+        if checkout == "prepared" and not HAS_PRELOAD_STATEMENTS:
+            raise TypeError("using checkout='prepared' requires psycopg 3.4 or newer")
+        if max_connecting < 1:
+            raise ValueError("max_connecting must be at least 1")
+        if checkout not in CHECKOUT_POLICIES:
+            raise ValueError(
+                f"checkout must be one of {', '.join(CHECKOUT_POLICIES)};"
+                f" got {checkout!r}"
+            )
+        if probe_interval is not None and probe_interval <= 0.0:
+            raise ValueError("probe_interval must be greater than 0")
         self.conninfo = conninfo
         self.kwargs = kwargs
         self.connection_class = connection_class
         self._check = check
         self._configure = configure
         self._reset = reset
+        self.reset_pipeline = reset_pipeline
+        self.statements = statements
+        self.max_connecting = max_connecting
+        self.checkout = checkout
+        self.scaling = scaling
+        self._demand = DemandMeter(scaling) if scaling else None
+        self.probe_interval = probe_interval
+        self.warmup = warmup
+
+        # Information about the types to register, fetched by the warm-up.
+        self._type_infos: dict[str, TypeInfo] = {}
+
+        # Size chosen by the scaling policy, below which ShrinkPool won't go.
+        self._scale_target = 0
 
         self._reconnect_failed = reconnect_failed
 
@@ -201,75 +241,123 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
         logger.info("pool %r is ready to use", self.name)
 
     @asynccontextmanager
-    async def connection(self, timeout: float | None = None) -> AsyncIterator[ACT]:
+    async def connection(
+        self,
+        timeout: float | None = None,
+        affinity: Hashable | None = None,
+        priority: int = 0,
+        deadline: float | None = None,
+    ) -> AsyncIterator[ACT]:
         """Context manager to obtain a connection from the pool.
 
         Return the connection immediately if available, otherwise wait up to
         *timeout* or `self.timeout` seconds and throw `PoolTimeout` if a
         connection is not available in time.
 
+        If *affinity* is specified, prefer a connection last used with the
+        same affinity key, if one is available in the pool.
+
+        If the client needs to wait, it is served before the clients waiting
+        with a lower *priority*. If *deadline* is specified, as a value of
+        `time.monotonic()`, don't wait beyond it and throw `PoolTimeout` if it
+        has already passed, rather than returning a connection.
+
         Upon context exit, return the connection to the pool. Apply the normal
         :ref:`connection context behaviour <with-connection>` (commit/rollback
         the transaction in case of success/error). If the connection is no more
         in working state, replace it with a new one.
         """
-        conn = await self.getconn(timeout=timeout)
+        conn = await self.getconn(
+            timeout=timeout, affinity=affinity, priority=priority, deadline=deadline
+        )
         try:
             t0 = monotonic()
             async with conn:
                 yield conn
         finally:
             await self.putconn(conn)
-            t1 = monotonic()
-            self._stats[self._USAGE_MS] += int(1000.0 * (t1 - t0))
+            self._record_ms(self._USAGE_MS, t0, monotonic())
 
-    async def getconn(self, timeout: float | None = None) -> ACT:
+    async def getconn(
+        self,
+        timeout: float | None = None,
+        affinity: Hashable | None = None,
+        priority: int = 0,
+        deadline: float | None = None,
+    ) -> ACT:
         """Obtain a connection from the pool.
 
         You should preferably use `connection()`. Use this function only if
         it is not possible to use the connection as context manager.
 
+        See `connection()` for the meaning of the parameters.
+
         After using this function you *must* call a corresponding `putconn()`:
         failing to do so will deplete the pool. A depleted pool is a sad pool:
         you don't want a depleted pool.
         """
         if timeout is None:
             timeout = self.timeout
-        deadline = monotonic() + timeout
+        t0 = monotonic()
+        give_up_at = t0 + timeout
 
         logger.info("connection requested from %r", self.name)
         self._stats[self._REQUESTS_NUM] += 1
+        self._totals[self._REQUESTS_NUM] += 1
 
         self._check_open_getconn()
 
+        if deadline is not None:
+            if deadline <= monotonic():
+                self._stats[self._REQUESTS_SHED] += 1
+                self._stats[self._REQUESTS_ERRORS] += 1
+                raise PoolTimeout("the request deadline has already passed")
+            give_up_at = min(give_up_at, deadline)
+
         try:
-            return await self._getconn_with_check_loop(deadline)
+            return await self._getconn_with_check_loop(
+                give_up_at, affinity, priority, deadline
+            )
 
         # Re-raise the timeout exception presenting the user the global
-        # timeout, not the per-attempt one.
+        # timeout, not the per-attempt one, or the deadline if it came first.
         except PoolTimeout:
+            if give_up_at == deadline:
+                raise PoolTimeout(
+                    "the request deadline has passed after"
+                    f" {monotonic() - t0:.2f} sec"
+                ) from None
             raise PoolTimeout(
                 f"couldn't get a connection after {timeout:.2f} sec"
             ) from None
 
-    async def _getconn_with_check_loop(self, deadline: float) -> ACT:
+    async def _getconn_with_check_loop(
+        self,
+        give_up_at: float,
+        affinity: Hashable | None = None,
+        priority: int = 0,
+        deadline: float | None = None,
+    ) -> ACT:
         attempt: AttemptWithBackoff | None = None
 
         while True:
-            conn = await self._getconn_unchecked(deadline - monotonic())
+            conn = await self._getconn_unchecked(
+                give_up_at - monotonic(), affinity, priority, deadline
+            )
             try:
                 await self._check_connection(conn)
             except CLIENT_EXCEPTIONS:
                 await self._putconn(conn, from_getconn=True)
             else:
                 logger.info("connection given by %r", self.name)
+                self._nconns_out += 1
                 return conn
 
             # Delay further checks to avoid a busy loop, using the same
             # backoff policy used in reconnection attempts.
             now = monotonic()
             if not attempt:
-                attempt = AttemptWithBackoff(timeout=deadline - now)
+                attempt = AttemptWithBackoff(timeout=give_up_at - now)
             else:
                 attempt.update_delay(now)
 
@@ -278,15 +366,21 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
             else:
                 await asleep(attempt.delay)
 
-    async def _getconn_unchecked(self, timeout: float) -> ACT:
+    async def _getconn_unchecked(
+        self,
+        timeout: float,
+        affinity: Hashable | None = None,
+        priority: int = 0,
+        deadline: float | None = None,
+    ) -> ACT:
         # Critical section: decide here if there's a connection ready
         # or if the client needs to wait.
         async with self._lock:
-            if not (conn := (await self._get_ready_connection(timeout))):
+            if not (conn := (await self._get_ready_connection(timeout, affinity))):
                 # No connection available: put the client in the waiting queue
                 t0 = monotonic()
-                pos: WaitingClient[ACT] = WaitingClient()
-                self._waiting.append(pos)
+                pos: WaitingClient[ACT] = WaitingClient(priority, deadline)
+                self._enqueue(pos)
                 self._stats[self._REQUESTS_QUEUED] += 1
 
                 # If there is space for the pool to grow, let's do it
@@ -299,18 +393,55 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
                 conn = await pos.wait(timeout=timeout)
             except CLIENT_EXCEPTIONS:
                 self._stats[self._REQUESTS_ERRORS] += 1
+                if deadline is not None and monotonic() >= deadline:
+                    self._stats[self._REQUESTS_SHED] += 1
                 raise
             finally:
-                t1 = monotonic()
-                self._stats[self._REQUESTS_WAIT_MS] += int(1000.0 * (t1 - t0))
+                self._record_ms(self._REQUESTS_WAIT_MS, t0, monotonic())
 
         # Tell the connection it belongs to a pool to avoid closing on __exit__
         # Note that this property shouldn't be set while the connection is in
         # the pool, to avoid to create a reference loop.
         conn._pool = self
+        if affinity is not None:
+            conn._affinity = affinity
         return conn
 
-    async def _get_ready_connection(self, timeout: float | None) -> ACT | None:
+    def _enqueue(self, pos: WaitingClient[ACT]) -> None:
+        """
+        Add a client to the waiting queue.
+
+        The queue is sorted by decreasing priority; the clients with the same
+        priority are served in order of arrival.
+        """
+        i = len(self._waiting)
+        while i and self._waiting[i - 1].priority < pos.priority:
+            i -= 1
+        self._waiting.insert(i, pos)
+
+    async def _serve_waiting(self, conn: ACT) -> bool:
+        """
+        Give a connection to the first client waiting, if any.
+
+        Return True if a client has accepted the connection. Fail the clients
+        whose deadline has passed instead of serving them.
+        """
+        while self._waiting:
+            pos = self._waiting.popleft()
+            if pos.deadline is not None and pos.deadline <= monotonic():
+                await pos.fail(PoolTimeout("the request deadline has passed"))
+                continue
+
+            # If there is a client waiting (which is still waiting and
+            # hasn't timed out), give it the connection and notify it.
+            if await pos.set(conn):
+                return True
+
+        return False
+
+    async def _get_ready_connection(
+        self, timeout: float | None, affinity: Hashable | None = None
+    ) -> ACT | None:
         """Return a connection, if the client deserves one."""
         if timeout is not None and timeout <= 0.0:
             raise PoolTimeout()
@@ -318,7 +449,7 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
         conn: ACT | None = None
         if self._pool:
             # Take a connection ready out of the pool
-            conn = self._pool.popleft()
+            conn = self._pop_connection(affinity)
             if len(self._pool) < self._nconns_min:
                 self._nconns_min = len(self._pool)
         elif self.max_waiting and len(self._waiting) >= self.max_waiting:
@@ -329,24 +460,78 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
             )
         return conn
 
+    def _pop_connection(self, affinity: Hashable | None = None) -> ACT:
+        """
+        Remove a connection from the pool according to the checkout policy.
+
+        Connections are returned to the right of the pool, so the left end
+        holds the connections unused for the longest time, which are the ones
+        closed by `ShrinkPool`.
+        """
+        if affinity is not None:
+            # Choose the connection most recently used with the same key, if
+            # any, otherwise fall back to the checkout policy.
+            for i in range(len(self._pool) - 1, -1, -1):
+                if self._pool[i]._affinity == affinity:
+                    conn = self._pool[i]
+                    del self._pool[i]
+                    return conn
+
+        if self.checkout == "lifo":
+            return self._pool.pop()
+        elif self.checkout == "prepared":
+            # Choose the connection with the most prepared statements, the
+            # most recently returned in case of ties.
+            best = len(self._pool) - 1
+            nbest = len(self._pool[best]._prepared.prepared_keys())
+            for i in range(best - 1, -1, -1):
+                if (n := len(self._pool[i]._prepared.prepared_keys())) > nbest:
+                    best, nbest = i, n
+            conn = self._pool[best]
+            del self._pool[best]
+            return conn
+        else:
+            return self._pool.popleft()
+
     async def _check_connection(self, conn: ACT) -> None:
         if not self._check:
             return
+        t0 = monotonic()
         try:
             await self._check(conn)
         except CLIENT_EXCEPTIONS as e:
             logger.info("connection failed check: %s", e)
             raise
+        finally:
+            self._record_ms(self._CHECKS_MS, t0, monotonic())
 
     def _maybe_grow_pool(self) -> None:
-        # Allow only one task at time to grow the pool (or returning
-        # connections might be starved).
-        if self._nconns >= self._max_size or self._growing:
+        # Allow only a few tasks at time to grow the pool (or returning
+        # connections might be starved). Start as many connection attempts as
+        # the clients waiting which won't be served by the attempts in progress.
+        if (ngrow := self._max_growing() - self._growing) <= 0:
+            return
+        ngrow = min(
+            ngrow,
+            self._max_size - self._nconns,
+            max(len(self._waiting), 1) - self._growing,
+        )
+        if ngrow <= 0:
             return
-        self._nconns += 1
+
+        self._nconns += ngrow
+        self._growing += ngrow
         logger.info("growing pool %r to %s", self.name, self._nconns)
-        self._growing = True
-        self.run_task(AddConnection(self, growing=True))
+        for _ in range(ngrow):
+            self.run_task(AddConnection(self, growing=True))
+
+    def _max_growing(self) -> int:
+        """
+        Return the max number of connection attempts to grow the pool at once.
+
+        Leave at least a worker free to return connections to the pool.
+        """
+        return max(1, min(self.max_connecting, self.num_workers - 1))
 
     async def putconn(self, conn: ACT) -> None:
         """Return a connection to the loving hands of its pool.
@@ -356,8 +541,12 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
         """
         # Quick check to discard the wrong connection
         self._check_pool_putconn(conn)
+        self._nconns_out -= 1
 
         logger.info("returning connection to %r", self.name)
+        if self.statements is not None:
+            self.statements.record(conn._prepared.prepared_keys())
+
         if await self._maybe_close_connection(conn):
             return
 
@@ -384,12 +573,19 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
             self.run_task(AddConnection(self))
 
     async def _putconn(self, conn: ACT, from_getconn: bool) -> None:
-        # Use a worker to perform eventual maintenance work in a separate task
-        if self._reset:
+        # Use a worker to perform eventual maintenance work in a separate task,
+        # so that the client returning the connection doesn't wait for it.
+        # Connections which don't need maintenance are returned immediately,
+        # possibly straight to a client waiting.
+        if self._reset or self._needs_rollback(conn):
             self.run_task(ReturnConnection(self, conn, from_getconn=from_getconn))
         else:
             await self._return_connection(conn, from_getconn=from_getconn)
 
+    def _needs_rollback(self, conn: ACT) -> bool:
+        status = conn.pgconn.transaction_status
+        return status in (TransactionStatus.INTRANS, TransactionStatus.INERROR)
+
     async def _maybe_close_connection(self, conn: ACT) -> bool:
         """Close a returned connection if necessary.
 
@@ -479,6 +675,14 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
         # remained unused.
         self.run_task(Schedule(self, ShrinkPool(self), self.max_idle))
 
+        # Schedule a task to adapt the pool size to the demand, if requested.
+        if self.scaling:
+            self.run_task(Schedule(self, AutoScale(self), self.scaling.interval))
+
+        # Schedule a task to discard the idle connections found broken.
+        if self.probe_interval:
+            self.run_task(Schedule(self, ProbeConnections(self), self.probe_interval))
+
     async def close(self, timeout: float = 5.0) -> None:
         """Close the pool and make it unavailable to new clients.
 
@@ -600,6 +804,26 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
             else:
                 await self._add_to_pool(conn)
 
+    async def _probe_pool(self) -> None:
+        """
+        Discard the connections in the pool found broken, and replace them.
+
+        The connections are probed without a round trip to the server, so
+        they can be probed holding the lock.
+        """
+        async with self._lock:
+            broken = [conn for conn in self._pool if not self._probe_connection(conn)]
+            for conn in broken:
+                self._pool.remove(conn)
+            if len(self._pool) < self._nconns_min:
+                self._nconns_min = len(self._pool)
+
+        for conn in broken:
+            self._stats[self._CONNECTIONS_LOST] += 1
+            logger.warning("discarding broken connection: %s", conn)
+            await self._close_connection(conn)
+            self.run_task(AddConnection(self))
+
     @staticmethod
     async def check_connection(conn: ACT) -> None:
         """
@@ -684,10 +908,13 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
             self._stats[self._CONNECTIONS_ERRORS] += 1
             raise
         else:
-            t1 = monotonic()
-            self._stats[self._CONNECTIONS_MS] += int(1000.0 * (t1 - t0))
+            self._record_ms(self._CONNECTIONS_MS, t0, monotonic())
 
         conn._pool = self
+        conn._affinity = None
+
+        if self.warmup:
+            await self._warm_up(conn)
 
         if self._configure:
             await self._configure(conn)
@@ -698,10 +925,90 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
                     f" {self._configure}: discarded"
                 )
 
+        if self.statements is not None:
+            await self._preload_statements(conn)
+
         # Set an expiry date, with some randomness to avoid mass reconnection
         self._set_connection_expiry_date(conn)
         return conn
 
+    async def _warm_up(self, conn: ACT) -> None:
+        """Prepare a new connection as described by the pool warm-up."""
+        assert self.warmup
+        fetch = [t for t in self.warmup.types if t.name not in self._type_infos]
+        if HAS_PIPELINE:
+            async with conn.pipeline():
+                curs = await self._send_warm_up(conn, fetch)
+        else:
+            curs = await self._send_warm_up(conn, fetch)
+
+        for t, cur in zip(fetch, curs):
+            if info := t.info_class._from_records(t.name, await cur.fetchall()):
+                self._type_infos[t.name] = info
+            else:
+                logger.warning("type %r not found: not registered on %s", t.name, conn)
+
+        for t in self.warmup.types:
+            if not (info := self._type_infos.get(t.name)):
+                continue
+            if t.register:
+                t.register(info, conn)
+            else:
+                info.register(conn)
+
+    async def _send_warm_up(
+        self, conn: ACT, types: list[TypeRegistration]
+    ) -> list[AsyncCursor[dict[str, Any]]]:
+        """
+        Execute the warm-up commands and the queries to fetch *types*.
+
+        Return the cursors with the information about the types.
+        """
+        assert self.warmup
+        curs = []
+        async with conn.transaction():
+            if types and conn.info.encoding == "ascii":
+                await conn.execute("set local client_encoding to utf8")
+            if settings := self.warmup.settings:
+                await conn.execute(
+                    "select set_config(name, value, false)"
+                    " from unnest(%s::text[], %s::text[]) as s (name, value)",
+                    [list(settings), list(settings.values())],
+                )
+            for command in self.warmup.commands:
+                await conn.execute(command)
+            for t in types:
+                cur = conn.cursor(row_factory=dict_row)
+                await cur.execute(t.info_class._get_info_query(conn), {"name": t.name})
+                curs.append(cur)
+
+        return curs
+
+    async def _preload_statements(self, conn: ACT) -> None:
+        """Prepare on a new connection the statements hot in the registry."""
+        assert self.statements is not None
+        if not (keys := self.statements.hot()):
+            return
+
+        nprep = len(conn._prepared.prepared_keys())
+        try:
+            async with conn.lock:
+                failed = await conn.wait(conn._prepared.preload_gen(conn, keys))
+        except CLIENT_EXCEPTIONS as ex:
+            logger.warning("error preparing statements on %s: %s", conn, ex)
+            return
+
+        if failed:
+            logger.warning(
+                "%s statements failed to prepare: discarded from %r",
+                len(failed),
+                self.statements,
+            )
+            self.statements.discard(failed)
+
+        nprep = len(conn._prepared.prepared_keys()) - nprep
+        self._stats[self._STATEMENTS_PREPARED] += nprep
+
     async def _resolve_conninfo(self) -> str:
         """Resolve conninfo (static string, sync callable, or async callable)."""
         if callable(self.conninfo):
@@ -747,7 +1054,7 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
                     self._nconns -= 1
                     # If we have given up with a growing attempt, allow a new one.
                     if growing and self._growing:
-                        self._growing = False
+                        self._growing -= 1
                 await self.reconnect_failed()
             else:
                 attempt.update_delay(now)
@@ -761,15 +1068,17 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
         if growing:
             async with self._lock:
                 # Keep on growing if the pool is not full yet, or if there are
-                # clients waiting and the pool can extend.
-                if self._nconns < self._min_size or (
-                    self._nconns < self._max_size and self._waiting
+                # clients waiting, not served by the other attempts in progress,
+                # and the pool can extend.
+                if self._nconns < max(self._min_size, self._scale_target) or (
+                    self._nconns < self._max_size
+                    and len(self._waiting) >= self._growing
                 ):
                     self._nconns += 1
                     logger.info("growing pool %r to %s", self.name, self._nconns)
                     self.run_task(AddConnection(self, growing=True))
                 else:
-                    self._growing = False
+                    self._growing -= 1
 
     async def _return_connection(self, conn: ACT, from_getconn: bool) -> None:
         """
@@ -835,13 +1144,7 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
                 await self._close_connection(conn)
                 return
 
-            while self._waiting:
-                # If there is a client waiting (which is still waiting and
-                # hasn't timed out), give it the connection and notify it.
-
-                if await self._waiting.popleft().set(conn):
-                    break
-            else:
+            if not await self._serve_waiting(conn):
                 # No client waiting for a connection: put it back into the pool
                 self._pool.append(conn)
                 # If we have been asked to wait for pool init, notify the
@@ -880,7 +1183,13 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
 
         if self._reset:
             try:
-                await self._reset(conn)
+                if self.reset_pipeline and HAS_PIPELINE:
+                    # Send the statements of the reset function to the server
+                    # in a single round trip.
+                    async with conn.pipeline():
+                        await self._reset(conn)
+                else:
+                    await self._reset(conn)
                 if (status := conn.pgconn.transaction_status) != TransactionStatus.IDLE:
                     sname = TransactionStatus(status).name
                     raise e.ProgrammingError(
@@ -904,7 +1213,8 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
             self._nconns_min = len(self._pool)
 
             # If the pool can shrink and connections were unused, drop one
-            if self._nconns > self._min_size and nconns_min > 0 and self._pool:
+            min_size = max(self._min_size, self._scale_target)
+            if self._nconns > min_size and nconns_min > 0 and self._pool:
                 to_close = self._pool.popleft()
                 self._nconns -= 1
                 self._nconns_min -= 1
@@ -920,6 +1230,50 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
             )
             await self._close_connection(to_close)
 
+    async def _autoscale(self) -> None:
+        """
+        Measure the demand and grow or shrink the pool as the policy requires.
+
+        The pool grows to the target size with as many connection attempts
+        at once as growing on demand, and shrinks by one connection at time,
+        so that it doesn't drop connections which may be needed again soon.
+        """
+        assert self.scaling and self._demand
+        to_close: ACT | None = None
+
+        async with self._lock:
+            demand = self._demand.update(
+                now=monotonic(),
+                size=self._nconns,
+                in_use=self._nconns_out,
+                waiting=len(self._waiting),
+                totals=self._totals,
+            )
+            target = self.scaling.target_size(demand)
+            target = max(self._min_size, min(self._max_size, target))
+            self._scale_target = target
+
+            if target > self._nconns:
+                # The growing attempts keep on growing up to the target, so
+                # that connecting doesn't take all the workers.
+                ngrow = min(target - self._nconns, self._max_growing() - self._growing)
+                if ngrow > 0:
+                    self._nconns += ngrow
+                    self._growing += ngrow
+                    logger.info("autoscaling pool %r up to %s", self.name, self._nconns)
+                    for _ in range(ngrow):
+                        self.run_task(AddConnection(self, growing=True))
+
+            elif target < self._nconns and self._pool:
+                to_close = self._pool.popleft()
+                self._nconns -= 1
+                if len(self._pool) < self._nconns_min:
+                    self._nconns_min = len(self._pool)
+
+        if to_close:
+            logger.info("autoscaling pool %r down to %s", self.name, self._nconns)
+            await self._close_connection(to_close)
+
     def _get_measures(self) -> dict[str, int]:
         rv = super()._get_measures()
         rv[self._REQUESTS_WAITING] = len(self._waiting)
@@ -929,11 +1283,13 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
 class WaitingClient(Generic[ACT]):
     """A position in a queue for a client waiting for a connection."""
 
-    __slots__ = ("conn", "error", "_cond")
+    __slots__ = ("conn", "error", "priority", "deadline", "_cond")
 
-    def __init__(self) -> None:
+    def __init__(self, priority: int = 0, deadline: float | None = None) -> None:
         self.conn: ACT | None = None
         self.error: BaseException | None = None
+        self.priority = priority
+        self.deadline = deadline
 
         # The WaitingClient behaves in a way similar to an Event, but we need
         # to notify reliably the flagger that the waiter has "accepted" the
@@ -1084,6 +1440,30 @@ class ShrinkPool(MaintenanceTask):
         await pool._shrink_pool()
 
 
+class AutoScale(MaintenanceTask):
+    """Adapt the size of the pool to the demand.
+
+    Re-schedule periodically, according to the pool scaling policy.
+    """
+
+    async def _run(self, pool: AsyncConnectionPool[Any]) -> None:
+        assert pool.scaling
+        await pool.schedule_task(self, pool.scaling.interval)
+        await pool._autoscale()
+
+
+class ProbeConnections(MaintenanceTask):
+    """Discard the broken connections in the pool.
+
+    Re-schedule periodically, every `!probe_interval` seconds.
+    """
+
+    async def _run(self, pool: AsyncConnectionPool[Any]) -> None:
+        assert pool.probe_interval
+        await pool.schedule_task(self, pool.probe_interval)
+        await pool._probe_pool()
+
+
 class Schedule(MaintenanceTask):
     """Schedule a task in the pool scheduler.
 
@@ -0,0 +1,333 @@
+# WARNING: this file is auto-generated by 'async_to_sync.py'
+# from the original file 'routing_async.py'
+# DO NOT CHANGE! Change the original file instead.
+"""
+psycopg connection pool routing the clients to a primary or to its replicas.
+"""
+
+# Copyright (C) 2026 The Psycopg Team
+
+from __future__ import annotations
+
+import logging
+from time import monotonic
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Generic, cast
+from contextlib import contextmanager
+from collections.abc import Hashable, Iterator
+
+import psycopg
+from psycopg import Connection, Cursor
+from psycopg import errors as e
+from psycopg.conninfo import conninfo_to_dict, make_conninfo
+
+from .abc import CT
+from .pool import ConnectionPool
+from .errors import PoolClosed, PoolTimeout
+from ._compat import HAS_CONNINFO_ATTEMPTS, Self
+
+if TYPE_CHECKING:
+    from psycopg.abc import ConnDict
+
+logger = logging.getLogger("psycopg.pool")
+
+
+class RoutingConnectionPool(Generic[CT]):
+    """
+    A pool of connections to a primary server and to its replicas.
+    """
+
+    # Time, in seconds, a replica is not used after failing to serve a client.
+    FAILURE_TIMEOUT = 10.0
+
+    # Used to generate pool names
+    _num_pool = 0
+
+    def __init__(
+        self,
+        conninfo: str = "",
+        *,
+        connection_class: type[CT] = cast(type[CT], Connection),
+        kwargs: dict[str, Any] | None = None,
+        name: str | None = None,
+        fallback: bool = True,
+        **pool_kwargs: Any,
+    ):
+        if not HAS_CONNINFO_ATTEMPTS:
+            raise TypeError(
+                f"the routing pool is not supported by psycopg {psycopg.__version__}"
+            )
+        if "open" in pool_kwargs:
+            raise TypeError("the routing pool doesn't support the 'open' parameter")
+
+        if not name:
+            num = RoutingConnectionPool._num_pool = RoutingConnectionPool._num_pool + 1
+            name = f"routing-pool-{num}"
+
+        self.conninfo = conninfo
+        self.kwargs = kwargs
+        self.connection_class = connection_class
+        self.name = name
+        self.fallback = fallback
+        self._pool_kwargs = pool_kwargs
+
+        self._primary: ConnectionPool[CT] | None = None
+        self._replicas: list[ConnectionPool[CT]] = []
+
+        # Time of the last failure of the replicas, by pool name
+        self._failed_at: dict[str, float] = {}
+
+        self._opened = False
+        self._closed = True
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__module__}.{self.__class__.__name__} {self.name!r} at 0x{id(self):x}>"
+
+    @property
+    def closed(self) -> bool:
+        """`!True` if the pool is closed."""
+        return self._closed
+
+    @property
+    def primary(self) -> ConnectionPool[CT]:
+        """The pool of connections to the primary server."""
+        if not self._primary:
+            raise PoolClosed(f"the pool {self.name!r} is not open yet")
+        return self._primary
+
+    @property
+    def replicas(self) -> list[ConnectionPool[CT]]:
+        """The pools of connections to the replicas found on `open()`."""
+        return self._replicas[:]
+
+    def _pools(self) -> list[ConnectionPool[CT]]:
+        return ([self._primary] if self._primary else []) + self._replicas
+
+    def open(self, wait: bool = False, timeout: float = 30.0) -> None:
+        """Find the replicas among the hosts and open the sub-pools.
+
+        Every host specified in the connection string is probed: a sub-pool is
+        created for every host found in standby mode. The pool of the primary
+        uses the whole connection string with
+        ``target_session_attrs=read-write``, so that libpq finds the primary
+        among the hosts, even after a failover.
+
+        If *wait* is `!True`, wait up to *timeout* seconds for every sub-pool
+        to be ready (see `ConnectionPool.wait()`).
+        """
+        if not self._closed:
+            return
+        if self._opened:
+            raise e.OperationalError(
+                "pool has already been opened/closed and cannot be reused"
+            )
+
+        # Only the conninfo parameters identify the hosts: the other
+        # connection parameters are passed to the connections separately.
+        params = conninfo_to_dict(self.conninfo)
+        params.pop("target_session_attrs", None)
+        standbys = [
+            attempt
+            for attempt in psycopg.conninfo.conninfo_attempts(params)
+            if self._is_standby(attempt)
+        ]
+
+        self._primary = self._make_pool(
+            {**params, "target_session_attrs": "read-write"}, f"{self.name}-primary"
+        )
+        self._replicas = [
+            self._make_pool(attempt, f"{self.name}-replica-{i}")
+            for i, attempt in enumerate(standbys, 1)
+        ]
+        logger.info("pool %r found %s replicas", self.name, len(self._replicas))
+
+        self._opened = True
+        self._closed = False
+        for pool in self._pools():
+            pool.open()
+        if wait:
+            self.wait(timeout=timeout)
+
+    def _is_standby(self, attempt: ConnDict) -> bool:
+        """Return True if the host of a connection attempt is a standby."""
+        try:
+            conn = self.connection_class.connect(
+                make_conninfo("", **attempt), **self.kwargs or {}
+            )
+        except e.Error as ex:
+            logger.warning(
+                "pool %r couldn't probe host %r: %s", self.name, attempt.get("host"), ex
+            )
+            return False
+
+        try:
+            # Reported by the server without a query from PostgreSQL 14.
+            if (standby := conn.info.parameter_status("in_hot_standby")) is not None:
+                return standby == "on"
+            with Cursor(conn) as cur:
+                cur.execute("select pg_is_in_recovery()")
+                rec = cur.fetchone()
+                return bool(rec and rec[0])
+        except e.Error as ex:
+            logger.warning(
+                "pool %r couldn't probe host %r: %s", self.name, attempt.get("host"), ex
+            )
+            return False
+        finally:
+            conn.close()
+
+    def _make_pool(self, params: ConnDict, name: str) -> ConnectionPool[CT]:
+        return ConnectionPool(
+            make_conninfo("", **params),
+            connection_class=self.connection_class,
+            kwargs=self.kwargs,
+            name=name,
+            open=False,
+            **self._pool_kwargs,
+        )
+
+    def wait(self, timeout: float = 30.0) -> None:
+        """
+        Wait for the sub-pools to be full.
+
+        Close the pool, and raise `PoolTimeout`, if not ready within *timeout*
+        sec.
+        """
+        deadline = monotonic() + timeout
+        for pool in self._pools():
+            try:
+                pool.wait(timeout=max(0.0, deadline - monotonic()))
+            except PoolTimeout:
+                self.close()
+                raise
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Close the pool and all its sub-pools."""
+        if self._closed:
+            return
+        self._closed = True
+        for pool in self._pools():
+            pool.close(timeout=timeout)
+
+    def __enter__(self) -> Self:
+        self.open()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @contextmanager
+    def connection(
+        self,
+        readonly: bool = False,
+        timeout: float | None = None,
+        affinity: Hashable | None = None,
+        priority: int = 0,
+        deadline: float | None = None,
+    ) -> Iterator[CT]:
+        """Context manager to obtain a connection from the pool.
+
+        If *readonly* is `!True`, obtain the connection from the least loaded
+        replica, otherwise from the primary. See
+        `ConnectionPool.connection()` for the other parameters.
+        """
+        pool = self._route(readonly)
+        served = False
+        try:
+            with pool.connection(
+                timeout=timeout, affinity=affinity, priority=priority, deadline=deadline
+            ) as conn:
+                served = True
+                yield conn
+        except e.OperationalError:
+            if not served:
+                self._pool_failed(pool)
+            raise
+
+    def getconn(
+        self,
+        readonly: bool = False,
+        timeout: float | None = None,
+        affinity: Hashable | None = None,
+        priority: int = 0,
+        deadline: float | None = None,
+    ) -> CT:
+        """Obtain a connection from the pool.
+
+        See `connection()` for the meaning of the parameters. The connection
+        must be returned with `putconn()`.
+        """
+        pool = self._route(readonly)
+        try:
+            return pool.getconn(
+                timeout=timeout, affinity=affinity, priority=priority, deadline=deadline
+            )
+        except e.OperationalError:
+            self._pool_failed(pool)
+            raise
+
+    def putconn(self, conn: CT) -> None:
+        """Return a connection to the sub-pool it was obtained from."""
+        if (pool := getattr(conn, "_pool", None)) not in self._pools():
+            raise ValueError(
+                f"can't return connection to pool {self.name!r}, it doesn't come from it: {conn}"
+            )
+        assert pool
+        pool.putconn(conn)
+
+    def _route(self, readonly: bool) -> ConnectionPool[CT]:
+        """Choose the sub-pool to obtain a connection from."""
+        if self._closed:
+            if self._opened:
+                raise PoolClosed(f"the pool {self.name!r} is already closed")
+            else:
+                raise PoolClosed(f"the pool {self.name!r} is not open yet")
+
+        if not readonly:
+            return self.primary
+
+        # Prefer the replicas which haven't failed recently.
+        now = monotonic()
+        if replicas := [
+            pool
+            for pool in self._replicas
+            if self._failed_at.get(pool.name, 0.0) + self.FAILURE_TIMEOUT <= now
+        ]:
+            return min(replicas, key=self._load)
+
+        if self.fallback:
+            return self.primary
+        if not self._replicas:
+            raise PoolTimeout(f"the pool {self.name!r} has no replica")
+
+        # All the replicas failed recently: try the least loaded anyway.
+        return min(self._replicas, key=self._load)
+
+    @staticmethod
+    def _load(pool: ConnectionPool[Any]) -> float:
+        """Return the fraction of the pool capacity currently in use."""
+        return (pool._nconns_out + len(pool._waiting)) / pool.max_size
+
+    def _pool_failed(self, pool: ConnectionPool[CT]) -> None:
+        if pool in self._replicas:
+            logger.warning("pool %r failed to serve a connection", pool.name)
+            self._failed_at[pool.name] = monotonic()
+
+    def get_stats(self) -> dict[str, dict[str, int]]:
+        """
+        Return current stats about the usage of the sub-pools, by pool name.
+        """
+        return {pool.name: pool.get_stats() for pool in self._pools()}
+
+    def pop_stats(self) -> dict[str, dict[str, int]]:
+        """
+        Return current stats about the usage of the sub-pools, by pool name.
+
+        After the call, all the counters are reset to zero.
+        """
+        return {pool.name: pool.pop_stats() for pool in self._pools()}
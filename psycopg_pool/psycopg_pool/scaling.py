@@ -0,0 +1,163 @@
+"""
+Policies to adapt the size of a pool to the demand.
+"""
+
+# Copyright (C) 2026 The Psycopg Team
+
+from __future__ import annotations
+
+import math
+from abc import ABC, abstractmethod
+from typing import NamedTuple
+from collections.abc import Mapping
+
+
+class Demand(NamedTuple):
+    """
+    Measures of the demand of connections to a pool.
+
+    The values, except `!size`, are exponentially weighted moving averages of
+    the measures taken periodically by the pool.
+    """
+
+    size: int
+    """The number of connections currently managed by the pool."""
+
+    in_use: float
+    """The number of connections used by clients."""
+
+    waiting: float
+    """The number of clients waiting for a connection."""
+
+    requests_rate: float
+    """The number of connections requested per second."""
+
+    wait_ms: float
+    """The mean time waited by the clients for a connection."""
+
+    usage_ms: float
+    """The mean time of usage of a connection by a client."""
+
+
+class ScalingPolicy(ABC):
+    """
+    Choose the size of a pool according to the demand of connections.
+
+    The pool measures the demand every `interval` seconds, and passes it to
+    `target_size()`. The measures are smoothed as exponentially weighted
+    moving averages, with weight `smoothing` given to the latest measure.
+    """
+
+    interval: float = 2.0
+    smoothing: float = 0.3
+
+    @abstractmethod
+    def target_size(self, demand: Demand) -> int:
+        """
+        Return the number of connections the pool should have.
+
+        The value returned is clamped between the `!min_size` and `!max_size`
+        of the pool.
+        """
+        ...
+
+
+class DemandPolicy(ScalingPolicy):
+    """
+    Size the pool on the connections in use, plus some headroom.
+
+    The connections needed are estimated as the largest of the number of
+    connections in use and the product of the requests rate by the usage time
+    (Little's law), which accounts for the requests served between two
+    measures. The clients waiting are added to the estimate, which is
+    increased by a *headroom* fraction, so that the pool grows ahead of the
+    demand.
+    """
+
+    def __init__(
+        self, *, headroom: float = 0.2, interval: float = 2.0, smoothing: float = 0.3
+    ):
+        if headroom < 0.0:
+            raise ValueError(f"headroom must be at least 0, got {headroom}")
+        if interval <= 0.0:
+            raise ValueError(f"interval must be greater than 0, got {interval}")
+        if not 0.0 < smoothing <= 1.0:
+            raise ValueError(f"smoothing must be between 0 and 1, got {smoothing}")
+
+        self.headroom = headroom
+        self.interval = interval
+        self.smoothing = smoothing
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(headroom={self.headroom},"
+            f" interval={self.interval}, smoothing={self.smoothing})"
+        )
+
+    def target_size(self, demand: Demand) -> int:
+        load = max(demand.in_use, demand.requests_rate * demand.usage_ms / 1000.0)
+        # Round down tiny errors: 3.0000001 connections are 3, not 4.
+        return math.ceil(round((load + demand.waiting) * (1.0 + self.headroom), 6))
+
+
+class DemandMeter:
+    """
+    Keep the moving averages of the demand measures of a pool.
+
+    The pool passes to `update()` its current state and its *totals*: the
+    counters of the requests and the durations measured, never reset.
+    """
+
+    def __init__(self, policy: ScalingPolicy):
+        self.policy = policy
+        self._last: dict[str, float] | None = None
+        self._last_time = 0.0
+        self._values: dict[str, float] = {}
+
+    def update(
+        self,
+        now: float,
+        size: int,
+        in_use: int,
+        waiting: int,
+        totals: Mapping[str, float],
+    ) -> Demand:
+        """Add a new measure of the pool state and return the demand."""
+        last: Mapping[str, float]
+        elapsed = now - self._last_time
+        if self._last is None or elapsed <= 0.0:
+            last, elapsed = totals, 0.0
+        else:
+            last = self._last
+        self._last, self._last_time = dict(totals), now
+
+        def delta(key: str) -> float:
+            return totals.get(key, 0.0) - last.get(key, 0.0)
+
+        nreqs = delta("requests_num")
+        nused = delta("usage_ms_count")
+        self._update("in_use", in_use)
+        self._update("waiting", waiting)
+        self._update("requests_rate", nreqs / elapsed if elapsed else 0.0)
+        self._update("wait_ms", delta("requests_wait_ms") / nreqs if nreqs else None)
+        self._update("usage_ms", delta("usage_ms") / nused if nused else None)
+
+        return Demand(
+            size=size,
+            in_use=self._values["in_use"],
+            waiting=self._values["waiting"],
+            requests_rate=self._values["requests_rate"],
+            wait_ms=self._values.get("wait_ms", 0.0),
+            usage_ms=self._values.get("usage_ms", 0.0),
+        )
+
+    def _update(self, key: str, value: float | None) -> None:
+        # Keep the previous average if there is no new measure (for instance
+        # no connection was used, so there is no new usage time).
+        if value is None:
+            return
+        if (prev := self._values.get(key)) is None:
+            self._values[key] = value
+        else:
+            alpha = self.policy.smoothing
+            self._values[key] = alpha * value + (1.0 - alpha) * prev
@@ -0,0 +1,92 @@
+"""
+Registry of the statements prepared on the connections of a pool.
+"""
+
+# Copyright (C) 2026 The Psycopg Team
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import TypeAlias
+from collections import Counter
+from collections.abc import Iterable
+
+logger = logging.getLogger("psycopg.pool")
+
+# The same key used by psycopg to identify a prepared statement: the query,
+# converted to PostgreSQL format, and the oids of its parameters.
+Key: TypeAlias = tuple[bytes, tuple[int, ...]]
+
+
+class StatementRegistry:
+    """
+    Keep track of the statements most prepared on the connections of a pool.
+
+    When a connection is returned to a pool, the statements that psycopg has
+    prepared on it are recorded. The statements recorded at least *threshold*
+    times are considered "hot" and are prepared in advance on the new
+    connections created by the pool, so that they don't have to be executed
+    `~psycopg.Connection.prepare_threshold` times on every connection before
+    benefiting from being prepared.
+
+    The same registry can be shared by several pools, for instance pools
+    connecting to the same database with different parameters.
+    """
+
+    def __init__(self, max_size: int = 100, threshold: int = 1):
+        if max_size < 1:
+            raise ValueError(f"max_size must be greater than 0, got {max_size}")
+        if threshold < 1:
+            raise ValueError(f"threshold must be greater than 0, got {threshold}")
+
+        self.max_size = max_size
+        self.threshold = threshold
+        self._counts = Counter[Key]()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} {len(self._counts)} statements"
+            f" at 0x{id(self):x}>"
+        )
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def record(self, keys: Iterable[Key]) -> None:
+        """Record that the statements *keys* are prepared on a connection."""
+        with self._lock:
+            self._counts.update(keys)
+
+            # Don't let the registry grow indefinitely: drop the least used
+            # statements and age the others, so that statements used in the
+            # past don't prevail on the ones used now.
+            if len(self._counts) > 2 * self.max_size:
+                self._counts = Counter(
+                    {
+                        key: count // 2 + 1
+                        for key, count in self._counts.most_common(self.max_size)
+                    }
+                )
+
+    def hot(self) -> list[Key]:
+        """Return the keys of the statements to prepare, the most used first."""
+        with self._lock:
+            return [
+                key
+                for key, count in self._counts.most_common(self.max_size)
+                if count >= self.threshold
+            ]
+
+    def discard(self, keys: Iterable[Key]) -> None:
+        """Forget the statements *keys*, for instance because they fail to prepare."""
+        with self._lock:
+            for key in keys:
+                if self._counts.pop(key, None) is not None:
+                    logger.info("statement discarded from registry: %r", key[0])
+
+    def clear(self) -> None:
+        """Forget all the statements recorded."""
+        with self._lock:
+            self._counts.clear()
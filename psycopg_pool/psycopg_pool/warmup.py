@@ -0,0 +1,73 @@
+"""
+Declarative preparation of the connections created by a pool.
+"""
+
+# Copyright (C) 2026 The Psycopg Team
+
+from __future__ import annotations
+
+from typing import Any, NamedTuple
+from collections.abc import Callable, Iterable, Mapping
+
+from psycopg.abc import AdaptContext, Query
+from psycopg.types import TypeInfo
+
+
+class TypeRegistration(NamedTuple):
+    """
+    A database type to register on the connections of a pool.
+    """
+
+    name: str
+    """The name of the type to fetch, possibly schema-qualified."""
+
+    register: Callable[[Any, AdaptContext], Any] | None = None
+    """
+    The function to register the type on a connection, called with the
+    type information fetched and the connection, for instance
+    `~psycopg.types.hstore.register_hstore()`. If `!None`, call
+    `TypeInfo.register() <psycopg.types.TypeInfo.register>`.
+    """
+
+    info_class: type[TypeInfo] = TypeInfo
+    """
+    The class to fetch the type information with, for instance
+    `~psycopg.types.composite.CompositeInfo` for a composite type.
+    """
+
+
+class WarmUp:
+    """
+    Describe how to prepare the connections created by a pool.
+
+    The session *settings* are set, the *commands* are executed, and the
+    information about the *types* is fetched in a single batch, in pipeline
+    mode if supported, so that preparing a new connection costs a single round
+    trip to the server. The information about the types is fetched by the
+    first connection only, and reused by the following ones.
+    """
+
+    def __init__(
+        self,
+        *,
+        settings: Mapping[str, Any] | None = None,
+        types: Iterable[str | TypeRegistration | tuple[Any, ...]] = (),
+        commands: Iterable[Query] = (),
+    ):
+        self.settings = {name: str(value) for name, value in (settings or {}).items()}
+        self.types = [
+            (
+                TypeRegistration(t)
+                if isinstance(t, str)
+                else t if isinstance(t, TypeRegistration) else TypeRegistration(*t)
+            )
+            for t in types
+        ]
+        self.commands = list(commands)
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} {len(self.settings)} settings,"
+            f" {len(self.types)} types, {len(self.commands)} commands"
+            f" at 0x{id(self):x}>"
+        )
@@ -0,0 +1,109 @@
+import pytest
+
+try:
+    import psycopg_pool as pool
+    from psycopg_pool import Histogram
+    from psycopg_pool.metrics import format_openmetrics
+except ImportError:
+    # Tests should have been skipped if the package is not available
+    pass
+
+
+def test_empty():
+    h = Histogram()
+    assert h.count == 0
+    assert h.p50 == h.p95 == h.p99 == 0.0
+
+
+@pytest.mark.parametrize("value", [0.0, 0.001, 0.05, 0.5, 3.0, 150.0, 42_000.0, 1e6])
+def test_single_value(value):
+    h = Histogram()
+    h.record(value)
+    assert h.count == 1
+    assert h.max == h.sum == value
+    assert h.p50 == pytest.approx(value, rel=0.03, abs=0.001)
+
+
+def test_percentiles():
+    h = Histogram()
+    for i in range(1, 1001):
+        h.record(i / 10)
+    assert h.count == 1000
+    assert h.sum == pytest.approx(50050.0)
+    assert h.max == 100.0
+    assert h.p50 == pytest.approx(50.0, rel=0.03)
+    assert h.p95 == pytest.approx(95.0, rel=0.03)
+    assert h.p99 == pytest.approx(99.0, rel=0.03)
+    assert h.percentile(100) == 100.0
+    assert h.percentile(0) == pytest.approx(0.1, rel=0.03)
+
+
+def test_tail():
+    h = Histogram()
+    for i in range(980):
+        h.record(1.0)
+    for i in range(20):
+        h.record(500.0)
+    assert h.p50 == pytest.approx(1.0, rel=0.03)
+    assert h.p95 == pytest.approx(1.0, rel=0.03)
+    assert h.p99 == pytest.approx(500.0, rel=0.03)
+
+
+def test_out_of_range():
+    h = Histogram()
+    for i in range(100):
+        h.record(-1.0)
+    for i in range(100):
+        h.record(1e12)
+    assert h.count == 200
+    assert h.p50 == pytest.approx(0.0, abs=0.001)
+    assert h.percentile(100) == 1e12
+    assert h.p99 == pytest.approx(2**36 / 1000, rel=0.03)
+
+
+@pytest.mark.parametrize("pc", [-1, 101])
+def test_bad_percentile(pc):
+    with pytest.raises(ValueError):
+        Histogram().percentile(pc)
+
+
+def test_copy():
+    h = Histogram()
+    h.record(10.0)
+    h2 = h.copy()
+    h.record(20.0)
+    assert h2.count == 1
+    assert h2.max == 10.0
+    assert h.count == 2
+
+
+def test_openmetrics(dsn):
+    with pool.ConnectionPool(dsn, min_size=1, name="p1") as p1, pool.ConnectionPool(
+        dsn, min_size=1, name='p"2'
+    ) as p2:
+        for i in range(3):
+            with p1.connection() as conn:
+                conn.execute("select 1")
+
+        out = format_openmetrics([p1, p2])
+
+    lines = out.splitlines()
+    assert lines[-1] == "# EOF"
+    assert out.endswith("\n")
+    assert "# TYPE psycopg_pool_pool_size gauge" in lines
+    assert 'psycopg_pool_pool_size{pool="p1"} 1' in lines
+    assert 'psycopg_pool_pool_size{pool="p\\"2"} 1' in lines
+    assert "# TYPE psycopg_pool_requests_num counter" in lines
+    assert 'psycopg_pool_requests_num_total{pool="p1"} 3' in lines
+    assert "# TYPE psycopg_pool_usage_seconds summary" in lines
+    assert "# UNIT psycopg_pool_usage_seconds seconds" in lines
+    assert 'psycopg_pool_usage_seconds_count{pool="p1"} 3' in lines
+    assert 'psycopg_pool_usage_seconds_count{pool="p\\"2"} 0' in lines
+    for q in ("0.5", "0.95", "0.99"):
+        prefix = f'psycopg_pool_usage_seconds{{pool="p1",quantile="{q}"}} '
+        assert [line for line in lines if line.startswith(prefix)]
+    assert not [line for line in lines if line.startswith("psycopg_pool_usage_ms")]
+
+    # Every family is declared once
+    types = [line for line in lines if line.startswith("# TYPE")]
+    assert len(types) == len(set(types))
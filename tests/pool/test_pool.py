@@ -5,7 +5,7 @@ from __future__ import annotations
 
 import logging
 import weakref
-from time import time
+from time import monotonic, time
 from typing import Any
 from collections import Counter
 
@@ -367,6 +367,108 @@ def test_fail_rollback_close(dsn, caplog, monkeypatch):
     assert "BAD" in caplog.records[2].message
 
 
+@pytest.mark.crdb_skip("backend pid")
+@pytest.mark.parametrize("status", ["INTRANS", "INERROR"])
+def test_rollback_reset(dsn, caplog, status):
+    caplog.set_level(logging.WARNING, logger="psycopg.pool")
+    pipelined = []
+
+    def reset(conn):
+        pipelined.append(conn._pipeline is not None)
+        assert conn.info.transaction_status == TransactionStatus.IDLE
+        with conn.transaction():
+            conn.execute("set timezone to utc")
+            conn.execute("discard temp")
+
+    with pool.ConnectionPool(dsn, min_size=1, reset=reset) as p:
+        conn = p.getconn()
+        pid = conn.info.backend_pid
+        conn.execute("create temp table test_rollback_reset ()")
+        conn.commit()
+        if status == "INTRANS":
+            conn.execute("select 1")
+        else:
+            with pytest.raises(psycopg.ProgrammingError):
+                conn.execute("wat")
+        assert conn.info.transaction_status == getattr(TransactionStatus, status)
+        p.putconn(conn)
+
+        with p.connection() as conn2:
+            assert conn2.info.backend_pid == pid
+            assert conn2.info.transaction_status == TransactionStatus.IDLE
+            cur = conn2.execute(
+                "select 1 from pg_class where relname = 'test_rollback_reset'"
+            )
+            assert not cur.fetchone()
+
+    # The reset function is not called in pipeline mode if not requested.
+    assert pipelined == [False]
+    assert len(caplog.records) == 1
+    assert status in caplog.records[0].message
+
+
+@pytest.mark.crdb_skip("backend pid")
+@pytest.mark.parametrize("status", ["IDLE", "INTRANS", "INERROR"])
+def test_reset_pipeline(dsn, caplog, status):
+    caplog.set_level(logging.WARNING, logger="psycopg.pool")
+    pipelined = []
+
+    def reset(conn):
+        pipelined.append(conn._pipeline is not None)
+        assert conn.info.transaction_status == TransactionStatus.IDLE
+        with conn.transaction():
+            conn.execute("set timezone to utc")
+            conn.execute("discard temp")
+
+    with pool.ConnectionPool(dsn, min_size=1, reset=reset, reset_pipeline=True) as p:
+        conn = p.getconn()
+        pid = conn.info.backend_pid
+        conn.execute("create temp table test_reset_pipeline ()")
+        conn.commit()
+        if status == "INTRANS":
+            conn.execute("select 1")
+        elif status == "INERROR":
+            with pytest.raises(psycopg.ProgrammingError):
+                conn.execute("wat")
+        assert conn.info.transaction_status == getattr(TransactionStatus, status)
+        p.putconn(conn)
+
+        with p.connection() as conn2:
+            assert conn2.info.backend_pid == pid
+            assert conn2.info.transaction_status == TransactionStatus.IDLE
+            cur = conn2.execute(
+                "select 1 from pg_class where relname = 'test_reset_pipeline'"
+            )
+            assert not cur.fetchone()
+
+    # The reset function is pipelined however the connection was returned.
+    assert pipelined == [psycopg.Pipeline.is_supported()]
+    assert len(caplog.records) == (status != "IDLE")
+
+
+@pytest.mark.crdb_skip("backend pid")
+def test_rollback_reset_broken(dsn, caplog):
+    caplog.set_level(logging.WARNING, logger="psycopg.pool")
+
+    def reset(conn):
+        conn.execute("WAT")
+
+    with pool.ConnectionPool(dsn, min_size=1, reset=reset) as p:
+        conn = p.getconn()
+        pid = conn.info.backend_pid
+        conn.execute("select 1")
+        assert conn.info.transaction_status == TransactionStatus.INTRANS
+        p.putconn(conn)
+
+        with p.connection() as conn2:
+            assert conn2.info.backend_pid != pid
+            assert conn2.info.transaction_status == TransactionStatus.IDLE
+
+    assert len(caplog.records) >= 2
+    assert "INTRANS" in caplog.records[0].message
+    assert "WAT" in caplog.records[1].message
+
+
 def test_del_no_warning(dsn, recwarn, gc_collect):
     p = pool.ConnectionPool(dsn, min_size=2, open=False)
     p.open()
@@ -448,6 +550,153 @@ def test_grow(dsn, monkeypatch, min_size, want_times):
         assert got == pytest.approx(want, 0.1), times
 
 
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    "max_connecting, num_workers, want", [(1, 3, 1), (3, 4, 3), (3, 3, 2), (8, 4, 3)]
+)
+def test_grow_max_connecting(dsn, monkeypatch, max_connecting, num_workers, want):
+    connecting = []
+    inflight = 0
+
+    def connect_delay(*args, **kwargs):
+        nonlocal inflight
+        inflight += 1
+        connecting.append(inflight)
+        try:
+            sleep(0.1)
+            return connect_orig(*args, **kwargs)
+        finally:
+            inflight -= 1
+
+    connect_orig = psycopg.Connection.connect
+    monkeypatch.setattr(psycopg.Connection, "connect", connect_delay)
+
+    def worker():
+        with p.connection() as conn:
+            conn.execute("select pg_sleep(0.2)")
+
+    with pool.ConnectionPool(
+        dsn,
+        min_size=0,
+        max_size=6,
+        num_workers=num_workers,
+        max_connecting=max_connecting,
+    ) as p:
+        ts = [spawn(worker) for i in range(6)]
+        gather(*ts)
+
+    assert max(connecting) == want
+
+
+@pytest.mark.parametrize("checkout, want", [("fifo", 0), ("lifo", 2)])
+def test_checkout(dsn, checkout, want):
+    with pool.ConnectionPool(dsn, min_size=3, checkout=checkout) as p:
+        p.wait()
+        conns = [p.getconn() for i in range(3)]
+        pids = [conn.info.backend_pid for conn in conns]
+        for conn in conns:
+            p.putconn(conn)
+        p.wait()
+
+        with p.connection() as conn:
+            assert conn.info.backend_pid == pids[want]
+
+
+def test_checkout_lifo_hot(dsn):
+    with pool.ConnectionPool(dsn, min_size=3, checkout="lifo") as p:
+        p.wait()
+        pids = set()
+        for i in range(5):
+            with p.connection() as conn:
+                pids.add(conn.info.backend_pid)
+            p.wait()
+
+    assert len(pids) == 1
+
+
+@pytest.mark.skipif(PSYCOPG_VERSION < (3, 4), reason="psycopg >= 3.4 feature")
+def test_checkout_prepared(dsn):
+    with pool.ConnectionPool(dsn, min_size=3, checkout="prepared") as p:
+        p.wait()
+        conns = [p.getconn() for i in range(3)]
+        conns[1].execute("select 1", prepare=True)
+        conns[1].commit()
+        pid = conns[1].info.backend_pid
+        for conn in conns:
+            p.putconn(conn)
+        p.wait()
+
+        for i in range(3):
+            with p.connection() as conn:
+                assert conn.info.backend_pid == pid
+            p.wait()
+
+
+@pytest.mark.parametrize("checkout", ["fifo", "lifo"])
+def test_affinity(dsn, checkout):
+    with pool.ConnectionPool(dsn, min_size=3, checkout=checkout) as p:
+        p.wait()
+        pids: dict[str, int] = {}
+        for key in ["a", "b", "a", "c", "b", "a", None, "c"]:
+            with p.connection(affinity=key) as conn:
+                pid = conn.info.backend_pid
+            if key is None:
+                continue
+            assert pids.setdefault(key, pid) == pid
+
+    if checkout == "fifo":
+        assert len(set(pids.values())) == 3
+
+
+def test_affinity_busy(dsn):
+    with pool.ConnectionPool(dsn, min_size=2) as p:
+        p.wait()
+        with p.connection(affinity=1) as conn1:
+            pid1 = conn1.info.backend_pid
+
+        with p.connection(affinity=1) as conn1:
+            assert conn1.info.backend_pid == pid1
+            # The connection is busy: get another one without waiting
+            with p.connection(timeout=0.5, affinity=1) as conn2:
+                assert conn2.info.backend_pid != pid1
+
+        # The connection returned last with the key is preferred
+        with p.connection(affinity=1) as conn:
+            assert conn.info.backend_pid == pid1
+
+
+def test_shed_expired_waiting(dsn):
+    with pool.ConnectionPool(dsn, min_size=1) as p:
+        conn = p.getconn()
+
+        # A client whose deadline passed while queued is not served
+        expired: pool.pool.WaitingClient[Any]
+        expired = pool.pool.WaitingClient(deadline=monotonic() - 1.0)
+        p._enqueue(expired)
+        p.putconn(conn)
+
+        assert isinstance(expired.error, pool.PoolTimeout)
+        assert expired.conn is None
+        assert not p._waiting
+        assert len(p._pool) == 1
+
+
+@pytest.mark.skipif(PSYCOPG_VERSION >= (3, 4), reason="psycopg < 3.4 behaviour")
+def test_checkout_prepared_unsupported(dsn):
+    with pytest.raises(TypeError, match="3.4"):
+        pool.ConnectionPool(dsn, checkout="prepared", open=False)
+
+
+def test_checkout_bad(dsn):
+    with pytest.raises(ValueError, match="checkout"):
+        pool.ConnectionPool(dsn, checkout="random", open=False)
+
+
+def test_max_connecting_bad(dsn):
+    with pytest.raises(ValueError):
+        pool.ConnectionPool(dsn, max_connecting=0, open=False)
+
+
 @pytest.mark.slow
 @pytest.mark.timing
 def test_shrink(dsn, monkeypatch):
@@ -480,6 +729,119 @@ def test_shrink(dsn, monkeypatch):
     assert results == [(4, 4), (4, 3), (3, 2), (2, 2), (2, 2)]
 
 
+def fixed_policy(size: int) -> Any:
+
+    class FixedPolicy(pool.ScalingPolicy):
+        interval = 0.1
+
+        def __init__(self) -> None:
+            self.size = size
+            self.demands: list[pool.Demand] = []
+
+        def target_size(self, demand: pool.Demand) -> int:
+            self.demands.append(demand)
+            return self.size
+
+    return FixedPolicy()
+
+
+@pytest.mark.slow
+@pytest.mark.timing
+def test_autoscale(dsn):
+    policy = fixed_policy(4)
+    with pool.ConnectionPool(dsn, min_size=1, max_size=6, scaling=policy) as p:
+        p.wait(5.0)
+        sleep(0.5)
+        assert p.get_stats()["pool_size"] == 4
+        assert p.get_stats()["pool_available"] == 4
+
+        policy.size = 10
+        sleep(0.5)
+        assert p.get_stats()["pool_size"] == 6
+
+        # The pool shrinks one connection per interval, down to min_size
+        policy.size = 0
+        sleep(0.15)
+        assert 4 <= p.get_stats()["pool_size"] < 6
+        sleep(0.6)
+        assert p.get_stats()["pool_size"] == 1
+
+    assert policy.demands
+    assert all((d.size <= 6 for d in policy.demands))
+
+
+@pytest.mark.slow
+def test_autoscale_max_connecting(dsn, monkeypatch):
+    connecting = []
+    inflight = 0
+
+    def connect_delay(*args, **kwargs):
+        nonlocal inflight
+        inflight += 1
+        connecting.append(inflight)
+        try:
+            sleep(0.05)
+            return connect_orig(*args, **kwargs)
+        finally:
+            inflight -= 1
+
+    connect_orig = psycopg.Connection.connect
+    monkeypatch.setattr(psycopg.Connection, "connect", connect_delay)
+
+    policy = fixed_policy(1)
+    with pool.ConnectionPool(
+        dsn, min_size=1, max_size=6, max_connecting=1, scaling=policy
+    ) as p:
+        p.wait(5.0)
+        policy.size = 5
+        for i in range(50):
+            sleep(0.1)
+            if p.get_stats()["pool_available"] == 5:
+                break
+
+        stats = p.get_stats()
+        assert stats["pool_size"] == 5
+        assert stats["pool_available"] == 5
+        assert p._growing == 0
+
+    assert len(connecting) == 5
+    assert max(connecting) == 1
+
+
+@pytest.mark.slow
+@pytest.mark.timing
+def test_autoscale_demand(dsn):
+    policy = fixed_policy(1)
+
+    def worker():
+        with p.connection() as conn:
+            conn.execute("select pg_sleep(0.2)")
+
+    with pool.ConnectionPool(dsn, min_size=1, max_size=6, scaling=policy) as p:
+        p.wait(5.0)
+        sleep(0.3)
+        ts = [spawn(worker) for i in range(4)]
+        gather(*ts)
+        sleep(0.3)
+
+    demands = policy.demands
+    assert max((d.in_use for d in demands)) > 1.0
+    assert max((d.requests_rate for d in demands)) > 0.0
+    assert max((d.usage_ms for d in demands)) >= 150.0
+
+
+@pytest.mark.slow
+@pytest.mark.timing
+def test_autoscale_no_shrink(dsn):
+    # ShrinkPool doesn't drop the connections the scaling policy asked for
+    with pool.ConnectionPool(
+        dsn, min_size=1, max_size=4, max_idle=0.2, scaling=fixed_policy(3)
+    ) as p:
+        p.wait(5.0)
+        sleep(1.0)
+        assert p.get_stats()["pool_size"] == 3
+
+
 @pytest.mark.slow
 @pytest.mark.timing
 def test_reconnect(proxy, caplog, monkeypatch):
@@ -785,6 +1147,57 @@ def test_connect_check(dsn, caplog, autocommit):
     assert not caplog.records
 
 
+@pytest.mark.slow
+@pytest.mark.crdb_skip("pg_terminate_backend")
+def test_probe(dsn, caplog):
+    caplog.set_level(logging.WARNING, logger="psycopg.pool")
+
+    with pool.ConnectionPool(dsn, min_size=2, probe_interval=0.1) as p:
+        p.wait(1.0)
+        with p.connection() as conn:
+            pid1 = conn.info.backend_pid
+            with p.connection() as conn2:
+                pid2 = conn2.info.backend_pid
+            conn.execute("select pg_terminate_backend(%s)", [pid2])
+
+        sleep(0.3)
+        assert p.get_stats()["connections_lost"] == 1
+        assert "discarding broken connection" in caplog.messages[0]
+
+        p.wait(1.0)
+        with p.connection() as conn:
+            conn.execute("select 1")
+            with p.connection() as conn2:
+                conn2.execute("select 2")
+
+                pids = {c.info.backend_pid for c in [conn, conn2]}
+
+    assert pid1 in pids
+    assert pid2 not in pids
+
+
+@pytest.mark.crdb_skip("pg_terminate_backend")
+def test_probe_connection(dsn):
+    with pool.ConnectionPool(dsn, min_size=2) as p:
+        p.wait(1.0)
+        with p.connection() as conn:
+            with p.connection() as conn2:
+                assert p._probe_connection(conn2)
+                conn.execute(
+                    "select pg_terminate_backend(%s)", [conn2.info.backend_pid]
+                )
+                sleep(0.1)
+                assert not p._probe_connection(conn2)
+
+            conn.close()
+            assert not p._probe_connection(conn)
+
+
+def test_probe_interval_bad(dsn):
+    with pytest.raises(ValueError, match="probe_interval"):
+        pool.ConnectionPool(dsn, probe_interval=0, open=False)
+
+
 @pytest.mark.parametrize("autocommit", [True, False])
 @pytest.mark.crdb_skip("pg_terminate_backend")
 def test_getconn_check(dsn, caplog, autocommit):
@@ -899,6 +1312,8 @@ def test_stats_check(dsn):
 
         stats = p.get_stats()
         assert stats["connections_lost"] == 1
+        assert "checks_ms_p99" in stats
+        assert p.get_histograms()["checks_ms"].count >= 2
 
 
 @pytest.mark.slow
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 import weakref
-from time import time
+from time import monotonic, time
 from typing import Any
 from collections import Counter
 
@@ -367,6 +367,110 @@ async def test_fail_rollback_close(dsn, caplog, monkeypatch):
     assert "BAD" in caplog.records[2].message
 
 
+@pytest.mark.crdb_skip("backend pid")
+@pytest.mark.parametrize("status", ["INTRANS", "INERROR"])
+async def test_rollback_reset(dsn, caplog, status):
+    caplog.set_level(logging.WARNING, logger="psycopg.pool")
+    pipelined = []
+
+    async def reset(conn):
+        pipelined.append(conn._pipeline is not None)
+        assert conn.info.transaction_status == TransactionStatus.IDLE
+        async with conn.transaction():
+            await conn.execute("set timezone to utc")
+            await conn.execute("discard temp")
+
+    async with pool.AsyncConnectionPool(dsn, min_size=1, reset=reset) as p:
+        conn = await p.getconn()
+        pid = conn.info.backend_pid
+        await conn.execute("create temp table test_rollback_reset ()")
+        await conn.commit()
+        if status == "INTRANS":
+            await conn.execute("select 1")
+        else:
+            with pytest.raises(psycopg.ProgrammingError):
+                await conn.execute("wat")
+        assert conn.info.transaction_status == getattr(TransactionStatus, status)
+        await p.putconn(conn)
+
+        async with p.connection() as conn2:
+            assert conn2.info.backend_pid == pid
+            assert conn2.info.transaction_status == TransactionStatus.IDLE
+            cur = await conn2.execute(
+                "select 1 from pg_class where relname = 'test_rollback_reset'"
+            )
+            assert not await cur.fetchone()
+
+    # The reset function is not called in pipeline mode if not requested.
+    assert pipelined == [False]
+    assert len(caplog.records) == 1
+    assert status in caplog.records[0].message
+
+
+@pytest.mark.crdb_skip("backend pid")
+@pytest.mark.parametrize("status", ["IDLE", "INTRANS", "INERROR"])
+async def test_reset_pipeline(dsn, caplog, status):
+    caplog.set_level(logging.WARNING, logger="psycopg.pool")
+    pipelined = []
+
+    async def reset(conn):
+        pipelined.append(conn._pipeline is not None)
+        assert conn.info.transaction_status == TransactionStatus.IDLE
+        async with conn.transaction():
+            await conn.execute("set timezone to utc")
+            await conn.execute("discard temp")
+
+    async with pool.AsyncConnectionPool(
+        dsn, min_size=1, reset=reset, reset_pipeline=True
+    ) as p:
+        conn = await p.getconn()
+        pid = conn.info.backend_pid
+        await conn.execute("create temp table test_reset_pipeline ()")
+        await conn.commit()
+        if status == "INTRANS":
+            await conn.execute("select 1")
+        elif status == "INERROR":
+            with pytest.raises(psycopg.ProgrammingError):
+                await conn.execute("wat")
+        assert conn.info.transaction_status == getattr(TransactionStatus, status)
+        await p.putconn(conn)
+
+        async with p.connection() as conn2:
+            assert conn2.info.backend_pid == pid
+            assert conn2.info.transaction_status == TransactionStatus.IDLE
+            cur = await conn2.execute(
+                "select 1 from pg_class where relname = 'test_reset_pipeline'"
+            )
+            assert not await cur.fetchone()
+
+    # The reset function is pipelined however the connection was returned.
+    assert pipelined == [psycopg.Pipeline.is_supported()]
+    assert len(caplog.records) == (status != "IDLE")
+
+
+@pytest.mark.crdb_skip("backend pid")
+async def test_rollback_reset_broken(dsn, caplog):
+    caplog.set_level(logging.WARNING, logger="psycopg.pool")
+
+    async def reset(conn):
+        await conn.execute("WAT")
+
+    async with pool.AsyncConnectionPool(dsn, min_size=1, reset=reset) as p:
+        conn = await p.getconn()
+        pid = conn.info.backend_pid
+        await conn.execute("select 1")
+        assert conn.info.transaction_status == TransactionStatus.INTRANS
+        await p.putconn(conn)
+
+        async with p.connection() as conn2:
+            assert conn2.info.backend_pid != pid
+            assert conn2.info.transaction_status == TransactionStatus.IDLE
+
+    assert len(caplog.records) >= 2
+    assert "INTRANS" in caplog.records[0].message
+    assert "WAT" in caplog.records[1].message
+
+
 async def test_del_no_warning(dsn, recwarn, gc_collect):
     p = pool.AsyncConnectionPool(dsn, min_size=2, open=False)
     await p.open()
@@ -450,6 +554,154 @@ async def test_grow(dsn, monkeypatch, min_size, want_times):
         assert got == pytest.approx(want, 0.1), times
 
 
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    "max_connecting, num_workers, want",
+    [(1, 3, 1), (3, 4, 3), (3, 3, 2), (8, 4, 3)],
+)
+async def test_grow_max_connecting(dsn, monkeypatch, max_connecting, num_workers, want):
+    connecting = []
+    inflight = 0
+
+    async def connect_delay(*args, **kwargs):
+        nonlocal inflight
+        inflight += 1
+        connecting.append(inflight)
+        try:
+            await asleep(0.1)
+            return await connect_orig(*args, **kwargs)
+        finally:
+            inflight -= 1
+
+    connect_orig = psycopg.AsyncConnection.connect
+    monkeypatch.setattr(psycopg.AsyncConnection, "connect", connect_delay)
+
+    async def worker():
+        async with p.connection() as conn:
+            await conn.execute("select pg_sleep(0.2)")
+
+    async with pool.AsyncConnectionPool(
+        dsn,
+        min_size=0,
+        max_size=6,
+        num_workers=num_workers,
+        max_connecting=max_connecting,
+    ) as p:
+        ts = [spawn(worker) for i in range(6)]
+        await gather(*ts)
+
+    assert max(connecting) == want
+
+
+@pytest.mark.parametrize("checkout, want", [("fifo", 0), ("lifo", 2)])
+async def test_checkout(dsn, checkout, want):
+    async with pool.AsyncConnectionPool(dsn, min_size=3, checkout=checkout) as p:
+        await p.wait()
+        conns = [await p.getconn() for i in range(3)]
+        pids = [conn.info.backend_pid for conn in conns]
+        for conn in conns:
+            await p.putconn(conn)
+        await p.wait()
+
+        async with p.connection() as conn:
+            assert conn.info.backend_pid == pids[want]
+
+
+async def test_checkout_lifo_hot(dsn):
+    async with pool.AsyncConnectionPool(dsn, min_size=3, checkout="lifo") as p:
+        await p.wait()
+        pids = set()
+        for i in range(5):
+            async with p.connection() as conn:
+                pids.add(conn.info.backend_pid)
+            await p.wait()
+
+    assert len(pids) == 1
+
+
+@pytest.mark.skipif(PSYCOPG_VERSION < (3, 4), reason="psycopg >= 3.4 feature")
+async def test_checkout_prepared(dsn):
+    async with pool.AsyncConnectionPool(dsn, min_size=3, checkout="prepared") as p:
+        await p.wait()
+        conns = [await p.getconn() for i in range(3)]
+        await conns[1].execute("select 1", prepare=True)
+        await conns[1].commit()
+        pid = conns[1].info.backend_pid
+        for conn in conns:
+            await p.putconn(conn)
+        await p.wait()
+
+        for i in range(3):
+            async with p.connection() as conn:
+                assert conn.info.backend_pid == pid
+            await p.wait()
+
+
+@pytest.mark.parametrize("checkout", ["fifo", "lifo"])
+async def test_affinity(dsn, checkout):
+    async with pool.AsyncConnectionPool(dsn, min_size=3, checkout=checkout) as p:
+        await p.wait()
+        pids: dict[str, int] = {}
+        for key in ["a", "b", "a", "c", "b", "a", None, "c"]:
+            async with p.connection(affinity=key) as conn:
+                pid = conn.info.backend_pid
+            if key is None:
+                continue
+            assert pids.setdefault(key, pid) == pid
+
+    if checkout == "fifo":
+        assert len(set(pids.values())) == 3
+
+
+async def test_affinity_busy(dsn):
+    async with pool.AsyncConnectionPool(dsn, min_size=2) as p:
+        await p.wait()
+        async with p.connection(affinity=1) as conn1:
+            pid1 = conn1.info.backend_pid
+
+        async with p.connection(affinity=1) as conn1:
+            assert conn1.info.backend_pid == pid1
+            # The connection is busy: get another one without waiting
+            async with p.connection(timeout=0.5, affinity=1) as conn2:
+                assert conn2.info.backend_pid != pid1
+
+        # The connection returned last with the key is preferred
+        async with p.connection(affinity=1) as conn:
+            assert conn.info.backend_pid == pid1
+
+
+async def test_shed_expired_waiting(dsn):
+    async with pool.AsyncConnectionPool(dsn, min_size=1) as p:
+        conn = await p.getconn()
+
+        # A client whose deadline passed while queued is not served
+        expired: pool.pool_async.WaitingClient[Any]
+        expired = pool.pool_async.WaitingClient(deadline=monotonic() - 1.0)
+        p._enqueue(expired)
+        await p.putconn(conn)
+
+        assert isinstance(expired.error, pool.PoolTimeout)
+        assert expired.conn is None
+        assert not p._waiting
+        assert len(p._pool) == 1
+
+
+@pytest.mark.skipif(PSYCOPG_VERSION >= (3, 4), reason="psycopg < 3.4 behaviour")
+async def test_checkout_prepared_unsupported(dsn):
+    with pytest.raises(TypeError, match="3.4"):
+        pool.AsyncConnectionPool(dsn, checkout="prepared", open=False)
+
+
+async def test_checkout_bad(dsn):
+    with pytest.raises(ValueError, match="checkout"):
+        pool.AsyncConnectionPool(dsn, checkout="random", open=False)
+
+
+async def test_max_connecting_bad(dsn):
+    with pytest.raises(ValueError):
+        pool.AsyncConnectionPool(dsn, max_connecting=0, open=False)
+
+
 @pytest.mark.slow
 @pytest.mark.timing
 async def test_shrink(dsn, monkeypatch):
@@ -482,6 +734,122 @@ async def test_shrink(dsn, monkeypatch):
     assert results == [(4, 4), (4, 3), (3, 2), (2, 2), (2, 2)]
 
 
+def fixed_policy(size: int) -> Any:
+    class FixedPolicy(pool.ScalingPolicy):
+        interval = 0.1
+
+        def __init__(self) -> None:
+            self.size = size
+            self.demands: list[pool.Demand] = []
+
+        def target_size(self, demand: pool.Demand) -> int:
+            self.demands.append(demand)
+            return self.size
+
+    return FixedPolicy()
+
+
+@pytest.mark.slow
+@pytest.mark.timing
+async def test_autoscale(dsn):
+    policy = fixed_policy(4)
+    async with pool.AsyncConnectionPool(
+        dsn, min_size=1, max_size=6, scaling=policy
+    ) as p:
+        await p.wait(5.0)
+        await asleep(0.5)
+        assert p.get_stats()["pool_size"] == 4
+        assert p.get_stats()["pool_available"] == 4
+
+        policy.size = 10
+        await asleep(0.5)
+        assert p.get_stats()["pool_size"] == 6
+
+        # The pool shrinks one connection per interval, down to min_size
+        policy.size = 0
+        await asleep(0.15)
+        assert 4 <= p.get_stats()["pool_size"] < 6
+        await asleep(0.6)
+        assert p.get_stats()["pool_size"] == 1
+
+    assert policy.demands
+    assert all(d.size <= 6 for d in policy.demands)
+
+
+@pytest.mark.slow
+async def test_autoscale_max_connecting(dsn, monkeypatch):
+    connecting = []
+    inflight = 0
+
+    async def connect_delay(*args, **kwargs):
+        nonlocal inflight
+        inflight += 1
+        connecting.append(inflight)
+        try:
+            await asleep(0.05)
+            return await connect_orig(*args, **kwargs)
+        finally:
+            inflight -= 1
+
+    connect_orig = psycopg.AsyncConnection.connect
+    monkeypatch.setattr(psycopg.AsyncConnection, "connect", connect_delay)
+
+    policy = fixed_policy(1)
+    async with pool.AsyncConnectionPool(
+        dsn, min_size=1, max_size=6, max_connecting=1, scaling=policy
+    ) as p:
+        await p.wait(5.0)
+        policy.size = 5
+        for i in range(50):
+            await asleep(0.1)
+            if p.get_stats()["pool_available"] == 5:
+                break
+
+        stats = p.get_stats()
+        assert stats["pool_size"] == 5
+        assert stats["pool_available"] == 5
+        assert p._growing == 0
+
+    assert len(connecting) == 5
+    assert max(connecting) == 1
+
+
+@pytest.mark.slow
+@pytest.mark.timing
+async def test_autoscale_demand(dsn):
+    policy = fixed_policy(1)
+
+    async def worker():
+        async with p.connection() as conn:
+            await conn.execute("select pg_sleep(0.2)")
+
+    async with pool.AsyncConnectionPool(
+        dsn, min_size=1, max_size=6, scaling=policy
+    ) as p:
+        await p.wait(5.0)
+        await asleep(0.3)
+        ts = [spawn(worker) for i in range(4)]
+        await gather(*ts)
+        await asleep(0.3)
+
+    demands = policy.demands
+    assert max(d.in_use for d in demands) > 1.0
+    assert max(d.requests_rate for d in demands) > 0.0
+    assert max(d.usage_ms for d in demands) >= 150.0
+
+
+@pytest.mark.slow
+@pytest.mark.timing
+async def test_autoscale_no_shrink(dsn):
+    # ShrinkPool doesn't drop the connections the scaling policy asked for
+    async with pool.AsyncConnectionPool(
+        dsn, min_size=1, max_size=4, max_idle=0.2, scaling=fixed_policy(3)
+    ) as p:
+        await p.wait(5.0)
+        await asleep(1.0)
+        assert p.get_stats()["pool_size"] == 3
+
+
 @pytest.mark.slow
 @pytest.mark.timing
 async def test_reconnect(proxy, caplog, monkeypatch):
@@ -786,6 +1154,57 @@ async def test_connect_check(dsn, caplog, autocommit):
     assert not caplog.records
 
 
+@pytest.mark.slow
+@pytest.mark.crdb_skip("pg_terminate_backend")
+async def test_probe(dsn, caplog):
+    caplog.set_level(logging.WARNING, logger="psycopg.pool")
+
+    async with pool.AsyncConnectionPool(dsn, min_size=2, probe_interval=0.1) as p:
+        await p.wait(1.0)
+        async with p.connection() as conn:
+            pid1 = conn.info.backend_pid
+            async with p.connection() as conn2:
+                pid2 = conn2.info.backend_pid
+            await conn.execute("select pg_terminate_backend(%s)", [pid2])
+
+        await asleep(0.3)
+        assert p.get_stats()["connections_lost"] == 1
+        assert "discarding broken connection" in caplog.messages[0]
+
+        await p.wait(1.0)
+        async with p.connection() as conn:
+            await conn.execute("select 1")
+            async with p.connection() as conn2:
+                await conn2.execute("select 2")
+
+                pids = {c.info.backend_pid for c in [conn, conn2]}
+
+    assert pid1 in pids
+    assert pid2 not in pids
+
+
+@pytest.mark.crdb_skip("pg_terminate_backend")
+async def test_probe_connection(dsn):
+    async with pool.AsyncConnectionPool(dsn, min_size=2) as p:
+        await p.wait(1.0)
+        async with p.connection() as conn:
+            async with p.connection() as conn2:
+                assert p._probe_connection(conn2)
+                await conn.execute(
+                    "select pg_terminate_backend(%s)", [conn2.info.backend_pid]
+                )
+                await asleep(0.1)
+                assert not p._probe_connection(conn2)
+
+            await conn.close()
+            assert not p._probe_connection(conn)
+
+
+async def test_probe_interval_bad(dsn):
+    with pytest.raises(ValueError, match="probe_interval"):
+        pool.AsyncConnectionPool(dsn, probe_interval=0, open=False)
+
+
 @pytest.mark.parametrize("autocommit", [True, False])
 @pytest.mark.crdb_skip("pg_terminate_backend")
 async def test_getconn_check(dsn, caplog, autocommit):
@@ -900,6 +1319,8 @@ async def test_stats_check(dsn):
 
         stats = p.get_stats()
         assert stats["connections_lost"] == 1
+        assert "checks_ms_p99" in stats
+        assert p.get_histograms()["checks_ms"].count >= 2
 
 
 @pytest.mark.slow
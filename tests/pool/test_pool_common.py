@@ -4,13 +4,14 @@
 from __future__ import annotations
 
 import logging
-from time import time
+from time import monotonic, time
 from typing import Any
 from asyncio import CancelledError
 
 import pytest
 
 import psycopg
+from psycopg.types.composite import CompositeInfo, register_composite
 
 from ..utils import set_autocommit
 from ..acompat import Event, gather, is_alive, skip_async, skip_sync, sleep, spawn
@@ -21,6 +22,8 @@ except ImportError:
     # Tests should have been skipped if the package is not available
     pass
 
+PSYCOPG_VERSION = tuple(map(int, psycopg.__version__.split(".", 2)[:2]))
+
 
 @pytest.fixture(params=["ConnectionPool", "NullConnectionPool"])
 def pool_cls(request):
@@ -577,6 +580,144 @@ def test_stats_usage(pool_cls, dsn):
         assert p.get_stats()["requests_num"] == 1
 
 
+def test_affinity(pool_cls, dsn):
+    with pool_cls(dsn, min_size=min_size(pool_cls), max_size=2) as p:
+        with p.connection(affinity="tenant1") as conn:
+            cur = conn.execute("select 1")
+            assert cur.fetchone() == (1,)
+        conn = p.getconn(affinity=("tenant", 2))
+        p.putconn(conn)
+
+
+@pytest.mark.slow
+def test_priority(pool_cls, dsn):
+
+    def worker(n, priority):
+        with p.connection(priority=priority):
+            results.append(n)
+
+    results: list[int] = []
+    with pool_cls(dsn, min_size=min_size(pool_cls), max_size=1) as p:
+        conn = p.getconn()
+        ts = []
+        for n, priority in enumerate([0, 0, 5, 1, 5]):
+            ts.append(spawn(worker, args=(n, priority)))
+            sleep(0.05)
+
+        p.putconn(conn)
+        gather(*ts)
+
+    assert results == [2, 4, 3, 0, 1]
+
+
+def test_deadline_passed(pool_cls, dsn):
+    with pool_cls(dsn, min_size=min_size(pool_cls), max_size=1) as p:
+        p.wait()
+        with pytest.raises(pool.PoolTimeout, match="deadline"):
+            p.getconn(deadline=monotonic() - 0.1)
+
+        with p.connection(deadline=monotonic() + 1.0) as conn:
+            conn.execute("select 1")
+
+        stats = p.get_stats()
+        assert stats["requests_shed"] == 1
+        assert stats["requests_errors"] == 1
+
+
+@pytest.mark.slow
+@pytest.mark.timing
+def test_deadline_wait(pool_cls, dsn):
+    with pool_cls(dsn, min_size=min_size(pool_cls), max_size=1) as p:
+        conn = p.getconn()
+        t0 = time()
+        with pytest.raises(pool.PoolTimeout, match="deadline has passed after"):
+            p.getconn(timeout=2.0, deadline=monotonic() + 0.2)
+        assert time() - t0 == pytest.approx(0.2, 0.1)
+
+        with pytest.raises(pool.PoolTimeout, match="couldn't get a connection"):
+            p.getconn(timeout=0.2, deadline=monotonic() + 2.0)
+        p.putconn(conn)
+
+        assert p.get_stats()["requests_shed"] == 1
+
+
+def test_warmup_settings(pool_cls, dsn):
+    warmup = pool.WarmUp(
+        settings={"application_name": "warm", "statement_timeout": "42s"},
+        commands=["prepare warmq as select 42"],
+    )
+    with pool_cls(dsn, min_size=min_size(pool_cls), warmup=warmup) as p:
+        with p.connection() as conn:
+            assert conn.info.parameter_status("application_name") == "warm"
+            cur = conn.execute("show statement_timeout")
+            assert cur.fetchone() == ("42s",)
+            cur = conn.execute("execute warmq")
+            assert cur.fetchone() == (42,)
+
+
+@pytest.mark.crdb_skip("composite")
+def test_warmup_types(pool_cls, dsn, svcconn, monkeypatch, caplog):
+    caplog.set_level(logging.WARNING, logger="psycopg.pool")
+    svcconn.execute(
+        """
+        drop type if exists warmtype cascade;
+        create type warmtype as (foo text, bar int8);
+        """
+    )
+
+    nfetch = 0
+    orig_query = CompositeInfo._get_info_query
+
+    def get_info_query(conn):
+        nonlocal nfetch
+        nfetch += 1
+        return orig_query(conn)
+
+    monkeypatch.setattr(CompositeInfo, "_get_info_query", get_info_query)
+
+    warmup = pool.WarmUp(
+        types=[
+            ("warmtype", register_composite, CompositeInfo),
+            pool.TypeRegistration("nosuchtype"),
+            "int4",
+        ]
+    )
+    with pool_cls(dsn, min_size=min_size(pool_cls), max_size=2, warmup=warmup) as p:
+        p.wait()
+        with p.connection() as conn1:
+            with p.connection() as conn2:
+                for conn in (conn1, conn2):
+                    cur = conn.execute("select ('hello', 10)::warmtype")
+                    (rec,) = cur.fetchone()
+                    assert (rec.foo, rec.bar) == ("hello", 10)
+
+    assert nfetch == 1
+    assert "nosuchtype" in caplog.messages[0]
+
+
+def test_stats_histograms(pool_cls, dsn):
+    with pool_cls(dsn, min_size=min_size(pool_cls), max_size=1) as p:
+        p.wait()
+        for i in range(3):
+            with p.connection() as conn:
+                conn.execute("select 1")
+
+        hists = p.get_histograms()
+        assert hists["usage_ms"].count == 3
+        assert hists["connections_ms"].count >= 1
+        assert hists["checks_ms"].count == 0
+
+        stats = p.get_stats()
+        for pc in (50, 95, 99):
+            assert stats[f"usage_ms_p{pc}"] >= 0
+        assert "checks_ms_p50" not in stats
+
+        assert "usage_ms_p50" in p.pop_stats()
+        assert "usage_ms_p50" not in p.get_stats()
+        assert p.get_histograms()["usage_ms"].count == 0
+        assert hists["usage_ms"].count == 3
+
+
 def test_debug_deadlock(pool_cls, dsn):
     # https://github.com/psycopg/psycopg/issues/230
     logger = logging.getLogger("psycopg")
@@ -780,6 +921,59 @@ def test_drain(pool_cls, dsn):
             assert pids2 == pids3
 
 
+@pytest.mark.skipif(PSYCOPG_VERSION < (3, 4), reason="psycopg >= 3.4 feature")
+def test_statements(pool_cls, dsn):
+    reg = pool.StatementRegistry()
+    with pool_cls(dsn, min_size=min_size(pool_cls), statements=reg) as p:
+        with p.connection() as conn:
+            conn.execute("select %s::int", [1], prepare=True)
+            pid = conn.info.backend_pid
+        assert len(reg) == 1
+        assert "statements_prepared" not in p.get_stats()
+
+        p.drain()
+        with p.connection() as conn:
+            assert conn.info.backend_pid != pid
+            cur = conn.execute("select statement from pg_prepared_statements")
+            assert cur.fetchall() == [("select $1::int",)]
+            cur = conn.execute("select %s::int", [2])
+            assert cur.fetchone() == (2,)
+            assert len(conn._prepared.prepared_keys()) == 1
+
+        assert p.get_stats()["statements_prepared"] == 1
+
+
+@pytest.mark.skipif(PSYCOPG_VERSION < (3, 4), reason="psycopg >= 3.4 feature")
+def test_statements_discard(pool_cls, dsn, caplog):
+    caplog.set_level(logging.WARNING, logger="psycopg.pool")
+    reg = pool.StatementRegistry()
+    reg.record([(b"select * from nosuchtable", ()), (b"select 1", ())])
+    with pool_cls(dsn, min_size=min_size(pool_cls), statements=reg) as p:
+        with p.connection() as conn:
+            assert conn.info.transaction_status == psycopg.pq.TransactionStatus.IDLE
+            assert conn._prepared.prepared_keys() == [(b"select 1", ())]
+
+    assert reg.hot() == [(b"select 1", ())]
+    assert "failed to prepare" in caplog.records[0].message
+
+
+@pytest.mark.skipif(PSYCOPG_VERSION < (3, 4), reason="psycopg >= 3.4 feature")
+def test_statements_disabled(pool_cls, dsn):
+
+    def configure(conn):
+        conn.prepare_threshold = None
+
+    reg = pool.StatementRegistry()
+    reg.record([(b"select 1", ())])
+    with pool_cls(
+        dsn, min_size=min_size(pool_cls), configure=configure, statements=reg
+    ) as p:
+        with p.connection() as conn:
+            assert not conn._prepared.prepared_keys()
+            cur = conn.execute("select count(*) from pg_prepared_statements")
+            assert cur.fetchone() == (0,)
+
+
 def min_size(pool_cls, num=1):
     """Return the minimum min_size supported by the pool class."""
     if pool_cls is pool.ConnectionPool:
@@ -0,0 +1,176 @@
+# WARNING: this file is auto-generated by 'async_to_sync.py'
+# from the original file 'test_routing_async.py'
+# DO NOT CHANGE! Change the original file instead.
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+import psycopg
+from psycopg.conninfo import conninfo_to_dict, make_conninfo
+
+try:
+    import psycopg_pool as pool
+except ImportError:
+    # Tests should have been skipped if the package is not available
+    pass
+
+pytestmark = [
+    pytest.mark.skipif(
+        not hasattr(psycopg.conninfo, "conninfo_attempts"),
+        reason="conninfo_attempts() not available",
+    )
+]
+
+
+def multihost(dsn: str, n: int) -> str:
+    """Return a connection string repeating *n* times the host of *dsn*."""
+    params = conninfo_to_dict(dsn)
+    hosts = ",".join([str(params.get("host", ""))] * n)
+    ports = ",".join([str(params.get("port", ""))] * n)
+    return make_conninfo(dsn, host=hosts, port=ports)
+
+
+@pytest.fixture
+def standbys(monkeypatch):
+    """Make the routing pool probe find the hosts in standby as specified."""
+    rv: list[bool] = []
+
+    def is_standby(self, attempt):
+        return rv.pop(0) if rv else False
+
+    monkeypatch.setattr(pool.RoutingConnectionPool, "_is_standby", is_standby)
+    return rv
+
+
+def test_no_replica(dsn):
+    with pool.RoutingConnectionPool(dsn, min_size=1) as p:
+        assert not p.replicas
+        assert "target_session_attrs=read-write" in str(p.primary.conninfo)
+
+        with p.connection() as conn:
+            assert conn._pool is p.primary
+        with p.connection(readonly=True) as conn:
+            assert conn._pool is p.primary
+            cur = conn.execute("select 1")
+            assert cur.fetchone() == (1,)
+
+
+def test_no_replica_no_fallback(dsn):
+    with pool.RoutingConnectionPool(dsn, min_size=1, fallback=False) as p:
+        with pytest.raises(pool.PoolTimeout, match="no replica"):
+            with p.connection(readonly=True):
+                pass
+
+
+def test_probe(dsn):
+    p = pool.RoutingConnectionPool(dsn)
+    (attempt,) = psycopg.conninfo.conninfo_attempts(conninfo_to_dict(dsn))
+    assert not p._is_standby(attempt)
+    assert not p._is_standby({**attempt, "dbname": "nosuchdb"})
+
+
+def test_kwargs(dsn, standbys):
+    standbys.append(True)
+    kwargs = {"autocommit": True, "prepare_threshold": None}
+    with pool.RoutingConnectionPool(dsn, min_size=1, kwargs=kwargs) as p:
+        (replica,) = p.replicas
+        for readonly in (False, True):
+            with p.connection(readonly=readonly) as conn:
+                assert conn.autocommit
+                assert conn.prepare_threshold is None
+
+
+def test_probe_kwargs(dsn):
+    p = pool.RoutingConnectionPool(dsn, kwargs={"autocommit": True})
+    (attempt,) = psycopg.conninfo.conninfo_attempts(conninfo_to_dict(dsn))
+    assert not p._is_standby(attempt)
+
+    p = pool.RoutingConnectionPool(dsn, kwargs={"nosuchparam": 1})
+    assert not p._is_standby(attempt)
+
+
+def test_route(dsn, standbys):
+    standbys.extend([False, True])
+    with pool.RoutingConnectionPool(multihost(dsn, 2), min_size=1) as p:
+        (replica,) = p.replicas
+        assert replica.name == f"{p.name}-replica-1"
+        with p.connection(readonly=True) as conn:
+            assert conn._pool is replica
+        with p.connection() as conn:
+            assert conn._pool is p.primary
+
+        conn = p.getconn(readonly=True)
+        assert conn._pool is replica
+        p.putconn(conn)
+        assert len(replica._pool) == 1
+
+        stats = p.get_stats()
+        assert stats[p.primary.name]["requests_num"] == 1
+        assert stats[replica.name]["requests_num"] == 2
+
+
+def test_least_loaded(dsn, standbys):
+    standbys.extend([True, True, False])
+    with pool.RoutingConnectionPool(multihost(dsn, 3), min_size=1, max_size=2) as p:
+        r1, r2 = p.replicas
+        with p.connection(readonly=True) as conn1:
+            with p.connection(readonly=True) as conn2:
+                assert {conn1._pool, conn2._pool} == {r1, r2}
+                with p.connection(readonly=True) as conn3:
+                    with p.connection(readonly=True) as conn4:
+                        assert {conn3._pool, conn4._pool} == {r1, r2}
+
+
+def test_replica_failed(dsn, standbys, monkeypatch):
+    standbys.extend([True, True])
+    with pool.RoutingConnectionPool(multihost(dsn, 2), min_size=1) as p:
+        r1, r2 = p.replicas
+
+        def getconn(**kwargs: Any) -> Any:
+            raise psycopg.OperationalError("replica down")
+
+        monkeypatch.setattr(r1, "getconn", getconn)
+        with pytest.raises(psycopg.OperationalError):
+            p.getconn(readonly=True)
+
+        for i in range(3):
+            with p.connection(readonly=True) as conn:
+                assert conn._pool is r2
+
+        monkeypatch.setattr(r2, "getconn", getconn)
+        with pytest.raises(psycopg.OperationalError):
+            p.getconn(readonly=True)
+
+        with p.connection(readonly=True) as conn:
+            assert conn._pool is p.primary
+
+
+def test_putconn_bad(dsn):
+    with pool.RoutingConnectionPool(dsn, min_size=1) as p:
+        with pool.ConnectionPool(dsn, min_size=1) as p2:
+            conn = p2.getconn()
+            with pytest.raises(ValueError, match="doesn't come from it"):
+                p.putconn(conn)
+            p2.putconn(conn)
+
+
+def test_closed(dsn):
+    p = pool.RoutingConnectionPool(dsn, min_size=1)
+    with pytest.raises(pool.PoolClosed, match="not open yet"):
+        p.getconn()
+
+    p.open(wait=True)
+    p.close()
+    assert p.closed
+    assert p.primary.closed
+    with pytest.raises(pool.PoolClosed, match="already closed"):
+        p.getconn()
+    with pytest.raises(psycopg.OperationalError):
+        p.open()
+
+
+def test_open_param(dsn):
+    with pytest.raises(TypeError):
+        pool.RoutingConnectionPool(dsn, open=True)
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+import psycopg
+from psycopg.conninfo import conninfo_to_dict, make_conninfo
+
+try:
+    import psycopg_pool as pool
+except ImportError:
+    # Tests should have been skipped if the package is not available
+    pass
+
+pytestmark = [
+    pytest.mark.skipif(
+        not hasattr(psycopg.conninfo, "conninfo_attempts"),
+        reason="conninfo_attempts() not available",
+    )
+]
+if True:  # ASYNC
+    pytestmark.append(pytest.mark.anyio)
+
+
+def multihost(dsn: str, n: int) -> str:
+    """Return a connection string repeating *n* times the host of *dsn*."""
+    params = conninfo_to_dict(dsn)
+    hosts = ",".join([str(params.get("host", ""))] * n)
+    ports = ",".join([str(params.get("port", ""))] * n)
+    return make_conninfo(dsn, host=hosts, port=ports)
+
+
+@pytest.fixture
+def standbys(monkeypatch):
+    """Make the routing pool probe find the hosts in standby as specified."""
+    rv: list[bool] = []
+
+    async def is_standby(self, attempt):
+        return rv.pop(0) if rv else False
+
+    monkeypatch.setattr(pool.AsyncRoutingConnectionPool, "_is_standby", is_standby)
+    return rv
+
+
+async def test_no_replica(dsn):
+    async with pool.AsyncRoutingConnectionPool(dsn, min_size=1) as p:
+        assert not p.replicas
+        assert "target_session_attrs=read-write" in str(p.primary.conninfo)
+
+        async with p.connection() as conn:
+            assert conn._pool is p.primary
+        async with p.connection(readonly=True) as conn:
+            assert conn._pool is p.primary
+            cur = await conn.execute("select 1")
+            assert await cur.fetchone() == (1,)
+
+
+async def test_no_replica_no_fallback(dsn):
+    async with pool.AsyncRoutingConnectionPool(dsn, min_size=1, fallback=False) as p:
+        with pytest.raises(pool.PoolTimeout, match="no replica"):
+            async with p.connection(readonly=True):
+                pass
+
+
+async def test_probe(dsn):
+    p = pool.AsyncRoutingConnectionPool(dsn)
+    (attempt,) = await psycopg.conninfo.conninfo_attempts_async(conninfo_to_dict(dsn))
+    assert not await p._is_standby(attempt)
+    assert not await p._is_standby({**attempt, "dbname": "nosuchdb"})
+
+
+async def test_kwargs(dsn, standbys):
+    standbys.append(True)
+    kwargs = {"autocommit": True, "prepare_threshold": None}
+    async with pool.AsyncRoutingConnectionPool(dsn, min_size=1, kwargs=kwargs) as p:
+        (replica,) = p.replicas
+        for readonly in (False, True):
+            async with p.connection(readonly=readonly) as conn:
+                assert conn.autocommit
+                assert conn.prepare_threshold is None
+
+
+async def test_probe_kwargs(dsn):
+    p = pool.AsyncRoutingConnectionPool(dsn, kwargs={"autocommit": True})
+    (attempt,) = await psycopg.conninfo.conninfo_attempts_async(conninfo_to_dict(dsn))
+    assert not await p._is_standby(attempt)
+
+    p = pool.AsyncRoutingConnectionPool(dsn, kwargs={"nosuchparam": 1})
+    assert not await p._is_standby(attempt)
+
+
+async def test_route(dsn, standbys):
+    standbys.extend([False, True])
+    async with pool.AsyncRoutingConnectionPool(multihost(dsn, 2), min_size=1) as p:
+        (replica,) = p.replicas
+        assert replica.name == f"{p.name}-replica-1"
+        async with p.connection(readonly=True) as conn:
+            assert conn._pool is replica
+        async with p.connection() as conn:
+            assert conn._pool is p.primary
+
+        conn = await p.getconn(readonly=True)
+        assert conn._pool is replica
+        await p.putconn(conn)
+        assert len(replica._pool) == 1
+
+        stats = p.get_stats()
+        assert stats[p.primary.name]["requests_num"] == 1
+        assert stats[replica.name]["requests_num"] == 2
+
+
+async def test_least_loaded(dsn, standbys):
+    standbys.extend([True, True, False])
+    async with pool.AsyncRoutingConnectionPool(
+        multihost(dsn, 3), min_size=1, max_size=2
+    ) as p:
+        r1, r2 = p.replicas
+        async with p.connection(readonly=True) as conn1:
+            async with p.connection(readonly=True) as conn2:
+                assert {conn1._pool, conn2._pool} == {r1, r2}
+                async with p.connection(readonly=True) as conn3:
+                    async with p.connection(readonly=True) as conn4:
+                        assert {conn3._pool, conn4._pool} == {r1, r2}
+
+
+async def test_replica_failed(dsn, standbys, monkeypatch):
+    standbys.extend([True, True])
+    async with pool.AsyncRoutingConnectionPool(multihost(dsn, 2), min_size=1) as p:
+        r1, r2 = p.replicas
+
+        async def getconn(**kwargs: Any) -> Any:
+            raise psycopg.OperationalError("replica down")
+
+        monkeypatch.setattr(r1, "getconn", getconn)
+        with pytest.raises(psycopg.OperationalError):
+            await p.getconn(readonly=True)
+
+        for i in range(3):
+            async with p.connection(readonly=True) as conn:
+                assert conn._pool is r2
+
+        monkeypatch.setattr(r2, "getconn", getconn)
+        with pytest.raises(psycopg.OperationalError):
+            await p.getconn(readonly=True)
+
+        async with p.connection(readonly=True) as conn:
+            assert conn._pool is p.primary
+
+
+async def test_putconn_bad(dsn):
+    async with pool.AsyncRoutingConnectionPool(dsn, min_size=1) as p:
+        async with pool.AsyncConnectionPool(dsn, min_size=1) as p2:
+            conn = await p2.getconn()
+            with pytest.raises(ValueError, match="doesn't come from it"):
+                await p.putconn(conn)
+            await p2.putconn(conn)
+
+
+async def test_closed(dsn):
+    p = pool.AsyncRoutingConnectionPool(dsn, min_size=1)
+    with pytest.raises(pool.PoolClosed, match="not open yet"):
+        await p.getconn()
+
+    await p.open(wait=True)
+    await p.close()
+    assert p.closed
+    assert p.primary.closed
+    with pytest.raises(pool.PoolClosed, match="already closed"):
+        await p.getconn()
+    with pytest.raises(psycopg.OperationalError):
+        await p.open()
+
+
+async def test_open_param(dsn):
+    with pytest.raises(TypeError):
+        pool.AsyncRoutingConnectionPool(dsn, open=True)
@@ -0,0 +1,69 @@
+from typing import Any
+
+import pytest
+
+try:
+    from psycopg_pool import Demand, DemandPolicy
+    from psycopg_pool.scaling import DemandMeter
+except ImportError:
+    # Tests should have been skipped if the package is not available
+    pass
+
+
+def demand(**kwargs: Any) -> Demand:
+    d = Demand(
+        size=4, in_use=0.0, waiting=0.0, requests_rate=0.0, wait_ms=0.0, usage_ms=0.0
+    )
+    return d._replace(**kwargs)
+
+
+@pytest.mark.parametrize(
+    "kwargs, want",
+    [
+        ({}, 0),
+        ({"in_use": 5.0}, 6),
+        ({"in_use": 5.0, "waiting": 5.0}, 12),
+        ({"in_use": 1.0, "requests_rate": 100.0, "usage_ms": 50.0}, 6),
+        ({"in_use": 10.0, "requests_rate": 100.0, "usage_ms": 50.0}, 12),
+    ],
+)
+def test_demand_policy(kwargs, want):
+    assert DemandPolicy().target_size(demand(**kwargs)) == want
+
+
+def test_demand_policy_headroom():
+    policy = DemandPolicy(headroom=0.0)
+    assert policy.target_size(demand(in_use=3.0)) == 3
+    assert policy.target_size(demand(in_use=3.1)) == 4
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"headroom": -1}, {"interval": 0}, {"smoothing": 0}, {"smoothing": 2}]
+)
+def test_demand_policy_bad(kwargs):
+    with pytest.raises(ValueError):
+        DemandPolicy(**kwargs)
+
+
+def test_meter():
+    meter = DemandMeter(DemandPolicy(smoothing=0.5))
+    totals: dict[str, float] = {}
+    d = meter.update(now=10.0, size=4, in_use=2, waiting=0, totals=totals)
+    assert d == demand(in_use=2.0)
+
+    totals.update(requests_num=20, usage_ms=200.0, usage_ms_count=10)
+    totals.update(requests_wait_ms=40.0, requests_wait_ms_count=4)
+    d = meter.update(now=12.0, size=4, in_use=4, waiting=2, totals=totals)
+    assert d.in_use == 3.0
+    assert d.waiting == 1.0
+    assert d.requests_rate == 5.0
+    assert d.usage_ms == 20.0
+    assert d.wait_ms == 2.0
+
+    # No new usage: keep the previous average
+    totals.update(requests_num=30)
+    d = meter.update(now=14.0, size=4, in_use=0, waiting=0, totals=totals)
+    assert d.in_use == 1.5
+    assert d.requests_rate == 5.0
+    assert d.usage_ms == 20.0
+    assert d.wait_ms == 1.0
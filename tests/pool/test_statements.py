@@ -0,0 +1,57 @@
+import pytest
+
+try:
+    from psycopg_pool import StatementRegistry
+except ImportError:
+    # Tests should have been skipped if the package is not available
+    pass
+
+
+def key(n):
+    return (f"select {n}".encode(), ())
+
+
+def test_hot():
+    reg = StatementRegistry()
+    assert not reg.hot()
+    reg.record([key(1), key(2)])
+    reg.record([key(2)])
+    assert reg.hot() == [key(2), key(1)]
+    assert len(reg) == 2
+
+
+def test_threshold():
+    reg = StatementRegistry(threshold=2)
+    reg.record([key(1), key(2)])
+    assert reg.hot() == []
+    reg.record([key(2)])
+    assert reg.hot() == [key(2)]
+
+
+def test_max_size():
+    reg = StatementRegistry(max_size=2)
+    reg.record([key(1)] * 10 + [key(2)] * 5 + [key(3)])
+    assert reg.hot() == [key(1), key(2)]
+    assert len(reg) == 3
+
+    # Recording too many statements drops the least used and ages the others
+    reg.record([key(4), key(5)])
+    assert len(reg) == 2
+    assert reg.hot() == [key(1), key(2)]
+    reg.record([key(3)] * 5)
+    assert reg.hot() == [key(1), key(3)]
+
+
+def test_discard_clear():
+    reg = StatementRegistry()
+    reg.record([key(1), key(2)])
+    reg.discard([key(1), key(3)])
+    assert reg.hot() == [key(2)]
+    reg.clear()
+    assert not reg.hot()
+
+
+@pytest.mark.parametrize("args", [{"max_size": 0}, {"threshold": 0}])
+def test_bad_args(args):
+    with pytest.raises(ValueError):
+        StatementRegistry(**args)
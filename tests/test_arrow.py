@@ -0,0 +1,119 @@
+import datetime as dt
+
+import pytest
+
+import psycopg
+from psycopg import pq
+
+pytest.importorskip("numpy")
+pytest.importorskip("pyarrow")
+
+import pyarrow as pa
+
+pytestmark = [pytest.mark.numpy, pytest.mark.crdb_skip("copy")]
+
+
+@pytest.mark.parametrize("binary", [True, False])
+def test_fetch_arrow(conn, binary):
+    cur = conn.cursor(binary=binary)
+    cur.execute(
+        """
+        select i as id, i * 0.5::float8 as half, 'x' || i as label,
+            '2020-01-01'::date + i as day
+        from generate_series(1, 10) as i
+        union all select null, null, null, null
+        """
+    )
+    batch = cur.fetch_arrow()
+    assert isinstance(batch, pa.RecordBatch)
+    assert batch.schema.names == ["id", "half", "label", "day"]
+    assert batch.num_rows == 11
+    data = batch.to_pydict()
+    assert data["id"][:3] == [1, 2, 3]
+    assert data["half"][:2] == [0.5, 1.0]
+    assert data["label"][-2:] == ["x10", None]
+    assert data["day"][0] == dt.date(2020, 1, 2)
+    assert data["day"][-1] is None
+    if binary:
+        assert batch.schema.field("id").type == pa.int32()
+        assert batch.schema.field("day").type == pa.date32()
+
+
+def test_fetch_arrow_size(conn):
+    cur = conn.cursor(binary=True)
+    cur.execute("select generate_series(1, 10) as n")
+    assert cur.fetch_arrow(4).column("n").to_pylist() == [1, 2, 3, 4]
+    assert cur.fetch_arrow().column("n").to_pylist() == [5, 6, 7, 8, 9, 10]
+    assert cur.fetch_arrow().num_rows == 0
+
+
+def test_fetch_arrow_timestamptz(conn):
+    cur = conn.cursor(binary=True)
+    cur.execute(
+        "select '2000-01-01 01:00+01'::timestamptz as ts union all select 'infinity'"
+    )
+    batch = cur.fetch_arrow()
+    assert batch.schema.field("ts").type == pa.timestamp("us", tz="UTC")
+    assert batch.column("ts").to_pylist() == [
+        dt.datetime(2000, 1, 1, tzinfo=dt.timezone.utc),
+        None,
+    ]
+
+
+@pytest.mark.parametrize("format", pq.Format)
+def test_copy_read_arrow_batches(conn, format):
+    cur = conn.cursor()
+    query = """
+        copy (
+            select i::int8, 'x' || i,
+                case when i %% 3 = 0 then null else i / 2.0 end::float8
+            from generate_series(1, 25) i
+        ) to stdout (format %s)
+        """
+    with cur.copy(query % format.name) as copy:
+        copy.set_types(["int8", "text", "float8"])
+        batches = list(copy.read_arrow_batches(size=10))
+
+    assert [b.num_rows for b in batches] == [10, 10, 5]
+    assert batches[0].schema.names == ["column_1", "column_2", "column_3"]
+    table = pa.Table.from_batches(batches)
+    assert table.column(0).to_pylist() == list(range(1, 26))
+    assert table.column(1).to_pylist()[:2] == ["x1", "x2"]
+    assert table.column(2).to_pylist()[:3] == [0.5, 1.0, None]
+    assert cur.rowcount == 25
+    assert conn.info.transaction_status == pq.TransactionStatus.INTRANS
+
+
+def test_copy_read_arrow_batches_no_types(conn):
+    cur = conn.cursor()
+    with cur.copy("copy (select 1) to stdout (format binary)") as copy:
+        with pytest.raises(psycopg.ProgrammingError, match="set_types"):
+            next(copy.read_arrow_batches())
+        list(copy)
+
+
+@pytest.mark.parametrize("types", [["int4"], ["int8", "int8"]])
+def test_copy_read_arrow_batches_bad_types(conn, types):
+    cur = conn.cursor()
+    with pytest.raises(psycopg.DataError):
+        with cur.copy("copy (select 1, 2) to stdout (format binary)") as copy:
+            copy.set_types(types)
+            list(copy.read_arrow_batches())
+
+
+async def test_copy_read_arrow_batches_async(aconn):
+    cur = aconn.cursor()
+    async with cur.copy(
+        "copy (select generate_series(1, 5)) to stdout (format binary)"
+    ) as copy:
+        copy.set_types(["int4"])
+        batches = [b async for b in copy.read_arrow_batches(size=2)]
+
+    assert [b.column(0).to_pylist() for b in batches] == [[1, 2], [3, 4], [5]]
+
+
+async def test_fetch_arrow_async(aconn):
+    cur = aconn.cursor(binary=True)
+    await cur.execute("select 1 as a, 'x' as b")
+    batch = await cur.fetch_arrow()
+    assert batch.to_pylist() == [{"a": 1, "b": "x"}]
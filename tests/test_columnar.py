@@ -0,0 +1,210 @@
+import datetime as dt
+
+import pytest
+
+import psycopg
+
+pytest.importorskip("numpy")
+
+import numpy as np
+
+pytestmark = [pytest.mark.numpy]
+
+
+@pytest.mark.parametrize("binary", [True, False])
+@pytest.mark.parametrize(
+    "type, value, expected, dtype",
+    [
+        ("int2", 42, 42, np.int16),
+        ("int4", -42, -42, np.int32),
+        ("int8", 2**40, 2**40, np.int64),
+        ("oid", 2**31, 2**31, np.uint32),
+        ("float4", 1.5, 1.5, np.float32),
+        ("float8", -0.25, -0.25, np.float64),
+        ("bool", True, True, np.bool_),
+        ("date", "2042-01-02", "2042-01-02", "datetime64[D]"),
+        (
+            "timestamp",
+            "1970-01-01 00:00:01.5",
+            "1970-01-01T00:00:01.5",
+            "datetime64[us]",
+        ),
+        ("timestamptz", "2000-01-01 01:00:00+01", "2000-01-01T00:00", "datetime64[us]"),
+    ],
+)
+def test_fetch_columns_types(conn, binary, type, value, expected, dtype):
+    cur = conn.cursor(binary=binary)
+    cur.execute(
+        f"select v::{type} from (values (%s), (null), (%s)) as t(v)", [value, value]
+    )
+    (col,) = cur.fetch_columns()
+    assert list(col.mask) == [False, True, False]
+    if binary:
+        assert col.dtype == np.dtype(dtype)
+        assert col[0] == np.array([expected], dtype=dtype)[0]
+    else:
+        assert col.dtype == np.dtype(object)
+    assert col[0] == col[2]
+
+
+@pytest.mark.parametrize("type", ["date", "timestamp", "timestamptz"])
+def test_fetch_columns_infinity(conn, type):
+    cur = conn.cursor(binary=True)
+    cur.execute(f"select v::{type} from (values ('infinity'), ('-infinity')) t(v)")
+    (col,) = cur.fetch_columns()
+    assert not col.mask.any()
+    assert np.isnat(col.data).all()
+
+
+def test_fetch_columns_values(conn):
+    cur = conn.cursor(binary=True)
+    cur.execute(
+        """
+        select i, i * 0.5, 'x' || i, '2020-01-01'::timestamp + i * '1 day'::interval
+        from generate_series(1, 100) as i
+        """
+    )
+    ints, floats, texts, tss = cur.fetch_columns()
+    assert (ints == np.arange(1, 101)).all()
+    assert (floats.astype(float) == np.arange(1, 101) * 0.5).all()
+    assert texts.dtype == np.dtype(object)
+    assert list(texts[:2]) == ["x1", "x2"]
+    assert tss[0].astype(dt.datetime) == dt.datetime(2020, 1, 2)
+    assert tss[-1].astype(dt.datetime) == dt.datetime(2020, 4, 10)
+
+
+def test_fetch_columns_size(conn):
+    cur = conn.cursor(binary=True)
+    cur.execute("select generate_series(1, 10)")
+    assert cur.fetchone() == (1,)
+    (col,) = cur.fetch_columns(4)
+    assert list(col) == [2, 3, 4, 5]
+    assert cur.rownumber == 5
+    (col,) = cur.fetch_columns()
+    assert list(col) == [6, 7, 8, 9, 10]
+    (col,) = cur.fetch_columns()
+    assert len(col) == 0
+    assert cur.fetchone() is None
+
+
+def test_fetch_columns_no_result(conn):
+    cur = conn.cursor()
+    cur.execute("create temp table tcols (x int)")
+    with pytest.raises(psycopg.ProgrammingError):
+        cur.fetch_columns()
+
+
+def test_fetch_columns_server_cursor(conn):
+    cur = conn.cursor("foo")
+    cur.execute("select generate_series(1, 10)")
+    with pytest.raises(psycopg.NotSupportedError):
+        cur.fetch_columns()
+    cur.close()
+
+
+async def test_fetch_columns_async(aconn):
+    cur = aconn.cursor(binary=True)
+    await cur.execute("select generate_series(1, 5), null::float8")
+    ints, nulls = await cur.fetch_columns(3)
+    assert list(ints) == [1, 2, 3]
+    assert nulls.dtype == np.float64
+    assert nulls.mask.all()
+
+
+@pytest.mark.crdb_skip("copy")
+def test_write_columns(conn):
+    conn.execute(
+        """
+        create temp table tcols (
+            b bool, i2 int2, i4 int4, i8 int8, f4 float4, f8 float8,
+            d date, ts timestamp, tstz timestamptz)
+        """
+    )
+    n = 1000
+    mask = np.arange(n) % 7 == 0
+    columns = [
+        np.arange(n) % 2 == 0,
+        np.ma.MaskedArray(np.arange(n, dtype=np.int16), mask=mask),
+        np.arange(n, dtype=np.int32) - 500,
+        np.arange(n) * 2**33,
+        np.ma.MaskedArray(np.arange(n) / 4, mask=~mask),
+        np.arange(n) / 8,
+        np.datetime64("2020-01-01") + np.arange(n),
+        np.datetime64("1970-01-01T00:00:00.5") + np.arange(n).astype("m8[s]"),
+        np.array(["2000-01-01T00:00", "NaT"] * (n // 2), dtype="datetime64[us]"),
+    ]
+    cur = conn.cursor()
+    types = "bool int2 int4 int8 float4 float8 date timestamp timestamptz".split()
+    with cur.copy("copy tcols from stdin (format binary)") as copy:
+        copy.set_types(types)
+        copy.write_row([True, None, 42, None, None, None, None, None, None])
+        copy.write_columns(columns)
+
+    assert cur.rowcount == n + 1
+    cur.execute("select * from tcols offset 1", binary=True)
+    got = cur.fetch_columns()
+    for col, want in zip(got, columns):
+        if np.ma.getmask(want) is not np.ma.nomask:
+            assert (col.mask == want.mask).all()
+            assert (col.compressed() == want.compressed()).all()
+        elif want.dtype.kind == "M":
+            assert (col.mask == np.isnat(want)).all()
+            assert (col.compressed() == want[~np.isnat(want)]).all()
+        else:
+            assert not col.mask.any()
+            assert (col.data == want).all()
+
+    cur.execute("select * from tcols limit 1")
+    assert cur.fetchone()[:3] == (True, None, 42)
+
+
+@pytest.mark.crdb_skip("copy")
+def test_write_columns_large(conn):
+    conn.execute("create temp table tcols (a int4, b int8)")
+    n = 100_000
+    cur = conn.cursor()
+    with cur.copy("copy tcols from stdin (format binary)") as copy:
+        a = np.ma.MaskedArray(np.arange(n, dtype=np.int32), mask=np.arange(n) % 2 == 1)
+        copy.write_columns([a, np.arange(n)], ["int4", "int8"])
+    cur.execute("select count(a), count(*), sum(b) from tcols")
+    assert cur.fetchone() == (n // 2, n, n * (n - 1) // 2)
+
+
+@pytest.mark.crdb_skip("copy")
+@pytest.mark.parametrize(
+    "columns, types, exc",
+    [
+        ([np.arange(3)], None, psycopg.ProgrammingError),
+        ([np.arange(3)], ["int4", "int4"], psycopg.DataError),
+        ([np.arange(3), np.arange(4)], ["int4", "int4"], psycopg.DataError),
+        ([np.array([2**40])], ["int4"], psycopg.DataError),
+        ([np.array([0.5])], ["int4"], psycopg.DataError),
+        ([np.array(["a"])], ["text"], psycopg.NotSupportedError),
+        ([np.array([1])], ["date"], psycopg.DataError),
+    ],
+)
+def test_write_columns_error(conn, columns, types, exc):
+    conn.execute("create temp table tcols (a int4, b int4)")
+    cur = conn.cursor()
+    with pytest.raises(exc):
+        with cur.copy("copy tcols (a) from stdin (format binary)") as copy:
+            copy.write_columns(columns, types)
+
+
+@pytest.mark.crdb_skip("copy")
+def test_write_columns_text(conn):
+    conn.execute("create temp table tcols (a int4)")
+    cur = conn.cursor()
+    with pytest.raises(psycopg.NotSupportedError):
+        with cur.copy("copy tcols from stdin") as copy:
+            copy.write_columns([np.arange(3)], ["int4"])
+
+
+@pytest.mark.crdb_skip("copy")
+async def test_write_columns_async(aconn):
+    await aconn.execute("create temp table tcols (a int4)")
+    cur = aconn.cursor()
+    async with cur.copy("copy tcols from stdin (format binary)") as copy:
+        await copy.write_columns([np.arange(5, dtype=np.int32)], ["int4"])
+    await cur.execute("select sum(a) from tcols")
+    assert await cur.fetchone() == (10,)
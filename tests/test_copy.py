@@ -1,8 +1,10 @@
 # WARNING: this file is auto-generated by 'async_to_sync.py'
 # from the original file 'test_copy_async.py'
 # DO NOT CHANGE! Change the original file instead.
+import mmap
 import string
 import hashlib
+import threading
 from io import BytesIO, StringIO
 from random import choice, randrange
 from itertools import cycle
@@ -20,7 +22,7 @@ from psycopg.types.hstore import register_hstore
 from psycopg.types.numeric import Int4
 
 from .utils import eur
-from .acompat import Event, gather, spawn
+from .acompat import Event, gather, skip_sync, spawn
 from ._test_copy import sample_binary  # noqa: F401
 from ._test_copy import FileWriter, ensure_table, py_to_raw, sample_binary_rows
 from ._test_copy import sample_records, sample_tabledef, sample_text, sample_values
@@ -618,6 +620,60 @@ def test_file_writer(conn, format, buffer):
     assert got == want
 
 
+@pytest.mark.parametrize("format", pq.Format)
+def test_read_to_file(conn, format, tmp_path):
+    cur = conn.cursor()
+    path = tmp_path / "data.pgcopy"
+    path.write_bytes(b"garbage")
+    with cur.copy(f"copy ({sample_values}) to stdout (format {format.name})") as copy:
+        size = copy.read_to_file(path)
+
+    want = sample_text if format == pq.Format.TEXT else sample_binary
+    assert path.read_bytes() == want
+    assert size == len(want)
+
+
+@pytest.mark.parametrize("format", pq.Format)
+@pytest.mark.parametrize("writer", ["default", "queued"])
+def test_write_from_file(conn, format, writer, tmp_path, monkeypatch):
+    # Use many small windows and buffers
+    window = mmap.ALLOCATIONGRANULARITY
+    monkeypatch.setattr(psycopg._copy, "MMAP_WINDOW_SIZE", window)
+    monkeypatch.setattr(psycopg._copy, "MAX_BUFFER_SIZE", 1000)
+
+    cur = conn.cursor()
+    ensure_table(cur, "id int primary key, data text")
+    records = [(i, f"record {i}" * (i % 10)) for i in range(5000)]
+    cur.execute(
+        """insert into copy_in
+        select i, repeat('record ' || i, i % 10) from generate_series(0, 4999) i"""
+    )
+    path = tmp_path / "data.pgcopy"
+    with cur.copy(f"copy copy_in to stdout (format {format.name})") as copy:
+        copy.read_to_file(path)
+    cur.execute("truncate copy_in")
+    assert path.stat().st_size > 2 * window
+
+    kwargs = {"writer": QueuedLibpqWriter(cur)} if writer == "queued" else {}
+    with cur.copy(f"copy copy_in from stdin (format {format.name})", **kwargs) as copy:
+        assert copy.write_from_file(path) == path.stat().st_size
+
+    cur.execute("select * from copy_in order by id")
+    assert cur.fetchall() == records
+
+
+def test_write_from_file_empty(conn, tmp_path):
+    cur = conn.cursor()
+    ensure_table(cur, sample_tabledef)
+    path = tmp_path / "data.pgcopy"
+    path.write_bytes(b"")
+    with cur.copy("copy copy_in from stdin") as copy:
+        assert copy.write_from_file(path) == 0
+
+    cur.execute("select count(*) from copy_in")
+    assert cur.fetchone() == (0,)
+
+
 @pytest.mark.slow
 def test_copy_from_to(conn):
     # Roundtrip from file to database to file blockwise
@@ -805,6 +861,117 @@ def test_worker_error_propagated(conn, monkeypatch):
             copy.write("a,b")
 
 
+@pytest.mark.parametrize("format", pq.Format)
+@pytest.mark.parametrize("writer", ["default", "queued"])
+def test_write_rows(conn, format, writer):
+    cur = conn.cursor()
+    ensure_table(cur, "id int primary key, data text")
+    records = [(i, f"data {i}") for i in range(1000)]
+    kwargs = {"writer": QueuedLibpqWriter(cur)} if writer == "queued" else {}
+    with cur.copy(f"copy copy_in from stdin (format {format.name})", **kwargs) as copy:
+        if format == pq.Format.BINARY:
+            copy.set_types(["int4", "text"])
+        copy.write_row((-1, "first"))
+        copy.write_rows(iter(records[:500]), batch_size=7)
+        copy.write_rows(records[500:])
+        copy.write_rows([])
+
+    assert copy.get_stats()["rows"] == 1001
+    cur.execute("select * from copy_in order by id")
+    assert cur.fetchall() == [(-1, "first")] + records
+
+
+@pytest.mark.parametrize("batch_size", [0, -1])
+def test_write_rows_bad_batch_size(conn, batch_size):
+    cur = conn.cursor()
+    ensure_table(cur, "id int primary key, data text")
+    with cur.copy("copy copy_in from stdin") as copy:
+        with pytest.raises(ValueError, match="batch_size"):
+            copy.write_rows([(1, "data")], batch_size=batch_size)
+
+    assert copy.get_stats()["rows"] == 0
+
+
+@skip_sync
+def test_write_rows_thread(conn):
+
+    class Wrapper(str):
+        pass
+
+    threads = set()
+
+    class WrapperDumper(Dumper):
+
+        def dump(self, obj):
+            threads.add(threading.get_ident())
+            return obj.encode()
+
+    cur = conn.cursor()
+    cur.adapters.register_dumper(Wrapper, WrapperDumper)
+    ensure_table(cur, "id int primary key, data text")
+    with cur.copy("copy copy_in from stdin", writer=QueuedLibpqWriter(cur)) as copy:
+        copy.write_rows(((i, Wrapper(f"data {i}")) for i in range(100)))
+
+    assert threads and threading.get_ident() not in threads
+    cur.execute("select count(*) from copy_in")
+    assert cur.fetchone() == (100,)
+
+
+@pytest.mark.parametrize("writer", ["default", "queued"])
+def test_write_coalesced(conn, writer, monkeypatch):
+    calls = []
+    copy_to = psycopg.generators.copy_to
+
+    def copy_to_counted(pgconn, buffer, flush=True):
+        calls.append(len(buffer))
+        return copy_to(pgconn, buffer, flush=flush)
+
+    monkeypatch.setattr(psycopg._copy, "copy_to", copy_to_counted)
+    cur = conn.cursor()
+    ensure_table(cur, "id int primary key, data text")
+    kwargs = {"writer": QueuedLibpqWriter(cur)} if writer == "queued" else {}
+    with cur.copy("copy copy_in from stdin", **kwargs) as copy:
+        for i in range(10000):
+            copy.write(f"{i}\tdata {i}\n")
+        copy.write(b"10000\t" + b"x" * 200000 + b"\n")
+
+    assert len(calls) < 20
+    assert max(calls) <= psycopg._copy_base.MAX_BUFFER_SIZE
+    cur.execute("select count(*), max(length(data)) from copy_in")
+    assert cur.fetchone() == (10001, 200000)
+
+
+def test_write_coalesced_error(conn):
+    cur = conn.cursor()
+    ensure_table(cur, "id int primary key, data text")
+    with pytest.raises(ZeroDivisionError):
+        with cur.copy("copy copy_in from stdin") as copy:
+            copy.write("1\tdata\n")
+            1 / 0
+
+    assert conn.info.transaction_status == pq.TransactionStatus.INERROR
+
+
+@pytest.mark.parametrize("format", pq.Format)
+def test_get_stats(conn, format):
+    cur = conn.cursor()
+    ensure_table(cur, sample_tabledef)
+    with cur.copy(f"copy copy_in from stdin (format {format.name})") as copy:
+        stats = copy.get_stats()
+        assert stats["rows"] == stats["bytes"] == 0
+        for record in sample_records:
+            copy.write_row(record)
+
+    stats = copy.get_stats()
+    assert stats["rows"] == len(sample_records)
+    want = sample_text if format == pq.Format.TEXT else sample_binary
+    assert stats["bytes"] == len(want)
+    assert stats["seconds"] > 0
+    assert stats["rows_per_second"] == pytest.approx(stats["rows"] / stats["seconds"])
+    assert stats["bytes_per_second"] == pytest.approx(stats["bytes"] / stats["seconds"])
+    assert copy.get_stats() == stats
+
+
 @pytest.mark.parametrize(
     "format, buffer",
     [(pq.Format.TEXT, "sample_text"), (pq.Format.BINARY, "sample_binary")],
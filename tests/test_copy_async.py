@@ -1,5 +1,7 @@
+import mmap
 import string
 import hashlib
+import threading
 from io import BytesIO, StringIO
 from random import choice, randrange
 from itertools import cycle
@@ -17,7 +19,7 @@ from psycopg.types.hstore import register_hstore
 from psycopg.types.numeric import Int4
 
 from .utils import eur
-from .acompat import AEvent, alist, gather, spawn
+from .acompat import AEvent, alist, gather, skip_sync, spawn
 from ._test_copy import sample_binary  # noqa: F401
 from ._test_copy import AsyncFileWriter, ensure_table_async, py_to_raw
 from ._test_copy import sample_binary_rows, sample_records, sample_tabledef
@@ -631,6 +633,64 @@ async def test_file_writer(aconn, format, buffer):
     assert got == want
 
 
+@pytest.mark.parametrize("format", pq.Format)
+async def test_read_to_file(aconn, format, tmp_path):
+    cur = aconn.cursor()
+    path = tmp_path / "data.pgcopy"
+    path.write_bytes(b"garbage")
+    async with cur.copy(
+        f"copy ({sample_values}) to stdout (format {format.name})"
+    ) as copy:
+        size = await copy.read_to_file(path)
+
+    want = sample_text if format == pq.Format.TEXT else sample_binary
+    assert path.read_bytes() == want
+    assert size == len(want)
+
+
+@pytest.mark.parametrize("format", pq.Format)
+@pytest.mark.parametrize("writer", ["default", "queued"])
+async def test_write_from_file(aconn, format, writer, tmp_path, monkeypatch):
+    # Use many small windows and buffers
+    window = mmap.ALLOCATIONGRANULARITY
+    monkeypatch.setattr(psycopg._copy_async, "MMAP_WINDOW_SIZE", window)
+    monkeypatch.setattr(psycopg._copy_async, "MAX_BUFFER_SIZE", 1000)
+
+    cur = aconn.cursor()
+    await ensure_table_async(cur, "id int primary key, data text")
+    records = [(i, f"record {i}" * (i % 10)) for i in range(5000)]
+    await cur.execute(
+        """insert into copy_in
+        select i, repeat('record ' || i, i % 10) from generate_series(0, 4999) i"""
+    )
+    path = tmp_path / "data.pgcopy"
+    async with cur.copy(f"copy copy_in to stdout (format {format.name})") as copy:
+        await copy.read_to_file(path)
+    await cur.execute("truncate copy_in")
+    assert path.stat().st_size > 2 * window
+
+    kwargs = {"writer": AsyncQueuedLibpqWriter(cur)} if writer == "queued" else {}
+    async with cur.copy(
+        f"copy copy_in from stdin (format {format.name})", **kwargs
+    ) as copy:
+        assert await copy.write_from_file(path) == path.stat().st_size
+
+    await cur.execute("select * from copy_in order by id")
+    assert await cur.fetchall() == records
+
+
+async def test_write_from_file_empty(aconn, tmp_path):
+    cur = aconn.cursor()
+    await ensure_table_async(cur, sample_tabledef)
+    path = tmp_path / "data.pgcopy"
+    path.write_bytes(b"")
+    async with cur.copy("copy copy_in from stdin") as copy:
+        assert await copy.write_from_file(path) == 0
+
+    await cur.execute("select count(*) from copy_in")
+    assert await cur.fetchone() == (0,)
+
+
 @pytest.mark.slow
 async def test_copy_from_to(aconn):
     # Roundtrip from file to database to file blockwise
@@ -824,6 +884,119 @@ async def test_worker_error_propagated(aconn, monkeypatch):
             await copy.write("a,b")
 
 
+@pytest.mark.parametrize("format", pq.Format)
+@pytest.mark.parametrize("writer", ["default", "queued"])
+async def test_write_rows(aconn, format, writer):
+    cur = aconn.cursor()
+    await ensure_table_async(cur, "id int primary key, data text")
+    records = [(i, f"data {i}") for i in range(1000)]
+    kwargs = {"writer": AsyncQueuedLibpqWriter(cur)} if writer == "queued" else {}
+    async with cur.copy(
+        f"copy copy_in from stdin (format {format.name})", **kwargs
+    ) as copy:
+        if format == pq.Format.BINARY:
+            copy.set_types(["int4", "text"])
+        await copy.write_row((-1, "first"))
+        await copy.write_rows(iter(records[:500]), batch_size=7)
+        await copy.write_rows(records[500:])
+        await copy.write_rows([])
+
+    assert copy.get_stats()["rows"] == 1001
+    await cur.execute("select * from copy_in order by id")
+    assert await cur.fetchall() == [(-1, "first")] + records
+
+
+@pytest.mark.parametrize("batch_size", [0, -1])
+async def test_write_rows_bad_batch_size(aconn, batch_size):
+    cur = aconn.cursor()
+    await ensure_table_async(cur, "id int primary key, data text")
+    async with cur.copy("copy copy_in from stdin") as copy:
+        with pytest.raises(ValueError, match="batch_size"):
+            await copy.write_rows([(1, "data")], batch_size=batch_size)
+
+    assert copy.get_stats()["rows"] == 0
+
+
+@skip_sync
+async def test_write_rows_thread(aconn):
+    class Wrapper(str):
+        pass
+
+    threads = set()
+
+    class WrapperDumper(Dumper):
+        def dump(self, obj):
+            threads.add(threading.get_ident())
+            return obj.encode()
+
+    cur = aconn.cursor()
+    cur.adapters.register_dumper(Wrapper, WrapperDumper)
+    await ensure_table_async(cur, "id int primary key, data text")
+    async with cur.copy(
+        "copy copy_in from stdin", writer=AsyncQueuedLibpqWriter(cur)
+    ) as copy:
+        await copy.write_rows((i, Wrapper(f"data {i}")) for i in range(100))
+
+    assert threads and threading.get_ident() not in threads
+    await cur.execute("select count(*) from copy_in")
+    assert await cur.fetchone() == (100,)
+
+
+@pytest.mark.parametrize("writer", ["default", "queued"])
+async def test_write_coalesced(aconn, writer, monkeypatch):
+    calls = []
+    copy_to = psycopg.generators.copy_to
+
+    def copy_to_counted(pgconn, buffer, flush=True):
+        calls.append(len(buffer))
+        return copy_to(pgconn, buffer, flush=flush)
+
+    monkeypatch.setattr(psycopg._copy_async, "copy_to", copy_to_counted)
+    cur = aconn.cursor()
+    await ensure_table_async(cur, "id int primary key, data text")
+    kwargs = {"writer": AsyncQueuedLibpqWriter(cur)} if writer == "queued" else {}
+    async with cur.copy("copy copy_in from stdin", **kwargs) as copy:
+        for i in range(10_000):
+            await copy.write(f"{i}\tdata {i}\n")
+        await copy.write(b"10000\t" + b"x" * 200_000 + b"\n")
+
+    assert len(calls) < 20
+    assert max(calls) <= psycopg._copy_base.MAX_BUFFER_SIZE
+    await cur.execute("select count(*), max(length(data)) from copy_in")
+    assert await cur.fetchone() == (10_001, 200_000)
+
+
+async def test_write_coalesced_error(aconn):
+    cur = aconn.cursor()
+    await ensure_table_async(cur, "id int primary key, data text")
+    with pytest.raises(ZeroDivisionError):
+        async with cur.copy("copy copy_in from stdin") as copy:
+            await copy.write("1\tdata\n")
+            1 / 0
+
+    assert aconn.info.transaction_status == pq.TransactionStatus.INERROR
+
+
+@pytest.mark.parametrize("format", pq.Format)
+async def test_get_stats(aconn, format):
+    cur = aconn.cursor()
+    await ensure_table_async(cur, sample_tabledef)
+    async with cur.copy(f"copy copy_in from stdin (format {format.name})") as copy:
+        stats = copy.get_stats()
+        assert stats["rows"] == stats["bytes"] == 0
+        for record in sample_records:
+            await copy.write_row(record)
+
+    stats = copy.get_stats()
+    assert stats["rows"] == len(sample_records)
+    want = sample_text if format == pq.Format.TEXT else sample_binary
+    assert stats["bytes"] == len(want)
+    assert stats["seconds"] > 0
+    assert stats["rows_per_second"] == pytest.approx(stats["rows"] / stats["seconds"])
+    assert stats["bytes_per_second"] == pytest.approx(stats["bytes"] / stats["seconds"])
+    assert copy.get_stats() == stats
+
+
 @pytest.mark.parametrize(
     "format, buffer",
     [(pq.Format.TEXT, "sample_text"), (pq.Format.BINARY, "sample_binary")],
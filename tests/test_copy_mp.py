@@ -0,0 +1,121 @@
+import multiprocessing
+from decimal import Decimal
+
+import pytest
+
+import psycopg
+from psycopg import errors as e
+from psycopg import pq
+from psycopg.copy import ProcessPoolFormatter, QueuedLibpqWriter
+
+from ._test_copy import ensure_table
+
+pytestmark = pytest.mark.crdb_skip("copy")
+
+tabledef = "id int primary key, data text, num numeric"
+
+mp_context = multiprocessing.get_context("spawn")
+
+
+def records(n):
+    return [(i, f"data {i}\t\\", Decimal(i) / 10 if i % 3 else None) for i in range(n)]
+
+
+def register_adapters(value):
+    # Executed in the worker processes.
+    psycopg.adapters.register_dumper(Wrapper, WrapperDumper)
+    WrapperDumper.value = value
+
+
+class Wrapper:
+    pass
+
+
+class WrapperDumper(psycopg.adapt.Dumper):
+    value = b""
+
+    def dump(self, obj):
+        return self.value
+
+
+@pytest.mark.parametrize("format", pq.Format)
+@pytest.mark.parametrize("writer", ["default", "queued"])
+def test_write_rows(conn, format, writer):
+    cur = conn.cursor()
+    ensure_table(cur, tabledef)
+    stmt = f"copy copy_in from stdin (format {format.name})"
+    kwargs = {"writer": QueuedLibpqWriter(cur)} if writer == "queued" else {}
+    with cur.copy(stmt, **kwargs) as copy:
+        if format == pq.Format.BINARY:
+            copy.set_types(["int4", "text", "numeric"])
+        copy.write_row((-1, "first", None))
+        with ProcessPoolFormatter(
+            copy, processes=2, batch_size=10, mp_context=mp_context
+        ) as fmt:
+            fmt.write_rows(records(500))
+            fmt.write_rows(records(1000)[500:])
+        copy.write_row((1000, "last", None))
+
+    cur.execute("select * from copy_in order by id")
+    want = [(-1, "first", None)] + records(1000) + [(1000, "last", None)]
+    assert cur.fetchall() == want
+
+
+def test_slot_overflow(conn):
+    cur = conn.cursor()
+    ensure_table(cur, tabledef)
+    with cur.copy("copy copy_in from stdin") as copy:
+        with ProcessPoolFormatter(
+            copy, processes=1, batch_size=100, slot_size=1000, mp_context=mp_context
+        ) as fmt:
+            fmt.write_rows(records(1000))
+
+    cur.execute("select * from copy_in order by id")
+    assert cur.fetchall() == records(1000)
+
+
+def test_initializer(conn):
+    cur = conn.cursor()
+    ensure_table(cur, tabledef)
+    with cur.copy("copy copy_in (id, data) from stdin") as copy:
+        with ProcessPoolFormatter(
+            copy,
+            processes=1,
+            mp_context=mp_context,
+            initializer=register_adapters,
+            initargs=(b"wrapped",),
+        ) as fmt:
+            fmt.write_rows([(1, Wrapper())])
+
+    cur.execute("select data from copy_in")
+    assert cur.fetchone() == ("wrapped",)
+
+
+def test_error(conn):
+    cur = conn.cursor()
+    ensure_table(cur, tabledef)
+    with pytest.raises(e.ProgrammingError, match="cannot adapt"):
+        with cur.copy("copy copy_in (id, data) from stdin") as copy:
+            with ProcessPoolFormatter(copy, processes=2, mp_context=mp_context) as fmt:
+                fmt.write_rows([(1, "a"), (2, Wrapper())])
+
+    assert conn.info.transaction_status == pq.TransactionStatus.INERROR
+
+
+def test_closed(conn):
+    cur = conn.cursor()
+    ensure_table(cur, tabledef)
+    with cur.copy("copy copy_in (id, data) from stdin") as copy:
+        fmt = ProcessPoolFormatter(copy, processes=1, mp_context=mp_context)
+        fmt.close()
+        with pytest.raises(e.ProgrammingError):
+            fmt.write_rows([(1, "a")])
+
+
+def test_encoding(conn):
+    conn.execute("set client_encoding to latin1")
+    cur = conn.cursor()
+    ensure_table(cur, tabledef)
+    with cur.copy("copy copy_in (id, data) from stdin") as copy:
+        with pytest.raises(e.NotSupportedError):
+            ProcessPoolFormatter(copy, mp_context=mp_context)
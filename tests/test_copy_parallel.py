@@ -0,0 +1,145 @@
+from io import BytesIO, StringIO
+from contextlib import contextmanager
+
+import pytest
+
+import psycopg
+from psycopg import errors as e
+from psycopg import sql
+from psycopg.copy import parallel_copy
+
+from ._test_copy import ensure_table
+
+pytestmark = pytest.mark.crdb_skip("copy")
+
+tabledef = "id int primary key, data text"
+copy_stmt = "copy copy_in (id, data) from stdin"
+
+
+@pytest.fixture
+def table(svcconn):
+    ensure_table(svcconn.cursor(), tabledef)
+    yield
+    svcconn.execute("drop table if exists copy_in")
+
+
+def records(n):
+    return ((i, f"data {i}") for i in range(n))
+
+
+def check_table(conn, n):
+    cur = conn.execute("select id, data from copy_in order by id")
+    assert cur.fetchall() == list(records(n))
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_copy_rows(svcconn, dsn, table, workers):
+    nrows = parallel_copy(dsn, copy_stmt, records(1000), workers=workers, chunk_size=7)
+    assert nrows == 1000
+    check_table(svcconn, 1000)
+
+
+@pytest.mark.parametrize("atomic", [False, True])
+def test_copy_few_rows(svcconn, dsn, table, atomic):
+    nrows = parallel_copy(dsn, copy_stmt, records(2), workers=4, atomic=atomic)
+    assert nrows == 2
+    check_table(svcconn, 2)
+
+
+@pytest.mark.parametrize("file_cls", [BytesIO, StringIO])
+def test_copy_file(svcconn, dsn, table, file_cls, monkeypatch):
+    monkeypatch.setattr(psycopg._copy_parallel, "FILE_CHUNK_SIZE", 100)
+    data = "".join(f"{id}\t{data}\n" for id, data in records(1000))
+    f = file_cls(data.encode() if file_cls is BytesIO else data)
+    assert parallel_copy(dsn, copy_stmt, f, workers=3) == 1000
+    check_table(svcconn, 1000)
+
+
+def test_copy_source(svcconn, dsn, table):
+    used = []
+
+    class Source:
+        @contextmanager
+        def connection(self):
+            with psycopg.Connection.connect(dsn) as conn:
+                used.append(conn)
+                yield conn
+
+    assert parallel_copy(Source(), copy_stmt, records(100), chunk_size=10) == 100
+    assert len(used) == 4
+    check_table(svcconn, 100)
+
+
+@pytest.mark.parametrize("atomic", [False, True])
+def test_copy_error(svcconn, dsn, table, atomic):
+    rows = list(records(1000))
+    rows[500] = (500, "data", "extra column")
+    with pytest.raises(e.BadCopyFileFormat):
+        parallel_copy(dsn, copy_stmt, rows, workers=3, chunk_size=10, atomic=atomic)
+
+    cur = svcconn.execute("select count(*) from copy_in")
+    (count,) = cur.fetchone()
+    if atomic:
+        assert count == 0
+    else:
+        assert count < 1000
+
+
+def test_copy_input_error(svcconn, dsn, table):
+    def rows():
+        yield from records(100)
+        1 / 0
+
+    with pytest.raises(ZeroDivisionError):
+        parallel_copy(dsn, copy_stmt, rows(), workers=3, chunk_size=10, atomic=True)
+
+    cur = svcconn.execute("select count(*) from copy_in")
+    assert cur.fetchone() == (0,)
+
+
+def test_connection_error(dsn, table):
+    with pytest.raises(psycopg.OperationalError):
+        parallel_copy(
+            dsn, copy_stmt, records(100), dbname="nosuchdb", workers=2, chunk_size=10
+        )
+
+
+@pytest.mark.parametrize(
+    "stmt",
+    [
+        "copy copy_in from stdin (format csv, header)",
+        "copy copy_in from stdin (format csv, header true)",
+        "COPY copy_in FROM STDIN (FORMAT CSV, HEADER MATCH)",
+        b"copy copy_in from stdin with csv header",
+        sql.SQL("copy {} from stdin (format csv, header)").format(
+            sql.Identifier("copy_in")
+        ),
+    ],
+)
+def test_header(svcconn, dsn, table, stmt):
+    f = StringIO("id,data\n1,a\n2,b\n")
+    with pytest.raises(e.NotSupportedError, match="HEADER"):
+        parallel_copy(dsn, stmt, f, workers=2)
+
+    cur = svcconn.execute("select count(*) from copy_in")
+    assert cur.fetchone() == (0,)
+
+
+@pytest.mark.parametrize(
+    "stmt",
+    [
+        "copy copy_in (id, data) from stdin (format csv, header false)",
+        "copy copy_in (id, data) from stdin (format csv, header off)",
+        "copy copy_in (id, data) from stdin (format csv)",
+    ],
+)
+def test_no_header(svcconn, dsn, table, stmt):
+    f = StringIO("".join(f"{id},{data}\n" for id, data in records(100)))
+    assert parallel_copy(dsn, stmt, f, workers=2) == 100
+    check_table(svcconn, 100)
+
+
+@pytest.mark.parametrize("kwargs", [{"workers": 0}, {"chunk_size": 0}])
+def test_bad_params(dsn, kwargs):
+    with pytest.raises(ValueError):
+        parallel_copy(dsn, copy_stmt, records(10), **kwargs)
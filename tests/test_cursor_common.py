@@ -456,6 +456,124 @@ def test_executemany_rowcount_no_hit(conn, execmany):
     assert cur.rowcount == 0
 
 
+def test_executemany_batch_size(conn, execmany):
+    cur = conn.cursor()
+    cur.executemany(
+        ph(cur, "insert into execmany(num, data) values (%s, %s)"),
+        [(i, f"data{i}") for i in range(25)],
+        batch_size=10,
+    )
+    assert cur.rowcount == 25
+    cur.execute("select num, data from execmany order by 1")
+    assert cur.fetchall() == [(i, f"data{i}") for i in range(25)]
+
+
+def test_executemany_batch_size_name(conn, execmany):
+    cur = conn.cursor()
+    cur.executemany(
+        ph(cur, "insert into execmany(num, data) values (%(num)s, %(data)s)"),
+        ({"data": f"data{i}", "num": i, "x": 1} for i in range(5)),
+        batch_size=2,
+    )
+    assert cur.rowcount == 5
+    cur.execute("select num, data from execmany order by 1")
+    assert cur.fetchall() == [(i, f"data{i}") for i in range(5)]
+
+
+def test_executemany_batch_size_returning(conn, execmany):
+    cur = conn.cursor()
+    cur.executemany(
+        ph(cur, "insert into execmany(num, data) values (%s, %s) returning num"),
+        [(i, "x") for i in range(5)],
+        returning=True,
+        batch_size=2,
+    )
+    got = []
+    while True:
+        got.append(cur.fetchall())
+        if not cur.nextset():
+            break
+    if isinstance(cur, psycopg.RawCursor):
+        # Raw queries are not rewritten
+        assert got == [[(i,)] for i in range(5)]
+    else:
+        assert got == [[(0,), (1,)], [(2,), (3,)], [(4,)]]
+
+
+def test_executemany_batch_size_on_conflict(conn, execmany):
+    cur = conn.cursor()
+    cur.execute("create temp table bsconf (id int primary key, data text)")
+    query = "insert into bsconf (id, data) values (%s, %s)"
+    query += " on conflict (id) do update set data = excluded.data"
+    query = ph(cur, query)
+    cur.executemany(query, [(i, "a") for i in range(5)], batch_size=3)
+    cur.executemany(query, [(i, "b") for i in range(3, 8)], batch_size=3)
+    cur.execute("select id, data from bsconf order by 1")
+    assert cur.fetchall() == [(i, "a" if i < 3 else "b") for i in range(8)]
+
+
+def test_executemany_batch_size_on_conflict_dupes(conn, execmany):
+    # The same key twice in a batch would fail with DO UPDATE if rewritten.
+    cur = conn.cursor()
+    cur.execute("create temp table bsconf (id int primary key, data text)")
+    query = "insert into bsconf (id, data) values (%s, %s)"
+    cur.executemany(
+        ph(cur, query + " on conflict (id) do update set data = excluded.data"),
+        [(1, "a"), (2, "a"), (1, "b")],
+        batch_size=10,
+    )
+    cur.executemany(
+        ph(cur, query + " on conflict (id) do nothing"),
+        [(2, "c"), (3, "c"), (3, "d")],
+        batch_size=10,
+    )
+    cur.execute("select id, data from bsconf order by 1")
+    assert cur.fetchall() == [(1, "b"), (2, "a"), (3, "c")]
+
+
+def test_executemany_batch_size_prepare(conn, execmany):
+    cur = conn.cursor()
+    cur.executemany(
+        ph(cur, "insert into execmany(num, data) values (%s, %s)"),
+        [(i, f"data{i}") for i in range(25)],
+        batch_size=10,
+    )
+    cur.execute(
+        "select statement from pg_prepared_statements where statement ~* 'execmany'"
+    )
+    stmts = [rec[0] for rec in cur.fetchall()]
+    if isinstance(cur, psycopg.ClientCursor):
+        assert not stmts
+    elif isinstance(cur, psycopg.RawCursor):
+        assert len(stmts) == 1
+    else:
+        # The last batch, shorter, is not prepared.
+        (stmt,) = stmts
+        assert stmt.count("$") == 20
+
+
+def test_executemany_batch_size_no_rewrite(conn, execmany):
+    cur = conn.cursor()
+    cur.executemany(
+        ph(cur, "insert into execmany(num, data) values (%s, %s)"), [(1, "a"), (2, "b")]
+    )
+    cur.executemany(
+        ph(cur, "update execmany set data = %s where num = %s"),
+        [("x", 1), ("y", 2)],
+        batch_size=10,
+    )
+    assert cur.rowcount == 2
+    cur.execute("select num, data from execmany order by 1")
+    assert cur.fetchall() == [(1, "x"), (2, "y")]
+
+
+@pytest.mark.parametrize("batch_size", [0, -1])
+def test_executemany_batch_size_bad(conn, batch_size):
+    cur = conn.cursor()
+    with pytest.raises(ValueError):
+        cur.executemany(ph(cur, "select %s"), [(1,), (2,)], batch_size=batch_size)
+
+
 @pytest.mark.parametrize(
     "query",
     [
@@ -882,6 +1000,57 @@ def test_stream_binary_cursor_text_override(conn):
     assert recs == [(1,), (2,)]
 
 
+@pytest.mark.parametrize("prefetch", [1, 3, 100])
+def test_stream_prefetch(conn, prefetch):
+    cur = conn.cursor()
+    query = "select i, i::text from generate_series(1, 1000) i"
+    recs = list(cur.stream(query, prefetch=prefetch))
+    assert recs == [(i, str(i)) for i in range(1, 1001)]
+    assert conn.info.transaction_status == pq.TransactionStatus.INTRANS
+
+
+def test_stream_prefetch_invalid(conn):
+    cur = conn.cursor()
+    with pytest.raises(ValueError, match="prefetch must be >= 0"):
+        next(cur.stream("select 1", prefetch=-1))
+
+
+@pytest.mark.parametrize("autocommit", [False, True])
+def test_stream_prefetch_error(conn, autocommit):
+    conn.set_autocommit(autocommit)
+    cur = conn.cursor()
+    recs = []
+    with pytest.raises(psycopg.errors.DivisionByZero):
+        for rec in cur.stream(
+            "select 1 / (5 - i) from generate_series(1, 10) i", prefetch=10
+        ):
+            recs.append(rec)
+
+    assert recs == [(0,), (0,), (0,), (1,)]
+    assert conn.info.transaction_status == (
+        pq.TransactionStatus.IDLE if autocommit else pq.TransactionStatus.INERROR
+    )
+
+
+@pytest.mark.parametrize("autocommit", [False, True])
+def test_stream_prefetch_interrupt(conn, autocommit):
+    conn.set_autocommit(autocommit)
+    cur = conn.cursor()
+    with pytest.raises(ZeroDivisionError):
+        with closing(
+            cur.stream("select generate_series(1, 1000000)", prefetch=2)
+        ) as gen:
+            for rec in gen:
+                if rec[0] == 10:
+                    1 / 0
+
+    assert conn.info.transaction_status != pq.TransactionStatus.ACTIVE
+    if not autocommit:
+        conn.rollback()
+    cur = conn.execute("select 1")
+    assert cur.fetchone() == (1,)
+
+
 def test_str(conn):
     cur = conn.cursor()
     assert "[IDLE]" in str(cur)
@@ -458,6 +458,125 @@ async def test_executemany_rowcount_no_hit(aconn, execmany):
     assert cur.rowcount == 0
 
 
+async def test_executemany_batch_size(aconn, execmany):
+    cur = aconn.cursor()
+    await cur.executemany(
+        ph(cur, "insert into execmany(num, data) values (%s, %s)"),
+        [(i, f"data{i}") for i in range(25)],
+        batch_size=10,
+    )
+    assert cur.rowcount == 25
+    await cur.execute("select num, data from execmany order by 1")
+    assert (await cur.fetchall()) == [(i, f"data{i}") for i in range(25)]
+
+
+async def test_executemany_batch_size_name(aconn, execmany):
+    cur = aconn.cursor()
+    await cur.executemany(
+        ph(cur, "insert into execmany(num, data) values (%(num)s, %(data)s)"),
+        ({"data": f"data{i}", "num": i, "x": 1} for i in range(5)),
+        batch_size=2,
+    )
+    assert cur.rowcount == 5
+    await cur.execute("select num, data from execmany order by 1")
+    assert (await cur.fetchall()) == [(i, f"data{i}") for i in range(5)]
+
+
+async def test_executemany_batch_size_returning(aconn, execmany):
+    cur = aconn.cursor()
+    await cur.executemany(
+        ph(cur, "insert into execmany(num, data) values (%s, %s) returning num"),
+        [(i, "x") for i in range(5)],
+        returning=True,
+        batch_size=2,
+    )
+    got = []
+    while True:
+        got.append(await cur.fetchall())
+        if not cur.nextset():
+            break
+    if isinstance(cur, psycopg.AsyncRawCursor):
+        # Raw queries are not rewritten
+        assert got == [[(i,)] for i in range(5)]
+    else:
+        assert got == [[(0,), (1,)], [(2,), (3,)], [(4,)]]
+
+
+async def test_executemany_batch_size_on_conflict(aconn, execmany):
+    cur = aconn.cursor()
+    await cur.execute("create temp table bsconf (id int primary key, data text)")
+    query = "insert into bsconf (id, data) values (%s, %s)"
+    query += " on conflict (id) do update set data = excluded.data"
+    query = ph(cur, query)
+    await cur.executemany(query, [(i, "a") for i in range(5)], batch_size=3)
+    await cur.executemany(query, [(i, "b") for i in range(3, 8)], batch_size=3)
+    await cur.execute("select id, data from bsconf order by 1")
+    assert (await cur.fetchall()) == [(i, "a" if i < 3 else "b") for i in range(8)]
+
+
+async def test_executemany_batch_size_on_conflict_dupes(aconn, execmany):
+    # The same key twice in a batch would fail with DO UPDATE if rewritten.
+    cur = aconn.cursor()
+    await cur.execute("create temp table bsconf (id int primary key, data text)")
+    query = "insert into bsconf (id, data) values (%s, %s)"
+    await cur.executemany(
+        ph(cur, query + " on conflict (id) do update set data = excluded.data"),
+        [(1, "a"), (2, "a"), (1, "b")],
+        batch_size=10,
+    )
+    await cur.executemany(
+        ph(cur, query + " on conflict (id) do nothing"),
+        [(2, "c"), (3, "c"), (3, "d")],
+        batch_size=10,
+    )
+    await cur.execute("select id, data from bsconf order by 1")
+    assert (await cur.fetchall()) == [(1, "b"), (2, "a"), (3, "c")]
+
+
+async def test_executemany_batch_size_prepare(aconn, execmany):
+    cur = aconn.cursor()
+    await cur.executemany(
+        ph(cur, "insert into execmany(num, data) values (%s, %s)"),
+        [(i, f"data{i}") for i in range(25)],
+        batch_size=10,
+    )
+    await cur.execute(
+        "select statement from pg_prepared_statements where statement ~* 'execmany'"
+    )
+    stmts = [rec[0] for rec in await cur.fetchall()]
+    if isinstance(cur, psycopg.AsyncClientCursor):
+        assert not stmts
+    elif isinstance(cur, psycopg.AsyncRawCursor):
+        assert len(stmts) == 1
+    else:
+        # The last batch, shorter, is not prepared.
+        (stmt,) = stmts
+        assert stmt.count("$") == 20
+
+
+async def test_executemany_batch_size_no_rewrite(aconn, execmany):
+    cur = aconn.cursor()
+    await cur.executemany(
+        ph(cur, "insert into execmany(num, data) values (%s, %s)"),
+        [(1, "a"), (2, "b")],
+    )
+    await cur.executemany(
+        ph(cur, "update execmany set data = %s where num = %s"),
+        [("x", 1), ("y", 2)],
+        batch_size=10,
+    )
+    assert cur.rowcount == 2
+    await cur.execute("select num, data from execmany order by 1")
+    assert (await cur.fetchall()) == [(1, "x"), (2, "y")]
+
+
+@pytest.mark.parametrize("batch_size", [0, -1])
+async def test_executemany_batch_size_bad(aconn, batch_size):
+    cur = aconn.cursor()
+    with pytest.raises(ValueError):
+        await cur.executemany(ph(cur, "select %s"), [(1,), (2,)], batch_size=batch_size)
+
+
 @pytest.mark.parametrize(
     "query",
     [
@@ -890,6 +1009,57 @@ async def test_stream_binary_cursor_text_override(aconn):
     assert recs == [(1,), (2,)]
 
 
+@pytest.mark.parametrize("prefetch", [1, 3, 100])
+async def test_stream_prefetch(aconn, prefetch):
+    cur = aconn.cursor()
+    query = "select i, i::text from generate_series(1, 1000) i"
+    recs = await alist(cur.stream(query, prefetch=prefetch))
+    assert recs == [(i, str(i)) for i in range(1, 1001)]
+    assert aconn.info.transaction_status == pq.TransactionStatus.INTRANS
+
+
+async def test_stream_prefetch_invalid(aconn):
+    cur = aconn.cursor()
+    with pytest.raises(ValueError, match=r"prefetch must be >= 0"):
+        await anext(cur.stream("select 1", prefetch=-1))
+
+
+@pytest.mark.parametrize("autocommit", [False, True])
+async def test_stream_prefetch_error(aconn, autocommit):
+    await aconn.set_autocommit(autocommit)
+    cur = aconn.cursor()
+    recs = []
+    with pytest.raises(psycopg.errors.DivisionByZero):
+        async for rec in cur.stream(
+            "select 1 / (5 - i) from generate_series(1, 10) i", prefetch=10
+        ):
+            recs.append(rec)
+
+    assert recs == [(0,), (0,), (0,), (1,)]
+    assert aconn.info.transaction_status == (
+        pq.TransactionStatus.IDLE if autocommit else pq.TransactionStatus.INERROR
+    )
+
+
+@pytest.mark.parametrize("autocommit", [False, True])
+async def test_stream_prefetch_interrupt(aconn, autocommit):
+    await aconn.set_autocommit(autocommit)
+    cur = aconn.cursor()
+    with pytest.raises(ZeroDivisionError):
+        async with aclosing(
+            cur.stream("select generate_series(1, 1000000)", prefetch=2)
+        ) as gen:
+            async for rec in gen:
+                if rec[0] == 10:
+                    1 / 0
+
+    assert aconn.info.transaction_status != pq.TransactionStatus.ACTIVE
+    if not autocommit:
+        await aconn.rollback()
+    cur = await aconn.execute("select 1")
+    assert await cur.fetchone() == (1,)
+
+
 async def test_str(aconn):
     cur = aconn.cursor()
     assert "[IDLE]" in str(cur)
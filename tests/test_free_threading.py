@@ -182,3 +182,67 @@ def test_same_cursor_from_multiple_threads_no_crash(conn):
             future.result()
 
     cur.close()
+
+
+@pytest.fixture
+def parallel_load(monkeypatch):
+    from psycopg import _parallel
+
+    monkeypatch.setattr(_parallel, "gil_enabled", lambda: False)
+    monkeypatch.setattr(_parallel, "MIN_ROWS_PER_THREAD", 10)
+
+    calls = []
+    load_rows = _parallel.load_rows
+
+    def load_rows_(tx, row0, row1, make_row, nthreads):
+        calls.append((row0, row1, nthreads))
+        return load_rows(tx, row0, row1, make_row, nthreads)
+
+    monkeypatch.setattr(_parallel, "load_rows", load_rows_)
+    return calls
+
+
+@pytest.mark.parametrize("row_factory", ["tuple_row", "dict_row", "lazy_row"])
+def test_load_threads(conn, parallel_load, row_factory):
+    conn.load_threads = 4
+    cur = conn.cursor(row_factory=getattr(psycopg.rows, row_factory))
+    cur.execute("select g, g::text as t from generate_series(1, 100) g")
+    assert cur.fetchone()
+    recs = cur.fetchmany(35)
+    recs += cur.fetchall()
+    assert parallel_load == [(1, 36, 4), (36, 100, 4)]
+
+    conn.load_threads = 1
+    cur.execute("select g, g::text as t from generate_series(2, 100) g")
+    assert recs == cur.fetchall()
+
+
+def test_load_threads_server_cursor(conn, parallel_load):
+    conn.load_threads = 3
+    with conn.cursor("test") as cur:
+        cur.execute("select g from generate_series(1, 100) g")
+        assert cur.fetchall() == [(i,) for i in range(1, 101)]
+    assert parallel_load == [(0, 100, 3)]
+
+
+def test_load_threads_error(conn, parallel_load):
+    conn.load_threads = 4
+
+    def make_row(values):
+        if values[0] == 70:
+            raise ZeroDivisionError
+        return values[0]
+
+    cur = conn.cursor(row_factory=lambda cur: make_row)
+    cur.execute("select generate_series(1, 100)")
+    with pytest.raises(ZeroDivisionError):
+        cur.fetchall()
+
+
+def test_load_threads_default(conn, parallel_load):
+    assert conn.load_threads == 1
+    conn.execute("select generate_series(1, 100)").fetchall()
+    assert not parallel_load
+
+    with pytest.raises(ValueError):
+        conn.load_threads = 0
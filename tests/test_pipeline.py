@@ -379,6 +379,56 @@ def test_executemany_trace(conn, trace):
     assert len([i for i in items if i.type == "Sync"]) == 1
 
 
+@pytest.mark.crdb("skip", reason="temp tables")
+def test_executemany_max_pending(conn, trace):
+    conn.set_autocommit(True)
+    cur = conn.cursor()
+    cur.execute("create temp table trace (id int)")
+    t = trace.trace(conn)
+    with conn.pipeline() as p:
+        p.max_pending = 10
+        cur.executemany(
+            "insert into trace (id) values (%s)", [(i,) for i in range(100)]
+        )
+        assert len(p.result_queue) < 10
+    assert cur.rowcount == 100
+    conn.close()
+    items = list(t)
+    assert len([i for i in items if i.type == "Flush"]) >= 10
+    assert len([i for i in items if i.type == "Sync"]) == 1
+
+
+@pytest.mark.crdb("skip", reason="temp tables")
+def test_executemany_max_pending_bytes(conn, trace):
+    conn.set_autocommit(True)
+    cur = conn.cursor()
+    cur.execute("create temp table trace (data text)")
+    t = trace.trace(conn)
+    with conn.pipeline() as p:
+        p.max_pending_bytes = 10000
+        cur.executemany("insert into trace (data) values (%s)", [("x" * 1000,)] * 100)
+        cur.execute("select count(*), sum(length(data)) from trace")
+        assert cur.fetchone() == (100, 100000)
+    conn.close()
+    items = list(t)
+    assert len([i for i in items if i.type == "Flush"]) >= 10
+
+
+def test_executemany_max_pending_atomic(conn):
+    conn.set_autocommit(True)
+    conn.execute("drop table if exists execmanypending")
+    conn.execute("create unlogged table execmanypending (id int primary key)")
+    with pytest.raises(e.UniqueViolation):
+        with conn.pipeline() as p:
+            p.max_pending = 10
+            conn.cursor().executemany(
+                "insert into execmanypending (id) values (%s)",
+                [(i,) for i in range(50)] + [(0,)],
+            )
+    cur = conn.execute("select count(*) from execmanypending")
+    assert cur.fetchone() == (0,)
+
+
 @pytest.mark.crdb("skip", reason="temp tables")
 def test_executemany_trace_returning(conn, trace):
     conn.set_autocommit(True)
@@ -376,6 +376,58 @@ async def test_executemany_trace(aconn, trace):
     assert len([i for i in items if i.type == "Sync"]) == 1
 
 
+@pytest.mark.crdb("skip", reason="temp tables")
+async def test_executemany_max_pending(aconn, trace):
+    await aconn.set_autocommit(True)
+    cur = aconn.cursor()
+    await cur.execute("create temp table trace (id int)")
+    t = trace.trace(aconn)
+    async with aconn.pipeline() as p:
+        p.max_pending = 10
+        await cur.executemany(
+            "insert into trace (id) values (%s)", [(i,) for i in range(100)]
+        )
+        assert len(p.result_queue) < 10
+    assert cur.rowcount == 100
+    await aconn.close()
+    items = list(t)
+    assert len([i for i in items if i.type == "Flush"]) >= 10
+    assert len([i for i in items if i.type == "Sync"]) == 1
+
+
+@pytest.mark.crdb("skip", reason="temp tables")
+async def test_executemany_max_pending_bytes(aconn, trace):
+    await aconn.set_autocommit(True)
+    cur = aconn.cursor()
+    await cur.execute("create temp table trace (data text)")
+    t = trace.trace(aconn)
+    async with aconn.pipeline() as p:
+        p.max_pending_bytes = 10_000
+        await cur.executemany(
+            "insert into trace (data) values (%s)", [("x" * 1000,)] * 100
+        )
+        await cur.execute("select count(*), sum(length(data)) from trace")
+        assert await cur.fetchone() == (100, 100_000)
+    await aconn.close()
+    items = list(t)
+    assert len([i for i in items if i.type == "Flush"]) >= 10
+
+
+async def test_executemany_max_pending_atomic(aconn):
+    await aconn.set_autocommit(True)
+    await aconn.execute("drop table if exists execmanypending")
+    await aconn.execute("create unlogged table execmanypending (id int primary key)")
+    with pytest.raises(e.UniqueViolation):
+        async with aconn.pipeline() as p:
+            p.max_pending = 10
+            await aconn.cursor().executemany(
+                "insert into execmanypending (id) values (%s)",
+                [(i,) for i in range(50)] + [(0,)],
+            )
+    cur = await aconn.execute("select count(*) from execmanypending")
+    assert await cur.fetchone() == (0,)
+
+
 @pytest.mark.crdb("skip", reason="temp tables")
 async def test_executemany_trace_returning(aconn, trace):
     await aconn.set_autocommit(True)
@@ -14,6 +14,7 @@ import pytest
 
 import psycopg
 from psycopg.rows import namedtuple_row
+from psycopg.prepare import CostPolicy, EvictionPolicy, LFUPolicy
 from psycopg.pq._debug import PGconnDebug
 
 
@@ -179,6 +180,122 @@ def test_evict_lru_deallocate(conn):
     assert got == [f"select {i}" for i in ["'a'", 6, 7, 8, 9]]
 
 
+def test_evict_lfu(conn):
+    conn.prepared_max = 3
+    conn.prepare_threshold = 0
+    conn.prepare_policy = LFUPolicy()
+    for i in range(10):
+        conn.execute("select 'a'")
+        if i % 2:
+            conn.execute("select 'b'")
+        conn.execute(f"select {i}")
+
+    got = [stmt.query for stmt in conn.get_prepared_statements()]
+    assert got == [b"select 'a'", b"select 'b'", b"select 9"]
+    stmts = get_prepared_statements(conn)
+    assert sorted((stmt.statement for stmt in stmts)) == [
+        "select 'a'",
+        "select 'b'",
+        "select 9",
+    ]
+
+
+def test_evict_cost(conn):
+    conn.prepared_max = 2
+    conn.prepare_threshold = 0
+    conn.prepare_policy = CostPolicy()
+    for i in range(3):
+        conn.execute(f"select {i}")
+        conn.execute(f"select {i}")
+
+    stmts = conn.get_prepared_statements()
+    assert len(stmts) == 2
+    assert stmts[-1].query == b"select 2"
+    for stmt in stmts:
+        assert stmt.executions == 2
+        assert stmt.parse_time is not None and stmt.parse_time > 0
+
+
+def test_evict_custom_policy(conn):
+
+    class MRUPolicy(EvictionPolicy):
+
+        def choose(self, statements):
+            assert [s.query for s in statements] == [b"select 0", b"select 1"]
+            return statements[-1]
+
+    conn.prepared_max = 2
+    conn.prepare_threshold = 0
+    conn.prepare_policy = MRUPolicy()
+    for i in range(3):
+        conn.execute(f"select {i}")
+
+    got = [stmt.query for stmt in conn.get_prepared_statements()]
+    assert got == [b"select 0", b"select 2"]
+    stmts = get_prepared_statements(conn)
+    assert sorted((stmt.statement for stmt in stmts)) == ["select 0", "select 2"]
+
+
+@pytest.mark.pipeline
+def test_evict_custom_policy_pipeline(conn):
+
+    class MRUPolicy(EvictionPolicy):
+
+        def choose(self, statements):
+            return statements[-1]
+
+    conn.set_autocommit(True)
+    conn.prepared_max = 2
+    conn.prepare_threshold = 0
+    conn.prepare_policy = MRUPolicy()
+    conn.execute("select 0")
+    conn.execute("select 1")
+    with conn.pipeline():
+        # 'select 0' is used again before the result of 'select 2' is received
+        conn.execute("select 2")
+        conn.execute("select 0")
+
+    got = [stmt.query for stmt in conn.get_prepared_statements()]
+    assert got == [b"select 1", b"select 2"]
+
+
+def test_prepared_stats_deallocate_all(conn):
+    conn.prepare_threshold = 0
+    conn.execute("select 1")
+    conn.rollback()
+    conn.execute("select 2")
+
+    stats = conn.get_prepared_stats()
+    assert stats["deallocations_all"] == 1
+    assert "deallocations" not in stats
+
+
+def test_prepared_stats(conn):
+    assert conn.get_prepared_stats() == {"size": 0}
+    conn.prepared_max = 2
+    for i in range(7):
+        conn.execute("select 'a'")
+    for i in range(3):
+        conn.execute(f"select {i}", prepare=True)
+    conn.execute("select 'x'", prepare=False)
+
+    assert conn.get_prepared_stats() == {
+        "size": 2,
+        "hits": 1,
+        "misses": 9,
+        "prepares": 4,
+        "evictions": 2,
+        "deallocations": 2,
+    }
+    stmts = conn.get_prepared_statements()
+    assert [(s.query, s.executions) for s in stmts] == [
+        (b"select 1", 1),
+        (b"select 2", 1),
+    ]
+    assert stmts[0].types == ()
+    assert stmts[0].name.startswith(b"_pg3_")
+
+
 @pytest.mark.skipif("psycopg._cmodule._psycopg", reason="Python-only debug conn")
 def test_deallocate_or_close(conn, caplog):
     conn.pgconn = PGconnDebug(conn.pgconn)
@@ -303,6 +420,27 @@ def test_change_type_savepoint(conn):
                     raise ZeroDivisionError()
 
 
+def test_preload(conn):
+    conn.prepared_max = 2
+    keys: list[tuple[bytes, tuple[int, ...]]] = [
+        (b"select $1::int", (0,)),
+        (b"select nosuchfunc()", ()),
+        (b"select $1::text", (0,)),
+        (b"select 42", ()),
+    ]
+    with conn.lock:
+        failed = conn.wait(conn._prepared.preload_gen(conn, keys))
+
+    assert failed == [(b"select nosuchfunc()", ())]
+    assert conn._prepared.prepared_keys() == [keys[0], keys[2]]
+    stmts = get_prepared_statements(conn)
+    assert [s.statement for s in stmts] == ["select $1::int", "select $1::text"]
+
+    cur = conn.execute("select %s::text", ["hello"])
+    assert cur.fetchone() == ("hello",)
+    assert len(get_prepared_statements(conn)) == 2
+
+
 def get_prepared_statements(conn):
     cur = conn.cursor(row_factory=namedtuple_row)
     # CRDB has 'PREPARE name AS' in the statement.
@@ -11,6 +11,7 @@ import pytest
 
 import psycopg
 from psycopg.rows import namedtuple_row
+from psycopg.prepare import CostPolicy, EvictionPolicy, LFUPolicy
 from psycopg.pq._debug import PGconnDebug
 
 
@@ -178,6 +179,118 @@ async def test_evict_lru_deallocate(aconn):
     assert got == [f"select {i}" for i in ["'a'", 6, 7, 8, 9]]
 
 
+async def test_evict_lfu(aconn):
+    aconn.prepared_max = 3
+    aconn.prepare_threshold = 0
+    aconn.prepare_policy = LFUPolicy()
+    for i in range(10):
+        await aconn.execute("select 'a'")
+        if i % 2:
+            await aconn.execute("select 'b'")
+        await aconn.execute(f"select {i}")
+
+    got = [stmt.query for stmt in aconn.get_prepared_statements()]
+    assert got == [b"select 'a'", b"select 'b'", b"select 9"]
+    stmts = await get_prepared_statements(aconn)
+    assert sorted(stmt.statement for stmt in stmts) == [
+        "select 'a'",
+        "select 'b'",
+        "select 9",
+    ]
+
+
+async def test_evict_cost(aconn):
+    aconn.prepared_max = 2
+    aconn.prepare_threshold = 0
+    aconn.prepare_policy = CostPolicy()
+    for i in range(3):
+        await aconn.execute(f"select {i}")
+        await aconn.execute(f"select {i}")
+
+    stmts = aconn.get_prepared_statements()
+    assert len(stmts) == 2
+    assert stmts[-1].query == b"select 2"
+    for stmt in stmts:
+        assert stmt.executions == 2
+        assert stmt.parse_time is not None and stmt.parse_time > 0
+
+
+async def test_evict_custom_policy(aconn):
+    class MRUPolicy(EvictionPolicy):
+        def choose(self, statements):
+            assert [s.query for s in statements] == [b"select 0", b"select 1"]
+            return statements[-1]
+
+    aconn.prepared_max = 2
+    aconn.prepare_threshold = 0
+    aconn.prepare_policy = MRUPolicy()
+    for i in range(3):
+        await aconn.execute(f"select {i}")
+
+    got = [stmt.query for stmt in aconn.get_prepared_statements()]
+    assert got == [b"select 0", b"select 2"]
+    stmts = await get_prepared_statements(aconn)
+    assert sorted(stmt.statement for stmt in stmts) == ["select 0", "select 2"]
+
+
+@pytest.mark.pipeline
+async def test_evict_custom_policy_pipeline(aconn):
+    class MRUPolicy(EvictionPolicy):
+        def choose(self, statements):
+            return statements[-1]
+
+    await aconn.set_autocommit(True)
+    aconn.prepared_max = 2
+    aconn.prepare_threshold = 0
+    aconn.prepare_policy = MRUPolicy()
+    await aconn.execute("select 0")
+    await aconn.execute("select 1")
+    async with aconn.pipeline():
+        # 'select 0' is used again before the result of 'select 2' is received
+        await aconn.execute("select 2")
+        await aconn.execute("select 0")
+
+    got = [stmt.query for stmt in aconn.get_prepared_statements()]
+    assert got == [b"select 1", b"select 2"]
+
+
+async def test_prepared_stats_deallocate_all(aconn):
+    aconn.prepare_threshold = 0
+    await aconn.execute("select 1")
+    await aconn.rollback()
+    await aconn.execute("select 2")
+
+    stats = aconn.get_prepared_stats()
+    assert stats["deallocations_all"] == 1
+    assert "deallocations" not in stats
+
+
+async def test_prepared_stats(aconn):
+    assert aconn.get_prepared_stats() == {"size": 0}
+    aconn.prepared_max = 2
+    for i in range(7):
+        await aconn.execute("select 'a'")
+    for i in range(3):
+        await aconn.execute(f"select {i}", prepare=True)
+    await aconn.execute("select 'x'", prepare=False)
+
+    assert aconn.get_prepared_stats() == {
+        "size": 2,
+        "hits": 1,
+        "misses": 9,
+        "prepares": 4,
+        "evictions": 2,
+        "deallocations": 2,
+    }
+    stmts = aconn.get_prepared_statements()
+    assert [(s.query, s.executions) for s in stmts] == [
+        (b"select 1", 1),
+        (b"select 2", 1),
+    ]
+    assert stmts[0].types == ()
+    assert stmts[0].name.startswith(b"_pg3_")
+
+
 @pytest.mark.skipif("psycopg._cmodule._psycopg", reason="Python-only debug conn")
 async def test_deallocate_or_close(aconn, caplog):
     aconn.pgconn = PGconnDebug(aconn.pgconn)
@@ -306,6 +419,27 @@ async def test_change_type_savepoint(aconn):
                     raise ZeroDivisionError()
 
 
+async def test_preload(aconn):
+    aconn.prepared_max = 2
+    keys: list[tuple[bytes, tuple[int, ...]]] = [
+        (b"select $1::int", (0,)),
+        (b"select nosuchfunc()", ()),
+        (b"select $1::text", (0,)),
+        (b"select 42", ()),
+    ]
+    async with aconn.lock:
+        failed = await aconn.wait(aconn._prepared.preload_gen(aconn, keys))
+
+    assert failed == [(b"select nosuchfunc()", ())]
+    assert aconn._prepared.prepared_keys() == [keys[0], keys[2]]
+    stmts = await get_prepared_statements(aconn)
+    assert [s.statement for s in stmts] == ["select $1::int", "select $1::text"]
+
+    cur = await aconn.execute("select %s::text", ["hello"])
+    assert await cur.fetchone() == ("hello",)
+    assert len(await get_prepared_statements(aconn)) == 2
+
+
 async def get_prepared_statements(aconn):
     cur = aconn.cursor(row_factory=namedtuple_row)
     # CRDB has 'PREPARE name AS' in the statement.
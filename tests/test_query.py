@@ -3,7 +3,7 @@ import pytest
 import psycopg
 from psycopg import pq
 from psycopg.adapt import PyFormat, Transformer
-from psycopg._queries import PostgresQuery, _split_query
+from psycopg._queries import PostgresQuery, _split_batch_query_nocache, _split_query
 
 
 @pytest.mark.parametrize(
@@ -160,3 +160,76 @@ def test_pq_query_badprog(query, params):
     pq = PostgresQuery(Transformer())
     with pytest.raises(psycopg.ProgrammingError):
         pq.convert(query, params)
+
+
+@pytest.mark.parametrize(
+    "query, head, row, tail",
+    [
+        (
+            b"insert into t values (%s, %s)",
+            b"insert into t values ",
+            b"(%s, %s)",
+            b"",
+        ),
+        (
+            b"INSERT INTO t (a, b) VALUES (%b, %t) RETURNING a",
+            b"INSERT INTO t (a, b) VALUES ",
+            b"(%b, %t)",
+            b" RETURNING a",
+        ),
+        (
+            b"insert into t values (%(b)s, %(a)s, %(b)s)",
+            b"insert into t values ",
+            b"(%s, %s, %s)",
+            b"",
+        ),
+        (
+            b"insert into t values (coalesce(%s, 'x)'), '%%', now())"
+            b" on conflict (a) do nothing",
+            b"insert into t values ",
+            b"(coalesce(%s, 'x)'), '%%', now())",
+            b" on conflict (a) do nothing",
+        ),
+    ],
+)
+def test_split_batch_query(query, head, row, tail):
+    batch = _split_batch_query_nocache(query, "utf8")
+    assert batch
+    assert batch.head == head
+    assert batch.row == row
+    assert batch.tail == tail
+    assert batch.query(2) == head + row + b", " + row + tail
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        b"insert into t values (1, 2)",
+        b"insert into t select %s, %s",
+        b"update t set a = %s",
+        b"insert into t values (%s, %s), (%s, %s)",
+        b"insert into t values (%s), (1)",
+        b"insert into t values (%s) returning a + %s",
+        b"insert into t values (%s, $$)$$)",
+        b"insert into t values (%s /* ) */)",
+        b"insert into t values (%s) on conflict (a) do update set b = excluded.b",
+        b"INSERT INTO t VALUES (%s) ON CONFLICT ON CONSTRAINT c DO\nUPDATE SET b = 1",
+    ],
+)
+def test_split_batch_query_no(query):
+    assert _split_batch_query_nocache(query, "utf8") is None
+
+
+def test_split_batch_query_params():
+    batch = _split_batch_query_nocache(
+        b"insert into t values (%(b)s, %(a)s, %(b)s)", "utf8"
+    )
+    assert batch
+    rows = [{"a": 1, "b": 2}, {"a": 3, "b": 4, "c": 5}]
+    assert batch.params(rows) == [2, 1, 2, 4, 3, 4]
+
+    batch = _split_batch_query_nocache(b"insert into t values (%s, %s)", "utf8")
+    assert batch
+    assert batch.params([(1, 2), [3, 4]]) == [1, 2, 3, 4]
+    with pytest.raises(psycopg.ProgrammingError):
+        batch.params([(1, 2, 3)])
@@ -112,8 +112,62 @@ def test_scalar_row(conn):
         cur.execute("select")
 
 
+def test_lazy_row(conn):
+    cur = conn.cursor(row_factory=rows.lazy_row)
+    cur.execute("select 'bob' as name, 3 as id, null::int as age, 'x' as name")
+    row = cur.fetchone()
+    assert isinstance(row, rows.LazyRow)
+    assert not row._cache
+    assert row[1] == 3
+    assert row._cache == {1: 3}
+    assert row["id"] == 3
+    assert row[-2] is None
+    assert row["name"] == "x"
+    assert len(row) == 4
+    assert row[1:3] == (3, None)
+    assert row == ("bob", 3, None, "x")
+    assert list(row) == ["bob", 3, None, "x"]
+    assert row.keys() == ["name", "id", "age", "name"]
+    with pytest.raises(IndexError):
+        row[4]
+    with pytest.raises(KeyError):
+        row["nosuchcol"]
+
+    cur.execute("select 'a' as letter; select generate_series(1, 3) as number")
+    assert cur.fetchall() == [("a",)]
+    assert cur.nextset()
+    recs = cur.fetchmany(2)
+    assert [r["number"] for r in recs] == [1, 2]
+    assert [r["number"] for r in cur] == [3]
+    assert not cur.nextset()
+
+    # Rows outlive the cursor results
+    cur.execute(f"select {eur!r}::text as v, 42::bigint as n")
+    row = cur.fetchone()
+    cur.execute("select 1")
+    assert row._asdict() == {"v": eur, "n": 42}
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_lazy_row_types(conn, binary):
+    cur = conn.cursor(row_factory=rows.lazy_row, binary=binary)
+    cur.execute("select 1.5::numeric, array[1, null, 3], '{\"a\": 1}'::jsonb")
+    (row,) = cur.fetchall()
+    assert row[2] == {"a": 1}
+    assert row[1] == [1, None, 3]
+    assert str(row[0]) == "1.5"
+
+
+def test_lazy_row_stream(conn):
+    cur = conn.cursor(row_factory=rows.lazy_row)
+    recs = list(cur.stream("select g, g * 2 as h from generate_series(1, 3) g"))
+    assert [r["h"] for r in recs] == [2, 4, 6]
+    assert recs == [(1, 2), (2, 4), (3, 6)]
+
+
 @pytest.mark.parametrize(
-    "factory", "tuple_row dict_row namedtuple_row class_row args_row kwargs_row".split()
+    "factory",
+    "tuple_row dict_row namedtuple_row class_row args_row kwargs_row lazy_row".split(),
 )
 def test_no_result(factory, conn):
     cur = conn.cursor(row_factory=factory_from_name(factory))
@@ -124,7 +178,7 @@ def test_no_result(factory, conn):
 
 @pytest.mark.crdb_skip("no col query")
 @pytest.mark.parametrize(
-    "factory", "tuple_row dict_row namedtuple_row args_row".split()
+    "factory", "tuple_row dict_row namedtuple_row args_row lazy_row".split()
 )
 def test_no_column(factory, conn):
     cur = conn.cursor(row_factory=factory_from_name(factory))
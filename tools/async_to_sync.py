@@ -38,6 +38,7 @@ ALL_INPUTS = """
     psycopg/psycopg/_server_cursor_async.py
     psycopg_pool/psycopg_pool/null_pool_async.py
     psycopg_pool/psycopg_pool/pool_async.py
+    psycopg_pool/psycopg_pool/routing_async.py
     psycopg_pool/psycopg_pool/sched_async.py
     tests/crdb/test_connection_async.py
     tests/crdb/test_copy_async.py
@@ -45,6 +46,7 @@ ALL_INPUTS = """
     tests/pool/test_pool_async.py
     tests/pool/test_pool_common_async.py
     tests/pool/test_pool_null_async.py
+    tests/pool/test_routing_async.py
     tests/pool/test_sched_async.py
     tests/test_connection_async.py
     tests/test_conninfo_attempts_async.py
@@ -304,6 +306,7 @@ class RenameAsyncToSync(ast.NodeTransformer):  # type: ignore
         "AsyncQueuedLibpqWriter": "QueuedLibpqWriter",
         "AsyncRawCursor": "RawCursor",
         "AsyncRawServerCursor": "RawServerCursor",
+        "AsyncRoutingConnectionPool": "RoutingConnectionPool",
         "AsyncRowFactory": "RowFactory",
         "AsyncScheduler": "Scheduler",
         "AsyncServerCursor": "ServerCursor",